@@ -7,10 +7,15 @@ Controls:
 2️⃣ Build Vector DB
 3️⃣ Semantic Search
 4️⃣ Full RAG Answer Mode
+
+Run with --profile to write a per-stage timing report (data/profiles)
+for ingest / build runs; --profile-dump cprofile|pyinstrument adds a
+profiler dump next to it.
 """
 
 import os
 import json
+import argparse
 
 # ----------------------------
 # IMPORT PIPELINE MODULES
@@ -18,12 +23,13 @@ import json
 from ingestion.pipeline import process_pdf, process_websites
 from ingestion.web_processor import STARTUP_FUNDING_URLS
 from ingestion.advanced_web_ingestion import interactive_web_ingestion, save_web_ingestion_report
+from ingestion.profiler import DUMP_ENGINES, profile_run, profile_stage
 
 # ----------------------------
 # VECTOR DB
 # ----------------------------
 from vector_store.build_store import build_vector_database
-from vector_store.retriever import Retriever
+from rag.resources import get_retriever
 
 # ----------------------------
 # RAG ENGINE
@@ -75,6 +81,7 @@ def save_chunks(filename, chunks, metadata):
         json.dump(result, f, ensure_ascii=False, indent=2)
 
     print(f"✔ Saved Chunks → {path}")
+    return path
 
 
 def save_web_content(url_hash, title, content):
@@ -105,6 +112,7 @@ def save_web_chunks(url_hash, title, chunks, metadata):
         json.dump(result, f, ensure_ascii=False, indent=2)
     
     print(f"✔ Saved Web Chunks → {path}")
+    return path
 
 
 # ----------------------------
@@ -128,8 +136,9 @@ def ingest_pdfs():
         path = os.path.join(RAW_DIR, file)
         result = process_pdf(path)
 
-        save_processed(file, result["raw_text"])
-        save_chunks(file, result["chunks"], result["metadata"])
+        with profile_stage("save", path, [result["raw_text"], result["chunks"]]):
+            save_processed(file, result["raw_text"])
+            save_chunks(file, result["chunks"], result["metadata"])
 
         print("\nCompleted")
         print(f"Language : {result['language']}")
@@ -166,11 +175,12 @@ def ingest_websites(custom_urls=None):
         print(f"Processing: {result['title']}")
         print("-"*50)
         
-        # Save web content
-        save_web_content(result['url_hash'], result['title'], result['raw_text'])
-        
-        # Save chunks
-        save_web_chunks(result['url_hash'], result['title'], result['chunks'], result['metadata'])
+        with profile_stage("save", result['url'], [result['raw_text'], result['chunks']]):
+            # Save web content
+            save_web_content(result['url_hash'], result['title'], result['raw_text'])
+            
+            # Save chunks
+            save_web_chunks(result['url_hash'], result['title'], result['chunks'], result['metadata'])
         
         print(f"Language : {result['language']}")
         print(f"Chunks   : {len(result['chunks'])}")
@@ -197,7 +207,7 @@ def ingest_websites(custom_urls=None):
 # ----------------------------
 def interactive_search():
     try:
-        retriever = Retriever()
+        retriever = get_retriever()
         
         print("\n" + "="*50)
         print("🔍 Semantic Search Mode")
@@ -267,20 +277,28 @@ def rag_chat_mode():
                 continue
 
             try:
-                result = engine.ask(query, debug=False)
-
                 print("\n" + "="*60)
                 print("📝 ANSWER")
                 print("="*60)
-                print(result["answer"])
-                print("="*60)
 
-                if result.get("references"):
+                references = []
+                status = "unknown"
+                for event in engine.ask_stream(query, debug=False):
+                    if event["type"] == "meta":
+                        references = event["references"]
+                    elif event["type"] == "token":
+                        print(event["content"], end="", flush=True)
+                    elif event["type"] == "done":
+                        status = event["status"]
+
+                print("\n" + "="*60)
+
+                if references:
                     print("\n📚 Sources Used:")
-                    for i, ref in enumerate(result["references"], 1):
+                    for i, ref in enumerate(references, 1):
                         print(f"  {i}. {ref.get('source_file', 'unknown')} ({ref.get('language', 'unknown')})")
 
-                print(f"\nStatus: {result.get('status', 'unknown')}\n")
+                print(f"\nStatus: {status}\n")
 
             except Exception as e:
                 print(f"\n❌ Error processing question: {e}")
@@ -493,7 +511,20 @@ def pitch_generator_mode():
 # ----------------------------
 # MAIN MENU
 # ----------------------------
+def run_profiled(func, args):
+    """Run an ingest / build command, profiled when --profile is given"""
+    if not (args.profile or args.profile_dump):
+        return func()
+    with profile_run(func.__name__, dump=args.profile_dump):
+        return func()
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Startup Funding Intelligence System")
+    parser.add_argument("--profile", action="store_true", help="write a per-stage timing report for options 1-3")
+    parser.add_argument("--profile-dump", choices=DUMP_ENGINES, help="also dump a cProfile / pyinstrument profile")
+    args = parser.parse_args()
+
     print("\nStartup Funding Intelligence System")
     print("======================================")
     print("1. Ingest PDFs (Extract + Clean + Chunk)")
@@ -511,13 +542,13 @@ if __name__ == "__main__":
         choice = input("\nEnter your choice: ")
 
         if choice == "1":
-            ingest_pdfs()
+            run_profiled(ingest_pdfs, args)
 
         elif choice == "2":
-            ingest_websites()
+            run_profiled(ingest_websites, args)
 
         elif choice == "3":
-            build_vector_database()
+            run_profiled(build_vector_database, args)
 
         elif choice == "4":
             interactive_search()
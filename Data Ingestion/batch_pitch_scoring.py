@@ -0,0 +1,376 @@
+"""
+batch_pitch_scoring.py
+Batch pitch deck scoring for accelerator intakes ⚡
+
+Runs load_pdf + PitchDeckAnalyzer (analyze_user_pitch_deck) over a whole
+cohort of decks on a pool of worker processes.
+
+✔ Input: a directory (searched recursively for *.pdf) or a manifest
+  (.txt one path per line, .csv with a "path" column, .json list of paths)
+✔ Long-lived workers: PDF/OCR libraries are imported once per worker
+✔ Per-deck timeout: a deck that hangs is killed with its worker, recorded
+  as "timeout", and a fresh worker takes its place
+✔ Results stream to JSON Lines or CSV as each deck finishes
+✔ Resumable: decks are keyed by SHA-256 of their content; anything already
+  scored OK in the output file is skipped (renamed / duplicate files too)
+
+Run:
+    python batch_pitch_scoring.py decks/ -o scores.jsonl
+    python batch_pitch_scoring.py cohort.csv -o scores.csv --workers 8 --timeout 90
+    python batch_pitch_scoring.py decks/ -o scores.jsonl --rescore
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from datetime import datetime, timezone
+from multiprocessing.connection import wait
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BASE_DIR)
+
+DEFAULT_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+DEFAULT_TIMEOUT = 120.0  # seconds per deck
+
+CSV_FIELDS = [
+    'path', 'sha256', 'status', 'score', 'grade', 'sections_found', 'total_sections',
+    'pages', 'words', 'recommendations', 'error', 'seconds', 'scored_at'
+]
+
+
+# -----------------------------------------
+# Inputs
+# -----------------------------------------
+def collect_decks(source: str) -> List[str]:
+    """PDF paths from a directory or a manifest file"""
+    if os.path.isdir(source):
+        decks = []
+        for root, _, files in os.walk(source):
+            decks.extend(os.path.join(root, name) for name in files if name.lower().endswith('.pdf'))
+        return sorted(decks)
+
+    # Manifest entries are relative to the manifest's folder
+    base = os.path.dirname(os.path.abspath(source))
+    with open(source, 'r', encoding='utf-8') as f:
+        if source.lower().endswith('.json'):
+            entries = json.load(f)
+        elif source.lower().endswith('.csv'):
+            entries = [row.get('path', '') for row in csv.DictReader(f)]
+        else:
+            entries = [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+    return [entry if os.path.isabs(entry) else os.path.join(base, entry) for entry in entries if entry]
+
+
+def content_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _jsonl_rows(f) -> Iterator[Dict]:
+    """Rows of a JSON Lines file, skipping lines cut short by an interrupted run"""
+    for line in f:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            continue
+
+
+def load_scored(output: str) -> Set[str]:
+    """Content hashes already scored successfully in an existing output file"""
+    if not os.path.exists(output):
+        return set()
+
+    scored = set()
+    with open(output, 'r', encoding='utf-8', newline='') as f:
+        if output.lower().endswith('.csv'):
+            rows = csv.DictReader(f)
+        else:
+            rows = _jsonl_rows(f)
+        for row in rows:
+            if row.get('status') == 'ok' and row.get('sha256'):
+                scored.add(row['sha256'])
+    return scored
+
+
+# -----------------------------------------
+# Records
+# -----------------------------------------
+def _record(path: str, sha256: str, status: str, result: Dict = None, seconds: float = 0.0, error: str = '') -> Dict:
+    record = {
+        'path': path,
+        'sha256': sha256,
+        'status': status,
+        'score': None,
+        'grade': None,
+        'sections_found': None,
+        'total_sections': None,
+        'pages': None,
+        'words': None,
+        'recommendations': [],
+        'metrics': {},
+        'section_breakdown': {},
+        'error': error,
+        'seconds': round(seconds, 3),
+        'scored_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    }
+    if result and result.get('success'):
+        details = result.get('details', {})
+        record.update({
+            'score': result['score'],
+            'grade': result['grade'],
+            'sections_found': result['sections_found'],
+            'total_sections': result['total_sections'],
+            'pages': details.get('pages'),
+            'words': details.get('words'),
+            'recommendations': result.get('recommendations', []),
+            'metrics': result.get('metrics', {}),
+            'section_breakdown': details.get('section_breakdown', {}),
+        })
+        # Corrupt / image-only PDFs "succeed" with nothing extracted; keep them retryable
+        if not details.get('pages') or not details.get('words'):
+            record['status'] = 'error'
+            record['error'] = 'No text extracted from PDF'
+    elif result:
+        record['status'] = 'error'
+        record['error'] = result.get('error', 'Analysis failed')
+    return record
+
+
+class _JsonlWriter:
+    def __init__(self, path: str):
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def write(self, record: Dict):
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class _CsvWriter:
+    def __init__(self, path: str):
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, 'a', encoding='utf-8', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=CSV_FIELDS, extrasaction='ignore')
+        if new_file:
+            self._writer.writeheader()
+
+    def write(self, record: Dict):
+        self._writer.writerow(dict(record, recommendations=' | '.join(record['recommendations'])))
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def open_writer(output: str):
+    return _CsvWriter(output) if output.lower().endswith('.csv') else _JsonlWriter(output)
+
+
+# -----------------------------------------
+# Worker pool
+# -----------------------------------------
+def _worker_main(conn):
+    """Worker process: import the analyzer once, then score paths until told to stop"""
+    from pitch_deck_analyzer import analyze_user_pitch_deck
+
+    conn.send('ready')
+    while True:
+        try:
+            path = conn.recv()
+        except EOFError:
+            break
+        if path is None:
+            break
+
+        started = time.perf_counter()
+        try:
+            result = analyze_user_pitch_deck(path)
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        conn.send((result, time.perf_counter() - started))
+
+
+class _Worker:
+    """One worker process and the deck it is scoring (if any)"""
+
+    def __init__(self, ctx):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+        self.task = None      # (path, sha256)
+        self.started = 0.0
+
+    def assign(self, task: Tuple[str, str]):
+        self.task = task
+        self.started = time.monotonic()
+        self.conn.send(task[0])
+
+    def stop(self, kill: bool = False):
+        if not kill:
+            try:
+                self.conn.send(None)
+            except (OSError, ValueError):
+                kill = True
+        if kill and self.process.is_alive():
+            self.process.terminate()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+def score_decks(
+    tasks: Iterable[Tuple[str, str]],
+    workers: int = DEFAULT_WORKERS,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Iterator[Dict]:
+    """
+    Score (path, sha256) tasks on `workers` processes, yielding one record
+    per deck in completion order. A deck running longer than `timeout`
+    seconds (or crashing its worker) is recorded as failed and its worker
+    replaced; the timeout starts when the deck is handed to a warm worker.
+    """
+    pending = deque(tasks)
+    if not pending:
+        return
+
+    ctx = multiprocessing.get_context()
+    pool = [_Worker(ctx) for _ in range(max(1, min(workers, len(pending))))]
+
+    try:
+        while pending or any(w.task for w in pool):
+            for worker in pool:
+                if worker.ready and worker.task is None and pending:
+                    worker.assign(pending.popleft())
+
+            busy = [w.started + timeout for w in pool if w.task]
+            wait_for = max(0.0, min(busy) - time.monotonic()) if busy else None
+            ready = wait([w.conn for w in pool], timeout=wait_for)
+
+            for i, worker in enumerate(pool):
+                if worker.conn not in ready:
+                    continue
+                try:
+                    message = worker.conn.recv()
+                except (EOFError, OSError):
+                    # Worker died (e.g. a PDF library crashed the process)
+                    if not worker.ready:
+                        raise RuntimeError("Pitch deck worker failed to start (check the analyzer imports)")
+                    code = worker.process.exitcode
+                    if worker.task:
+                        path, sha256 = worker.task
+                        yield _record(path, sha256, 'error', seconds=time.monotonic() - worker.started,
+                                      error=f'Worker process exited (code {code})')
+                    worker.stop(kill=True)
+                    pool[i] = _Worker(ctx)
+                    continue
+
+                if message == 'ready':
+                    worker.ready = True
+                    continue
+
+                result, seconds = message
+                path, sha256 = worker.task
+                worker.task = None
+                yield _record(path, sha256, 'ok', result, seconds)
+
+            now = time.monotonic()
+            for i, worker in enumerate(pool):
+                if worker.task and now - worker.started >= timeout:
+                    path, sha256 = worker.task
+                    yield _record(path, sha256, 'timeout', seconds=now - worker.started,
+                                  error=f'Timed out after {timeout:.0f}s')
+                    worker.stop(kill=True)
+                    pool[i] = _Worker(ctx)
+    finally:
+        for worker in pool:
+            worker.stop(kill=worker.task is not None)
+
+
+# -----------------------------------------
+# Batch run
+# -----------------------------------------
+def run_batch(
+    source: str,
+    output: str,
+    workers: int = DEFAULT_WORKERS,
+    timeout: float = DEFAULT_TIMEOUT,
+    rescore: bool = False,
+) -> Dict:
+    """Score every deck in source into output (appending); returns a summary"""
+    started = time.perf_counter()
+    decks = collect_decks(source)
+    done = set() if rescore else load_scored(output)
+
+    tasks, skipped, missing = [], 0, 0
+    for path in decks:
+        try:
+            sha256 = content_hash(path)
+        except OSError as e:
+            print(f"⚠️ Cannot read {path}: {e}")
+            missing += 1
+            continue
+        if sha256 in done:
+            skipped += 1
+            continue
+        done.add(sha256)  # identical files in the same run are scored once
+        tasks.append((path, sha256))
+
+    print(f"📂 {len(decks)} decks: {len(tasks)} to score, {skipped} already scored, {missing} unreadable")
+
+    counts = {'ok': 0, 'error': 0, 'timeout': 0}
+    writer = open_writer(output)
+    try:
+        for n, record in enumerate(score_decks(tasks, workers, timeout), 1):
+            writer.write(record)
+            counts[record['status']] += 1
+            name = os.path.basename(record['path'])
+            if record['status'] == 'ok':
+                print(f"✅ [{n}/{len(tasks)}] {name}: {record['score']}/100 ({record['grade']}) in {record['seconds']:.1f}s")
+            else:
+                print(f"❌ [{n}/{len(tasks)}] {name}: {record['status']} - {record['error']}")
+    finally:
+        writer.close()
+
+    return {
+        'decks': len(decks),
+        'scored': counts['ok'],
+        'failed': counts['error'],
+        'timed_out': counts['timeout'],
+        'skipped': skipped,
+        'unreadable': missing,
+        'seconds': round(time.perf_counter() - started, 2),
+        'output': output,
+    }
+
+
+# -----------------------------------------
+# Entry Point
+# -----------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score a cohort of pitch decks in parallel")
+    parser.add_argument("source", help="directory of PDFs, or a .txt/.csv/.json manifest of paths")
+    parser.add_argument("-o", "--output", default="pitch_scores.jsonl", help="results file (.jsonl or .csv)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"worker processes (default {DEFAULT_WORKERS})")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help=f"seconds per deck (default {DEFAULT_TIMEOUT:.0f})")
+    parser.add_argument("--rescore", action="store_true", help="score every deck again, ignoring previous results")
+    args = parser.parse_args()
+
+    summary = run_batch(args.source, args.output, args.workers, args.timeout, args.rescore)
+    print(f"\n🏁 {summary['scored']} scored, {summary['failed']} failed, {summary['timed_out']} timed out, "
+          f"{summary['skipped']} skipped in {summary['seconds']}s -> {summary['output']}")
@@ -0,0 +1,161 @@
+"""
+Throughput benchmark for the structured extraction engine
+
+Generates a synthetic funding/pitch-deck corpus (seeded, so runs are
+comparable) and times three ways of pulling amounts, percentages, user
+counts, eligibility/application clauses and sentences out of it:
+- per_site: the separate regex passes the web enhancer, pitch deck
+  analyzer and funding RAG engine used to run (baseline)
+- engine: ingestion.extraction over the whole text
+- stream: the same engine fed page by page
+
+Reports best-of-N seconds and MB/s per mode, then times per_site and
+engine on pathological inputs without sentence ends (label words
+repeated, run-on web text), where a clause scan per label would go
+quadratic.
+
+Usage (from Data Ingestion):
+    python benchmarks/bench_extraction.py
+    python benchmarks/bench_extraction.py --mb 5 --repeat 5 --json bench_extraction.json
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestion.extraction import get_extractor  # noqa: E402
+
+FILLER = (
+    "the a of to and in for with on our we is are this that by as from at be have it its "
+    "market team product customers across india platform growth digital model revenue "
+    "partners cities founders scheme startup support government innovation"
+).split()
+
+FACTS = [
+    "₹20 lakh", "Rs. 2.5 crore", "$1.5 million", "40%", "12,000 users", "5 lakh rupees",
+    "Eligibility: startups under 7 years old.", "apply via the portal.",
+    "the application process takes 6 weeks.", "requirements include DPIIT recognition.",
+]
+
+# Patterns the three call sites ran before sharing the engine
+PER_SITE_PATTERNS = [
+    (r'₹\s*(\d+(?:,\d+)*(?:\.\d+)?)\s*(lakh|crore|thousand)?', re.IGNORECASE),
+    (r'(\d+(?:,\d+)*(?:\.\d+)?)\s*(lakh|crore|thousand)?\s*rupees?', re.IGNORECASE),
+    (r'\$\s*(\d+(?:,\d+)*(?:\.\d+)?)\s*(million|billion|thousand)?', re.IGNORECASE),
+    (r'eligibility[:\s]*([^.!?]*[.!?])', re.IGNORECASE),
+    (r'criteria[:\s]*([^.!?]*[.!?])', re.IGNORECASE),
+    (r'requirements[:\s]*([^.!?]*[.!?])', re.IGNORECASE),
+    (r'application[:\s]*([^.!?]*[.!?])', re.IGNORECASE),
+    (r'apply[:\s]*([^.!?]*[.!?])', re.IGNORECASE),
+    (r'process[:\s]*([^.!?]*[.!?])', re.IGNORECASE),
+    (r'(\$\d+(?:,\d+)*(?:\.\d+)?)\s*(million|billion|k)?', re.IGNORECASE),
+    (r'(\d+(?:,\d+)*(?:\.\d+)?)\s*(million|billion)?\s*dollars?', re.IGNORECASE),
+    (r'(\d+(?:\.\d+)?%)', 0),
+    (r'(\d+(?:,\d+)*)\s*(?:users?|customers?|clients?)', re.IGNORECASE),
+    (r'(\d+(?:,\d+)*)\s*(?:million|thousand|k)\s*(?:users?|customers?)', re.IGNORECASE),
+]
+
+
+# Clause labels with no sentence end anywhere after them
+PATHOLOGICAL = {
+    "labels_no_periods": "process " * 8000,
+    "web_no_periods": " ".join(
+        ["apply now for the scheme, see criteria and requirements listed below | click here"] * 700
+    ),
+}
+
+
+def make_pages(megabytes: float, page_chars: int = 3000, seed: int = 42):
+    rng = random.Random(seed)
+    pages, page, page_size, size = [], [], 0, 0
+    i = 0
+    while size < megabytes * 1e6:
+        word = rng.choice(FILLER)
+        if i % 40 == 0:
+            word = f"{word} {rng.choice(FACTS)}"
+        if i % 15 == 14:
+            word += "."
+        page.append(word)
+        page_size += len(word) + 1
+        size += len(word) + 1
+        i += 1
+        # Pages break mid-sentence, like PDF text does
+        if page_size >= page_chars:
+            pages.append(" ".join(page))
+            page, page_size = [], 0
+    if page:
+        pages.append(" ".join(page))
+    return pages
+
+
+def per_site(text: str):
+    compiled = [re.compile(pattern, flags) for pattern, flags in PER_SITE_PATTERNS]
+    results = [pattern.findall(text) for pattern in compiled]
+    results.append(text.split('.'))
+    return results
+
+
+def best_of(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark structured extraction throughput")
+    parser.add_argument("--mb", type=float, default=2.0, help="corpus size in MB (default 2)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per mode, best is reported (default 3)")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    pages = make_pages(args.mb)
+    text = "\n".join(pages)
+    megabytes = len(text.encode("utf-8")) / 1e6
+    extractor = get_extractor()
+
+    modes = {
+        "per_site": lambda: per_site(text),
+        "engine": lambda: extractor.extract(text),
+        "stream": lambda: extractor.extract_pages(pages),
+    }
+
+    spans = len(extractor.extract(text).spans)
+    print(f"{megabytes:.2f} MB, {len(pages)} pages, {spans} spans, best of {args.repeat}\n")
+    print(f"{'mode':<12}{'seconds':>10}{'MB/s':>10}")
+
+    results = {}
+    for name, func in modes.items():
+        seconds = best_of(func, args.repeat)
+        results[name] = {"seconds": round(seconds, 4), "mb_per_s": round(megabytes / seconds, 2)}
+        print(f"{name:<12}{seconds:>10.3f}{megabytes / seconds:>10.2f}")
+
+    print(f"\n{'pathological':<20}{'KB':>6}{'per_site s':>12}{'engine s':>10}")
+    pathological = {}
+    for name, sample in PATHOLOGICAL.items():
+        timings = {
+            "per_site": best_of(lambda: per_site(sample), args.repeat),
+            "engine": best_of(lambda: extractor.extract(sample), args.repeat),
+        }
+        pathological[name] = {mode: round(seconds, 4) for mode, seconds in timings.items()}
+        print(f"{name:<20}{len(sample) / 1000:>6.0f}{timings['per_site']:>12.3f}{timings['engine']:>10.3f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "megabytes": round(megabytes, 2), "pages": len(pages),
+                "results": results, "pathological": pathological,
+            }, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+Offline benchmark suite for ingestion, indexing and retrieval
+
+Generates a seeded synthetic corpus (benchmarks/corpus.py: English +
+Hindi/Tamil/Bengali policy text, synthetic PDFs, HTML pages) and times:
+- clean:       ingestion.cleaner.normalize_text per document
+- chunk:       ingestion.chunker.hybrid_chunker per document
+- embed:       EmbeddingEngine.get_embedding per chunk (cache cleared)
+- pdf_load:    ingestion.pdf_loader.load_pdf per synthetic PDF
+- scrape:      WebScraper against a local stub site (no network)
+- index_build: build_store.index_document into a fresh Chroma collection
+- query:       Retriever.search, one question at a time (p50/p95/p99)
+- query_batch: Retriever.search_batch in batches of --batch-size
+- rag_ask:     RAGEngine.ask end to end against a stub Groq server
+
+Each case reports best-of-N seconds, items/s and MB/s, latency
+percentiles where they apply, the tracemalloc peak of one extra run and
+the process RSS high-water mark. Chroma runs in a temporary directory.
+Results go to JSON; compare two runs with benchmarks/compare.py.
+
+Usage (from Data Ingestion):
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --docs 200 --words 3000 --json head.json
+    python benchmarks/bench_pipeline.py --cases chunk,embed,query --repeat 5
+    python benchmarks/compare.py base.json head.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import html_page, make_documents, make_questions, write_pdfs  # noqa: E402
+from stub_servers import StubLLMServer, StubSiteServer  # noqa: E402
+
+CASES = ["clean", "chunk", "embed", "pdf_load", "scrape", "index_build", "query", "query_batch", "rag_ask"]
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+            capture_output=True, text=True, timeout=10,
+        ).stdout.strip() or "unknown"
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+
+def rss_high_water_mb() -> float:
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def text_bytes(texts) -> int:
+    return sum(len(text.encode("utf-8")) for text in texts)
+
+
+# -----------------------------------------
+# Cases
+# -----------------------------------------
+class Suite:
+    """Corpus, stub servers and the Chroma sandbox shared by the cases"""
+
+    def __init__(self, args, workdir: str):
+        from ingestion.chunker import hybrid_chunker
+        from ingestion.cleaner import normalize_text
+
+        self.args = args
+        self.workdir = workdir
+        self.documents = make_documents(args.docs, args.words, indic_share=args.indic_share, seed=args.seed)
+        self.questions = make_questions(args.questions, seed=args.seed)
+        self.cleaned = [normalize_text(d["text"])["clean_text"] for d in self.documents]
+        self.chunks = [hybrid_chunker(text) for text in self.cleaned]
+        english = [d for d in self.documents if d["language"] == "en"][:args.pdfs]
+        self.pdfs = write_pdfs(english, os.path.join(workdir, "pdfs"))
+        self.store = None
+        self.retriever = None
+        self._builds = 0
+
+    def clean(self):
+        from ingestion.cleaner import normalize_text
+        for document in self.documents:
+            normalize_text(document["text"])
+        return {"items": len(self.documents), "bytes": text_bytes(d["text"] for d in self.documents)}
+
+    def chunk(self):
+        from ingestion.chunker import hybrid_chunker
+        chunks = sum(len(hybrid_chunker(text)) for text in self.cleaned)
+        return {"items": chunks, "bytes": text_bytes(self.cleaned)}
+
+    def embed(self):
+        from vector_store.embedder import EmbeddingEngine
+        EmbeddingEngine.get_embedding.cache_clear()
+        embedder = EmbeddingEngine()
+        chunks = [chunk for chunks in self.chunks for chunk in chunks]
+        for chunk in chunks:
+            embedder.get_embedding(chunk)
+        return {"items": len(chunks), "bytes": text_bytes(chunks)}
+
+    def pdf_load(self):
+        from ingestion.pdf_loader import load_pdf
+        pages = sum(len(load_pdf(path, enable_ocr=False)["pages"]) for path in self.pdfs)
+        return {"items": pages, "bytes": sum(os.path.getsize(path) for path in self.pdfs)}
+
+    def scrape(self):
+        from ingestion.web_scraper import WebScraper
+        pages = [html_page(d) for d in self.documents[:self.args.pages]]
+        with StubSiteServer(pages) as site:
+            results = WebScraper(delay=0).scrape_multiple(site.urls())
+        ok = [r for r in results if r["status"] == "success"]
+        return {"items": len(ok), "bytes": text_bytes(pages)}
+
+    def index_build(self):
+        from vector_store.build_store import index_document
+        from vector_store.embedder import EmbeddingEngine
+        from vector_store.retriever import Retriever
+        from vector_store.store import VectorStore
+
+        EmbeddingEngine.get_embedding.cache_clear()
+        embedder = EmbeddingEngine()
+        self._builds += 1
+        store = VectorStore(collection_name=f"bench_index_{self._builds}")
+        total = 0
+        for document, chunks in zip(self.documents, self.chunks):
+            metadata = {"language": document["language"], "document_type": "startup_policy"}
+            total += index_document(document["name"], chunks, metadata, embedder, store)
+
+        # Queries run against the most recent build
+        self.store, self.retriever = store, Retriever(embedder=embedder, store=store)
+        return {"items": total, "bytes": text_bytes(c for chunks in self.chunks for c in chunks)}
+
+    def _require_index(self):
+        if self.retriever is None:
+            self.index_build()
+
+    def query(self):
+        from vector_store.embedder import EmbeddingEngine
+        self._require_index()
+        EmbeddingEngine.get_embedding.cache_clear()
+        latencies = []
+        for question in self.questions:
+            start = time.perf_counter()
+            self.retriever.search(question, top_k=self.args.top_k)
+            latencies.append(time.perf_counter() - start)
+        return {"items": len(self.questions), "latencies": latencies}
+
+    def query_batch(self):
+        from vector_store.embedder import EmbeddingEngine
+        self._require_index()
+        EmbeddingEngine.get_embedding.cache_clear()
+        size = self.args.batch_size
+        latencies = []
+        for i in range(0, len(self.questions), size):
+            batch = self.questions[i:i + size]
+            start = time.perf_counter()
+            self.retriever.search_batch(batch, top_k=self.args.top_k)
+            # Per-question share of the batch round trip
+            latencies.extend([(time.perf_counter() - start) / len(batch)] * len(batch))
+        return {"items": len(self.questions), "latencies": latencies}
+
+    def rag_ask(self):
+        from rag.llm_client import LLMClient
+        from rag.rag_engine import RAGEngine
+        from vector_store.embedder import EmbeddingEngine
+
+        self._require_index()
+        EmbeddingEngine.get_embedding.cache_clear()
+        questions = self.questions[:self.args.asks]
+        with StubLLMServer(latency=self.args.llm_latency) as server:
+            os.environ.setdefault("GROQ_API_KEY", "stub")
+            llm = LLMClient()
+            llm.base_url = server.completions_url
+            engine = RAGEngine(llm=llm, retriever=self.retriever)
+            engine.cache = None  # every question goes to the (stub) LLM
+            latencies = []
+            for question in questions:
+                start = time.perf_counter()
+                engine.ask(question, top_k=self.args.top_k)
+                latencies.append(time.perf_counter() - start)
+        return {"items": len(questions), "latencies": latencies}
+
+
+def run_case(suite: Suite, name: str, repeat: int, memory: bool) -> dict:
+    func = getattr(suite, name)
+    best, latencies, outcome = float("inf"), [], {}
+    for _ in range(repeat):
+        # Engine modules print progress per call; keep it out of the timings' way
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            outcome = func()
+            seconds = time.perf_counter() - start
+        best = min(best, seconds)
+        latencies.extend(outcome.get("latencies", []))
+
+    result = {
+        "seconds": round(best, 4),
+        "items": outcome["items"],
+        "items_per_s": round(outcome["items"] / best, 2) if best else 0.0,
+    }
+    if outcome.get("bytes"):
+        result["mb_per_s"] = round(outcome["bytes"] / 1e6 / best, 3)
+    if latencies:
+        for q in (0.5, 0.95, 0.99):
+            result[f"p{int(q * 100)}_ms"] = round(1000 * percentile(latencies, q), 3)
+
+    if memory:
+        # Separate run: tracemalloc slows allocation-heavy code down a lot
+        tracemalloc.start()
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+        result["peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 1e6, 2)
+        tracemalloc.stop()
+    result["rss_high_water_mb"] = rss_high_water_mb()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline ingestion / indexing / retrieval benchmarks")
+    parser.add_argument("--docs", type=int, default=40, help="synthetic documents (default 40)")
+    parser.add_argument("--words", type=int, default=1500, help="words per document (default 1500)")
+    parser.add_argument("--indic-share", type=float, default=0.3, help="share of Indic-script documents (default 0.3)")
+    parser.add_argument("--pdfs", type=int, default=10, help="synthetic PDFs for pdf_load (default 10)")
+    parser.add_argument("--pages", type=int, default=20, help="stub web pages for scrape (default 20)")
+    parser.add_argument("--questions", type=int, default=200, help="retrieval questions (default 200)")
+    parser.add_argument("--asks", type=int, default=50, help="questions sent through RAGEngine.ask (default 50)")
+    parser.add_argument("--batch-size", type=int, default=16, help="questions per search_batch call (default 16)")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="stub Groq latency in seconds (default 0)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, best is reported (default 3)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--cases", default=",".join(CASES), help=f"comma-separated subset of {','.join(CASES)}")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak run")
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args()
+
+    cases = [case.strip() for case in args.cases.split(",") if case.strip()]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    # pdf_loader logs every page at INFO
+    logging.disable(logging.INFO)
+
+    cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix="bench_pipeline_")
+    try:
+        # VectorStore keeps Chroma under ./data/vector_db
+        os.chdir(workdir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            suite = Suite(args, workdir)
+
+        print(f"{args.docs} docs x {args.words} words ({args.indic_share:.0%} Indic), {len(suite.pdfs)} PDFs, "
+              f"{args.questions} questions, best of {args.repeat}\n")
+        print(f"{'case':<13}{'seconds':>10}{'items/s':>12}{'MB/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'peak MB':>9}{'RSS MB':>9}")
+
+        results = {}
+        for case in cases:
+            r = results[case] = run_case(suite, case, args.repeat, memory=not args.no_memory)
+            print(f"{case:<13}{r['seconds']:>10.3f}{r['items_per_s']:>12.1f}{r.get('mb_per_s', 0):>9.2f}"
+                  f"{r.get('p50_ms', 0):>9.2f}{r.get('p95_ms', 0):>9.2f}{r.get('peak_mb', 0):>9.1f}"
+                  f"{r['rss_high_water_mb']:>9.1f}")
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.json:
+        report = {
+            "suite": "bench_pipeline",
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": {k: v for k, v in vars(args).items() if k != "json"},
+            "results": results,
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
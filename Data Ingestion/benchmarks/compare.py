@@ -0,0 +1,97 @@
+"""
+Compare two benchmark result files (bench_pipeline.py / bench_extraction.py --json)
+
+For every case present in both runs, prints each metric's change and
+marks it when it moved more than --threshold percent:
+- lower is better: seconds, *_ms, *_mb
+- higher is better: *_per_s
+Item counts must match, otherwise the corpora differ and the case is
+reported as not comparable.
+
+Usage (from Data Ingestion):
+    python benchmarks/compare.py base.json head.json
+    python benchmarks/compare.py base.json head.json --threshold 5 --fail-on-regression
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional, Tuple
+
+
+def direction(metric: str) -> Optional[int]:
+    """+1 when higher is better, -1 when lower is better, None to skip"""
+    if metric.endswith("_per_s"):
+        return 1
+    if metric == "seconds" or metric.endswith(("_ms", "_mb")):
+        return -1
+    return None
+
+
+def compare(base: Dict, head: Dict, threshold: float) -> Tuple[List[tuple], List[str], List[str]]:
+    """Returns (rows, regressions, not_comparable); a row is
+    (case, metric, base, head, change %, verdict)"""
+    rows, regressions, not_comparable = [], [], []
+    base_results, head_results = base.get("results", {}), head.get("results", {})
+
+    for case in base_results:
+        if case not in head_results:
+            continue
+        old, new = base_results[case], head_results[case]
+        if "items" in old and old.get("items") != new.get("items"):
+            not_comparable.append(f"{case} (items {old.get('items')} -> {new.get('items')})")
+            continue
+
+        for metric, old_value in old.items():
+            sign = direction(metric)
+            new_value = new.get(metric)
+            if sign is None or not isinstance(old_value, (int, float)) or not isinstance(new_value, (int, float)):
+                continue
+            change = 100.0 * (new_value - old_value) / old_value if old_value else 0.0
+            verdict = ""
+            if abs(change) >= threshold:
+                better = change * sign > 0
+                verdict = "faster" if better else "REGRESSION"
+                if metric.endswith("_mb"):
+                    verdict = "less memory" if better else "REGRESSION"
+                if not better:
+                    regressions.append(f"{case}.{metric} {change:+.1f}%")
+            rows.append((case, metric, old_value, new_value, change, verdict))
+    return rows, regressions, not_comparable
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark JSON result files")
+    parser.add_argument("base", help="results from the baseline commit")
+    parser.add_argument("head", help="results from the commit under test")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent change to flag (default 10)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit 1 when any metric regressed")
+    args = parser.parse_args()
+
+    with open(args.base, "r", encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.head, "r", encoding="utf-8") as f:
+        head = json.load(f)
+
+    print(f"base: {base.get('commit', args.base)}  head: {head.get('commit', args.head)}  "
+          f"(flag at ±{args.threshold:g}%)\n")
+    if base.get("config") != head.get("config"):
+        print("⚠️ Runs used different settings - compare with care\n")
+
+    rows, regressions, not_comparable = compare(base, head, args.threshold)
+    print(f"{'case':<13}{'metric':<20}{'base':>12}{'head':>12}{'change':>10}  ")
+    for case, metric, old, new, change, verdict in rows:
+        print(f"{case:<13}{metric:<20}{old:>12.4g}{new:>12.4g}{change:>+9.1f}%  {verdict}")
+
+    if not_comparable:
+        print("\nNot comparable (different corpus):", ", ".join(not_comparable))
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+    else:
+        print("\n✅ No regressions above the threshold")
+
+    sys.exit(1 if regressions and args.fail_on_regression else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Synthetic corpora for the ingestion / retrieval benchmarks
+
+Seeded generators, so runs on different commits see identical input:
+- policy-like funding documents in English and Indic scripts
+  (Hindi, Tamil, Bengali) with scheme names, amounts and eligibility /
+  application clauses
+- synthetic PDFs (reportlab, English: the default PDF fonts have no
+  Indic glyphs) and HTML pages for the scraper
+- questions that share the corpus vocabulary, for retrieval
+"""
+
+import os
+import random
+from typing import Dict, List, Sequence
+
+LANGUAGES = ("en", "hi", "ta", "bn")
+
+SCHEMES = [
+    "Startup India Seed Fund Scheme", "Fund of Funds for Startups", "SIDBI Startup Mitra",
+    "Atal Innovation Mission", "Credit Guarantee Scheme for Startups", "MSME Innovative Scheme",
+    "Karnataka Elevate", "Kerala Startup Mission Grant", "BIRAC BIG", "NIDHI Prayas",
+]
+AGENCIES = ["DPIIT", "SIDBI", "NITI Aayog", "MeitY", "DST", "BIRAC", "the state nodal agency"]
+SECTORS = ["fintech", "agritech", "healthtech", "edtech", "cleantech", "deeptech", "SaaS", "D2C"]
+AMOUNTS = ["₹20 lakh", "₹50 lakh", "Rs. 2.5 crore", "₹10 crore", "$1.5 million", "5 lakh rupees"]
+
+EN_SENTENCES = [
+    "The {scheme} offers up to {amount} to early stage {sector} startups.",
+    "Eligibility: startups recognised by {agency} and incorporated less than {years} years ago.",
+    "Applicants must submit a pitch deck, audited financials and a {months}-month milestone plan.",
+    "The application process is online and takes around {weeks} weeks from submission to decision.",
+    "Funds are released in {tranches} tranches linked to product and revenue milestones.",
+    "Incubators evaluate proposals on innovation, market size, team strength and scalability.",
+    "Women-led and rural {sector} ventures receive priority under the {scheme}.",
+    "Support includes mentoring, lab access and investor connects through {agency}.",
+    "Grant utilisation certificates are due within {months} months of each disbursement.",
+    "Startups already funded above {amount} under any government scheme are not eligible.",
+]
+
+INDIC_WORDS = {
+    "hi": ("स्टार्टअप योजना निधि पात्रता आवेदन सरकार अनुदान लाख रुपये उद्यमी नवाचार सहायता "
+           "प्रक्रिया मान्यता वर्ष कंपनी निवेश मार्गदर्शन के लिए में है और की से को", "।"),
+    "ta": ("ஸ்டார்ட்அப் திட்டம் நிதி தகுதி விண்ணப்பம் அரசு மானியம் லட்சம் ரூபாய் "
+           "தொழில்முனைவோர் புதுமை உதவி செயல்முறை ஆண்டு நிறுவனம் முதலீடு வழிகாட்டல் மற்றும் க்கு", "."),
+    "bn": ("স্টার্টআপ প্রকল্প তহবিল যোগ্যতা আবেদন সরকার অনুদান লক্ষ টাকা উদ্যোক্তা উদ্ভাবন "
+           "সহায়তা প্রক্রিয়া বছর কোম্পানি বিনিয়োগ পরামর্শ এবং জন্য থেকে", "।"),
+}
+
+QUESTION_TEMPLATES = [
+    "What is the eligibility for the {scheme}?",
+    "How much funding does the {scheme} give {sector} startups?",
+    "How do I apply for {agency} support?",
+    "Which schemes fund {sector} startups in India?",
+    "How long does the {scheme} application process take?",
+]
+
+
+def _fill(template: str, rng: random.Random) -> str:
+    return template.format(
+        scheme=rng.choice(SCHEMES), amount=rng.choice(AMOUNTS), sector=rng.choice(SECTORS),
+        agency=rng.choice(AGENCIES), years=rng.randint(2, 10), months=rng.choice([6, 12, 18, 24]),
+        weeks=rng.randint(4, 12), tranches=rng.randint(2, 4),
+    )
+
+
+def _english_text(words: int, rng: random.Random) -> str:
+    paragraphs, paragraph, count = [], [], 0
+    while count < words:
+        sentence = _fill(rng.choice(EN_SENTENCES), rng)
+        paragraph.append(sentence)
+        count += len(sentence.split())
+        if len(paragraph) >= rng.randint(3, 6):
+            paragraphs.append(" ".join(paragraph))
+            paragraph = []
+    if paragraph:
+        paragraphs.append(" ".join(paragraph))
+    return "\n\n".join(paragraphs)
+
+
+def _indic_text(language: str, words: int, rng: random.Random) -> str:
+    vocabulary, full_stop = INDIC_WORDS[language]
+    vocabulary = vocabulary.split()
+    paragraphs, sentences, count = [], [], 0
+    while count < words:
+        length = rng.randint(8, 16)
+        body = [rng.choice(vocabulary) for _ in range(length)]
+        # Mixed-script text is the norm: scheme names / amounts stay Latin
+        if rng.random() < 0.4:
+            body.insert(rng.randrange(length), rng.choice(SCHEMES + AMOUNTS))
+        sentences.append(" ".join(body) + full_stop)
+        count += length
+        if len(sentences) >= rng.randint(3, 6):
+            paragraphs.append(" ".join(sentences))
+            sentences = []
+    if sentences:
+        paragraphs.append(" ".join(sentences))
+    return "\n\n".join(paragraphs)
+
+
+def make_documents(
+    count: int,
+    words: int = 1500,
+    languages: Sequence[str] = LANGUAGES,
+    indic_share: float = 0.3,
+    seed: int = 42,
+) -> List[Dict]:
+    """count documents of ~words words; indic_share of them in Indic scripts"""
+    rng = random.Random(seed)
+    indic = [lang for lang in languages if lang != "en"]
+    documents = []
+    for i in range(count):
+        language = rng.choice(indic) if indic and rng.random() < indic_share else "en"
+        text = _english_text(words, rng) if language == "en" else _indic_text(language, words, rng)
+        documents.append({"name": f"policy_{i:04d}_{language}", "language": language, "text": text})
+    return documents
+
+
+def make_questions(count: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    return [_fill(rng.choice(QUESTION_TEMPLATES), rng) for _ in range(count)]
+
+
+def write_pdfs(documents: List[Dict], out_dir: str) -> List[str]:
+    """One PDF per English document (A4, wrapped lines); returns the paths"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+    import textwrap
+
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for document in documents:
+        if document["language"] != "en":
+            continue
+        path = os.path.join(out_dir, document["name"] + ".pdf")
+        pdf = canvas.Canvas(path, pagesize=A4)
+        lines = [line for paragraph in document["text"].split("\n\n") for line in textwrap.wrap(paragraph, 95) + [""]]
+        for start in range(0, len(lines), 60):
+            text = pdf.beginText(40, 800)
+            text.setFont("Helvetica", 9)
+            for line in lines[start:start + 60]:
+                text.textLine(line.replace("₹", "Rs. "))
+            pdf.drawText(text)
+            pdf.showPage()
+        pdf.save()
+        paths.append(path)
+    return paths
+
+
+def html_page(document: Dict) -> str:
+    """Page shaped like a scheme portal: chrome the scraper strips + main content"""
+    paragraphs = "".join(f"<p>{p}</p>" for p in document["text"].split("\n\n"))
+    title = document["name"].replace("_", " ").title()
+    return (
+        f'<html lang="{document["language"]}"><head><meta charset="utf-8"><title>{title}</title>'
+        f'<meta name="description" content="Funding scheme details"><script>var tracking = 1;</script></head>'
+        f"<body><header><nav><a href='/'>Home</a> <a href='/schemes'>Schemes</a></nav></header>"
+        f"<main><h1>{title}</h1>{paragraphs}</main>"
+        f"<footer>Copyright Government of India</footer></body></html>"
+    )
+
+
+if __name__ == "__main__":
+    for document in make_documents(4, words=60, indic_share=0.5):
+        print(f"--- {document['name']} ---\n{document['text'][:300]}\n")
+    print(make_questions(3))
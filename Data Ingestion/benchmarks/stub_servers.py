@@ -0,0 +1,173 @@
+"""
+Local stand-ins for Groq and the scraped websites (benchmarks run offline)
+
+- StubLLMServer: OpenAI-compatible POST /openai/v1/chat/completions,
+  plain JSON or SSE streaming ("stream": true), with optional latency.
+  Point LLMClient at it with GROQ_API_URL (or client.base_url).
+- StubSiteServer: GET /page/<n> serves the nth HTML page of a corpus.
+
+Both run a ThreadingHTTPServer on an ephemeral port in a daemon thread:
+
+    with StubLLMServer(latency=0.05) as llm, StubSiteServer(pages) as site:
+        ...
+
+Standalone (e.g. to run rag_service.py against a fake Groq):
+    python benchmarks/stub_servers.py --port 8089 --latency 0.2
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+COMPLETIONS_PATH = "/openai/v1/chat/completions"
+
+
+class _StubServer:
+    handler = BaseHTTPRequestHandler
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        handler = type(self.handler.__name__, (self.handler,), {"stub": self})
+        self.latency = latency
+        self.requests = 0
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+class _QuietHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY the
+    # client's delayed ACK adds ~40ms to every keep-alive request
+    disable_nagle_algorithm = True
+    stub = None  # set per server
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+# -----------------------------------------
+# Fake Groq
+# -----------------------------------------
+def stub_answer(messages: List[dict]) -> str:
+    """Deterministic answer quoting the start of the first [Source n] block"""
+    prompt = messages[-1].get("content", "") if messages else ""
+    marker = prompt.find("[Source 1]\n")
+    if marker == -1:
+        return "Stub answer: no context documents were provided."
+    excerpt = " ".join(prompt[marker + len("[Source 1]\n"):].split()[:40])
+    return f"Stub answer based on [Source 1]: {excerpt}"
+
+
+class _LLMHandler(_QuietHandler):
+    def do_POST(self):
+        self.stub.requests += 1
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if self.path != COMPLETIONS_PATH:
+            self._send(404, b'{"error": "not found"}', "application/json")
+            return
+
+        if self.stub.latency:
+            time.sleep(self.stub.latency)
+        answer = stub_answer(payload.get("messages", []))
+
+        if not payload.get("stream"):
+            body = json.dumps({
+                "id": "stub", "object": "chat.completion", "model": payload.get("model", "stub"),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": answer}, "finish_reason": "stop"}],
+            }).encode("utf-8")
+            self._send(200, body, "application/json")
+            return
+
+        events = [
+            {"choices": [{"index": 0, "delta": {"content": word + " "}}]}
+            for word in answer.split(" ")
+        ]
+        body = "".join(f"data: {json.dumps(event)}\n\n" for event in events) + "data: [DONE]\n\n"
+        self._send(200, body.encode("utf-8"), "text/event-stream")
+
+
+class StubLLMServer(_StubServer):
+    handler = _LLMHandler
+
+    @property
+    def completions_url(self) -> str:
+        return self.url + COMPLETIONS_PATH
+
+
+# -----------------------------------------
+# Fake websites
+# -----------------------------------------
+class _SiteHandler(_QuietHandler):
+    def do_GET(self):
+        self.stub.requests += 1
+        if self.stub.latency:
+            time.sleep(self.stub.latency)
+        try:
+            index = int(self.path.rstrip("/").rsplit("/", 1)[-1])
+            page = self.stub.pages[index]
+        except (ValueError, IndexError):
+            self._send(404, b"not found", "text/plain")
+            return
+        self._send(200, page.encode("utf-8"), "text/html; charset=utf-8")
+
+
+class StubSiteServer(_StubServer):
+    handler = _SiteHandler
+
+    def __init__(self, pages: List[str], host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        self.pages = pages
+        super().__init__(host, port, latency)
+
+    def urls(self) -> List[str]:
+        return [f"{self.url}/page/{i}" for i in range(len(self.pages))]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the stub Groq server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every completion")
+    args = parser.parse_args()
+
+    server = StubLLMServer(args.host, args.port, args.latency)
+    print(f"Stub Groq listening on {server.completions_url} (Ctrl+C to stop)")
+    print(f"  e.g. GROQ_API_URL={server.completions_url} GROQ_API_KEY=stub python rag_service.py")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -9,6 +9,7 @@ from pitch_deck_integration import PitchDeckAPI
 from pdf_pitch_generator import generate_pitch_from_data
 from typing import Dict, Optional
 import tempfile
+import io
 import os
 
 class CompletePitchAPI:
@@ -160,7 +161,7 @@ def create_complete_api():
     """Create Flask API for complete pitch system"""
     
     try:
-        from flask import Flask, request, jsonify
+        from flask import Flask, request, jsonify, send_file
         from werkzeug.utils import secure_filename
     except ImportError:
         print("Flask not installed. Install with: pip install flask")
@@ -196,6 +197,27 @@ def create_complete_api():
         result = api.generate_pitch_deck(data)
         return jsonify(result)
     
+    @app.route('/generate-pitch-pdf', methods=['POST'])
+    def generate_pitch_pdf():
+        """Generate a pitch deck and return the PDF directly (rendered in memory)"""
+        
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'No company data provided'}), 400
+        
+        try:
+            result = generate_pitch_from_data(data, in_memory=True)
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+        
+        safe_name = secure_filename(result['company_name']) or 'startup'
+        return send_file(
+            io.BytesIO(result['pdf_bytes']),
+            mimetype='application/pdf',
+            as_attachment=True,
+            download_name=f"pitch_deck_{safe_name}.pdf"
+        )
+    
     @app.route('/funding-roadmap', methods=['POST'])
     def funding_roadmap():
         """Get complete funding roadmap"""
@@ -6,12 +6,19 @@ Provides accurate, funding-specific responses
 
 from rag.rag_engine import RAGEngine
 from vector_store.retriever import Retriever
-import re
-from typing import Dict, List
+from ingestion.extraction import AMOUNT, APPLICATION, ELIGIBILITY, get_extractor
+from ingestion.keyword_matcher import get_matcher
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+
+FUNDING_TERMS = ['funding', 'grant', 'loan', 'scheme', 'money', 'financial']
+ELIGIBILITY_TERMS = ['eligible', 'criteria', 'requirement']
+APPLICATION_TERMS = ['apply', 'application', 'process', 'submit']
 
 class FundingRAGEngine(RAGEngine):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, llm=None, retriever=None):
+        super().__init__(llm=llm, retriever=retriever)
         self.funding_keywords = [
             'funding', 'grant', 'loan', 'scheme', 'eligibility', 'application',
             'amount', 'criteria', 'process', 'startup', 'entrepreneur'
@@ -21,8 +28,7 @@ class FundingRAGEngine(RAGEngine):
         """Enhance query to be more funding-specific"""
         
         # Add funding context if not present
-        funding_terms = ['funding', 'grant', 'loan', 'scheme', 'money', 'financial']
-        has_funding_term = any(term in query.lower() for term in funding_terms)
+        has_funding_term = get_matcher(FUNDING_TERMS).contains_any(query.lower())
         
         if not has_funding_term:
             query = f"startup funding {query}"
@@ -32,7 +38,7 @@ class FundingRAGEngine(RAGEngine):
         
         return enhanced_query
     
-    def ask_funding_question(self, question: str, debug: bool = False) -> Dict:
+    def ask_funding_question(self, question: str, debug: bool = False, retrieved=None) -> Dict:
         """Ask funding-specific question with enhanced processing"""
         
         # Enhance the query for better retrieval
@@ -43,7 +49,7 @@ class FundingRAGEngine(RAGEngine):
             print(f"Enhanced: {enhanced_question}")
         
         # Get standard RAG response
-        result = self.ask(enhanced_question, debug=debug)
+        result = self.ask(enhanced_question, debug=debug, retrieved=retrieved)
         
         # Post-process for funding-specific information
         if result['status'] == 'success':
@@ -51,30 +57,93 @@ class FundingRAGEngine(RAGEngine):
         
         return result
     
+    def ask_funding_questions(
+        self,
+        questions: Dict[str, str],
+        max_workers: int = 4,
+        deadline: Optional[float] = None,
+        top_k: int = 5,
+    ) -> Dict[str, Dict]:
+        """
+        Answer several funding questions concurrently.
+        
+        All questions are retrieved in ONE vector-store call, then the LLM
+        calls run on a bounded thread pool. Anything still running after
+        `deadline` seconds is reported as timed out instead of holding up
+        the rest, so callers always get (possibly partial) results back.
+        
+        Returns {key: result} where result is an ask_funding_question()
+        dict, or {'error': ..., 'timed_out': bool}.
+        """
+        if not questions:
+            return {}
+        
+        started = time.monotonic()
+        keys = list(questions)
+        
+        # 1️⃣ One batched retrieval for every question
+        retrieved = {}
+        try:
+            enhanced = [self.enhance_funding_query(questions[k]) for k in keys]
+            for key, pair in zip(keys, self.retriever.search_batch(enhanced, top_k=top_k)):
+                retrieved[key] = pair
+        except Exception as e:
+            # Fall back to per-question retrieval inside each task
+            print(f"⚠️ Batched retrieval failed, retrieving per question: {e}")
+        
+        # langdetect lazily loads its profiles on first use - do it before fanning out
+        self.detect_language(questions[keys[0]])
+        
+        # 2️⃣ Bounded-concurrency LLM calls
+        results = {}
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(keys))))
+        try:
+            futures = {
+                executor.submit(self.ask_funding_question, questions[k], False, retrieved.get(k)): k
+                for k in keys
+            }
+            remaining = None if deadline is None else max(0.0, deadline - (time.monotonic() - started))
+            done, not_done = wait(futures, timeout=remaining)
+            
+            for future in done:
+                key = futures[future]
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    results[key] = {'error': str(e), 'timed_out': False}
+            
+            for future in not_done:
+                future.cancel()
+                results[futures[future]] = {
+                    'error': f"Timed out after {deadline:.0f}s",
+                    'timed_out': True
+                }
+        finally:
+            # Don't block on stragglers; their answers are simply dropped
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return {k: results[k] for k in keys}
+    
     def _enhance_funding_response(self, result: Dict, original_question: str) -> Dict:
         """Enhance response with funding-specific information"""
         
         answer = result['answer']
         
-        # Extract funding amounts from answer
-        amounts = re.findall(r'₹\s*(\d+(?:,\d+)*(?:\.\d+)?)\s*(lakh|crore|thousand)?', answer)
+        # Amounts, term mentions and sentences in one pass over the answer
+        extraction = get_extractor(ELIGIBILITY_TERMS, APPLICATION_TERMS).extract(answer)
+        
+        # Extract rupee amounts from answer
+        amounts = [span for span in extraction.of(AMOUNT) if span.currency == 'INR']
         
         # Extract eligibility mentions
-        eligibility_sentences = []
-        sentences = answer.split('.')
-        for sentence in sentences:
-            if any(word in sentence.lower() for word in ['eligible', 'criteria', 'requirement']):
-                eligibility_sentences.append(sentence.strip())
+        eligibility_sentences = extraction.sentences_with(ELIGIBILITY)
         
         # Extract application process mentions
-        application_sentences = []
-        for sentence in sentences:
-            if any(word in sentence.lower() for word in ['apply', 'application', 'process', 'submit']):
-                application_sentences.append(sentence.strip())
+        application_sentences = extraction.sentences_with(APPLICATION)
         
         # Add structured funding information to result
         result['funding_details'] = {
-            'amounts_mentioned': [f"{amt[0]} {amt[1]}".strip() for amt in amounts],
+            'amounts_mentioned': [f"{span.number} {span.unit}".strip() for span in amounts],
             'eligibility_info': eligibility_sentences[:3],
             'application_info': application_sentences[:3]
         }
@@ -4,11 +4,13 @@ Advanced Web Content Enhancement for Knowledge Base
 Includes content validation, quality scoring, and intelligent filtering
 """
 
-import re
 from typing import Dict, List, Tuple
 from urllib.parse import urlparse
 import hashlib
 
+from ingestion.extraction import AMOUNT, APPLICATION, ELIGIBILITY, get_extractor
+from ingestion.keyword_matcher import get_matcher
+
 class WebContentEnhancer:
     def __init__(self):
         self.startup_keywords = [
@@ -22,17 +24,21 @@ class WebContentEnhancer:
             'eligibility', 'criteria', 'application', 'process', 'requirements',
             'amount', 'funding', 'scheme', 'program', 'benefits', 'guidelines'
         ]
+        
+        # Keywords + indicators found in one pass per page
+        self.matcher = get_matcher(self.startup_keywords + self.quality_indicators)
     
     def calculate_relevance_score(self, content: str, title: str = "") -> float:
         """Calculate relevance score for startup funding content"""
         text = (content + " " + title).lower()
+        scan = self.matcher.scan(text)
         
         # Count startup-related keywords
-        keyword_matches = sum(1 for keyword in self.startup_keywords if keyword in text)
+        keyword_matches = scan.present(self.startup_keywords)
         keyword_score = min(keyword_matches / len(self.startup_keywords), 1.0)
         
         # Count quality indicators
-        quality_matches = sum(1 for indicator in self.quality_indicators if indicator in text)
+        quality_matches = scan.present(self.quality_indicators)
         quality_score = min(quality_matches / len(self.quality_indicators), 1.0)
         
         # Length score (prefer substantial content)
@@ -47,41 +53,17 @@ class WebContentEnhancer:
     def extract_key_information(self, content: str) -> Dict:
         """Extract structured information from web content"""
         
-        # Extract funding amounts
-        amount_patterns = [
-            r'₹\s*(\d+(?:,\d+)*(?:\.\d+)?)\s*(lakh|crore|thousand)?',
-            r'(\d+(?:,\d+)*(?:\.\d+)?)\s*(lakh|crore|thousand)?\s*rupees?',
-            r'\$\s*(\d+(?:,\d+)*(?:\.\d+)?)\s*(million|billion|thousand)?'
-        ]
+        # Amounts, eligibility and application clauses in one pass
+        extraction = get_extractor().extract(content)
         
-        amounts = []
-        for pattern in amount_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            amounts.extend(matches)
+        # Funding amounts as (number, unit) in page order
+        amounts = [(span.number, span.unit) for span in extraction.of(AMOUNT)]
         
-        # Extract eligibility criteria
-        eligibility_patterns = [
-            r'eligibility[:\s]*([^.!?]*[.!?])',
-            r'criteria[:\s]*([^.!?]*[.!?])',
-            r'requirements[:\s]*([^.!?]*[.!?])'
-        ]
-        
-        eligibility = []
-        for pattern in eligibility_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            eligibility.extend([match.strip() for match in matches])
-        
-        # Extract application processes
-        process_patterns = [
-            r'application[:\s]*([^.!?]*[.!?])',
-            r'apply[:\s]*([^.!?]*[.!?])',
-            r'process[:\s]*([^.!?]*[.!?])'
-        ]
+        # Clauses following "eligibility" / "criteria" / "requirements"
+        eligibility = [span.text for span in extraction.of(ELIGIBILITY) if span.text]
         
-        processes = []
-        for pattern in process_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            processes.extend([match.strip() for match in matches])
+        # Clauses following "application" / "apply" / "process"
+        processes = [span.text for span in extraction.of(APPLICATION) if span.text]
         
         return {
             'funding_amounts': amounts[:5],  # Top 5 amounts
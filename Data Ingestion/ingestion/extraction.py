@@ -0,0 +1,261 @@
+"""
+extraction.py
+Single-pass structured extraction for funding / pitch deck text
+
+✔ One compiled regex pass per text: amounts, percentages, user counts,
+  eligibility and application mentions, and sentence boundaries together
+✔ Typed spans with absolute offsets and the sentence they belong to
+✔ INR / USD amounts normalized to plain values (₹2.5 crore -> 25000000.0)
+✔ Streaming over pages: only the unfinished last sentence of a page is
+  carried into the next one, so memory stays flat for long documents
+
+Eligibility / application mentions report the clause that follows the
+label ("Eligibility: DPIIT-recognised startups." -> "DPIIT-recognised
+startups."), sliced from the sentence span once its end is found; text is
+empty when the clause never ends in punctuation or runs past
+MAX_CLAUSE_CHARS. Labels are matched inside words ("process" in
+"processing"), like the per-site patterns they replace. Callers that
+don't need clauses pass empty label sets and skip those branches.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Span kinds
+AMOUNT = 'amount'
+PERCENT = 'percent'
+USERS = 'users'
+ELIGIBILITY = 'eligibility'
+APPLICATION = 'application'
+SENTENCE = 'sentence'
+
+ELIGIBILITY_LABELS = ('eligibility', 'criteria', 'requirements')
+APPLICATION_LABELS = ('application', 'apply', 'process')
+
+UNIT_MULTIPLIERS = {
+    'k': 1e3, 'thousand': 1e3,
+    'lakh': 1e5, 'lakhs': 1e5, 'lac': 1e5, 'lacs': 1e5,
+    'million': 1e6, 'mn': 1e6,
+    'crore': 1e7, 'crores': 1e7, 'cr': 1e7,
+    'billion': 1e9, 'bn': 1e9,
+}
+
+# A page without any sentence end is flushed once its open sentence gets
+# this long, instead of being carried (and rescanned) indefinitely
+MAX_SENTENCE_CHARS = 20000
+
+# Longer "clauses" are run-on text (no sentence ends), not a criterion
+MAX_CLAUSE_CHARS = 2000
+
+_NUMBER = r'\d+(?:,\d+)*(?:\.\d+)?'
+_NUMBER_REST = r'(?:,?\d)*(?:\.\d+)?'  # _NUMBER after its first digit
+_UNIT = r'lakhs?|lacs?|crores?|cr\b|thousand|million|mn\b|billion|bn\b|k\b'
+_CLAUSE_LEAD = re.compile(r'[:\s]*')
+
+
+class Span(NamedTuple):
+    kind: str
+    start: int
+    end: int
+    text: str
+    sentence: int               # index of the sentence the span belongs to
+    number: str = ''            # numeral as written ('1,50,000')
+    unit: str = ''              # lowercased scale word ('lakh', 'million', ...)
+    currency: str = ''          # 'INR' / 'USD' for amounts
+    value: Optional[float] = None
+
+
+def _labels(labels: Iterable[str]) -> str:
+    """Labels minus their first character (already consumed), case-insensitive"""
+    return '|'.join(
+        f'(?<={re.escape(label[0])}){re.escape(label[1:])}'
+        for label in sorted(set(labels), key=lambda l: (-len(l), l))
+    )
+
+
+class Extraction:
+    """Spans from one text / page stream, grouped by kind"""
+
+    def __init__(self, spans: List[Span]):
+        self.spans = spans
+        self._by_kind: Dict[str, List[Span]] = {}
+        for span in spans:
+            self._by_kind.setdefault(span.kind, []).append(span)
+
+    def of(self, kind: str) -> List[Span]:
+        return self._by_kind.get(kind, [])
+
+    def sentences_with(self, kind: str) -> List[str]:
+        """Text of each sentence containing a span of kind, in order"""
+        wanted = {span.sentence for span in self.of(kind)}
+        return [span.text for span in self.of(SENTENCE) if span.sentence in wanted]
+
+
+class Extractor:
+    def __init__(
+        self,
+        eligibility_labels: Iterable[str] = ELIGIBILITY_LABELS,
+        application_labels: Iterable[str] = APPLICATION_LABELS,
+        max_sentence_chars: int = MAX_SENTENCE_CHARS,
+    ):
+        self.max_sentence_chars = max_sentence_chars
+        eligibility_labels = [l.lower() for l in eligibility_labels if l]
+        application_labels = [l.lower() for l in application_labels if l]
+
+        # Every token starts with one of these characters. Making that class
+        # the first thing in the pattern lets re skip all other positions in
+        # C; each branch then checks which token it is with a lookbehind on
+        # the consumed character. (IGNORECASE would disable that skip, so
+        # case-insensitivity is scoped to the letter parts with (?i:...).)
+        first = set('.!?₹$rRiIuU') | {c for label in eligibility_labels + application_labels for c in (label[0], label[0].upper())}
+        first_class = ''.join(sorted(re.escape(c) for c in first))
+
+        labels = ''
+        if eligibility_labels:
+            labels += rf'|(?P<ELIGIBILITY>(?i:{_labels(eligibility_labels)}))'
+        if application_labels:
+            labels += rf'|(?P<APPLICATION>(?i:{_labels(application_labels)}))'
+
+        # Branches are named groups so match.lastgroup says which token was found
+        self._pattern = re.compile(
+            rf'''
+            [0-9{first_class}]
+            (?:
+              (?<=[.!?])(?P<EOS>[.!?]*(?=\s|\Z))
+            |(?P<CURRENCY>
+                (?:(?<=[₹$])|(?<!\w\w)(?i:(?<=r)s\.?|(?<=i)nr\b|(?<=u)sd\b))
+                \s*(?P<cnum>{_NUMBER})(?:\s*(?P<cunit>(?i:{_UNIT})))?)
+            |(?<=[0-9])(?P<NUMBER>
+                (?P<num>{_NUMBER_REST})
+                (?:(?P<pct>%)
+                  |\s*(?:(?P<unit>(?i:{_UNIT}))\s*)?(?P<noun>(?i:rupees?|dollars?|users?|customers?|clients?))))
+            {labels}
+            )
+            ''',
+            re.VERBOSE
+        )
+
+    def _entity(self, match: re.Match, base: int, sentence: int) -> Span:
+        kind = match.lastgroup
+        start, end = base + match.start(), base + match.end()
+
+        if kind == 'CURRENCY':
+            number, unit = match['cnum'], (match['cunit'] or '').lower()
+            currency = 'USD' if match.group()[0] in '$uU' else 'INR'
+        elif kind == 'NUMBER':
+            number = match.string[match.start():match.end('num')]
+            unit = (match['unit'] or '').lower()
+            if match['pct']:
+                return Span(PERCENT, start, end, match.group(), sentence, number, value=float(number.replace(',', '')))
+            noun = match['noun'].lower()
+            if not noun.startswith(('rupee', 'dollar')):
+                value = float(number.replace(',', '')) * UNIT_MULTIPLIERS.get(unit, 1)
+                return Span(USERS, start, end, match.group(), sentence, number, unit, value=value)
+            currency = 'INR' if noun.startswith('rupee') else 'USD'
+        else:
+            # Clause text is filled in when the sentence ends (_with_clauses)
+            return Span(kind.lower(), start, end, '', sentence)
+
+        value = float(number.replace(',', '')) * UNIT_MULTIPLIERS.get(unit, 1)
+        return Span(AMOUNT, start, end, match.group(), sentence, number, unit, currency, value)
+
+    @staticmethod
+    def _with_clauses(pending: List[Span], buffer: str, base: int, end: int) -> List[Span]:
+        """Label spans get the text from the label to the sentence end (buffer offset end)"""
+        for i, span in enumerate(pending):
+            if span.kind in (ELIGIBILITY, APPLICATION) and end - (span.end - base) <= MAX_CLAUSE_CHARS:
+                clause = buffer[span.end - base:end]
+                pending[i] = span._replace(text=clause[_CLAUSE_LEAD.match(clause).end():].strip())
+        return pending
+
+    def _scan(self, buffer: str, base: int, sentence: int, final: bool) -> Tuple[List[Span], int, int]:
+        """Spans for buffer up to its last complete sentence (all of it if final).
+        Returns (spans, chars consumed, next sentence index)"""
+        spans: List[Span] = []
+        pending: List[Span] = []  # entities of the still-open sentence
+        sentence_start = 0
+
+        for match in self._pattern.finditer(buffer):
+            if match.lastgroup != 'EOS':
+                pending.append(self._entity(match, base, sentence))
+                continue
+            raw = buffer[sentence_start:match.start()]
+            text = raw.strip()
+            spans.extend(self._with_clauses(pending, buffer, base, match.end()))
+            pending = []
+            if text:
+                start = base + sentence_start + len(raw) - len(raw.lstrip())
+                spans.append(Span(SENTENCE, start, base + match.end(), text, sentence))
+                sentence += 1
+            sentence_start = match.end()
+
+        if not final and len(buffer) - sentence_start <= self.max_sentence_chars:
+            # The open sentence may continue on the next page: rescan it then
+            return spans, sentence_start, sentence
+
+        raw = buffer[sentence_start:]
+        text = raw.strip()
+        spans.extend(pending)
+        if text:
+            start = base + sentence_start + len(raw) - len(raw.lstrip())
+            spans.append(Span(SENTENCE, start, base + sentence_start + len(raw.rstrip()), text, sentence))
+            sentence += 1
+        return spans, len(buffer), sentence
+
+    def iter_stream(self, pages: Iterable[str], separator: str = "\n") -> Iterator[Span]:
+        """Spans over pages as if they were joined by separator (offsets are
+        into that joined text); yields each sentence once it is complete"""
+        carry, base, sentence = "", 0, 0
+        for page in pages:
+            buffer = carry + page + separator
+            spans, consumed, sentence = self._scan(buffer, base, sentence, final=False)
+            yield from spans
+            carry, base = buffer[consumed:], base + consumed
+
+        if carry:
+            spans, _, _ = self._scan(carry, base, sentence, final=True)
+            yield from spans
+
+    def iter_spans(self, text: str) -> Iterator[Span]:
+        spans, _, _ = self._scan(text, 0, 0, final=True)
+        return iter(spans)
+
+    def extract(self, text: str) -> Extraction:
+        return Extraction(list(self.iter_spans(text)))
+
+    def extract_pages(self, pages: Iterable[str], separator: str = "\n") -> Extraction:
+        return Extraction(list(self.iter_stream(pages, separator)))
+
+
+@lru_cache(maxsize=16)
+def _cached_extractor(eligibility_labels: Tuple[str, ...], application_labels: Tuple[str, ...]) -> Extractor:
+    return Extractor(eligibility_labels, application_labels)
+
+
+def get_extractor(
+    eligibility_labels: Iterable[str] = ELIGIBILITY_LABELS,
+    application_labels: Iterable[str] = APPLICATION_LABELS,
+) -> Extractor:
+    """Shared extractor per label set (the pattern is compiled once)"""
+    return _cached_extractor(tuple(sorted(set(eligibility_labels))), tuple(sorted(set(application_labels))))
+
+
+if __name__ == "__main__":
+    pages = [
+        "Startup India Seed Fund offers up to ₹20 lakh for validation and Rs. 50 Lakhs for "
+        "market entry. Eligibility: DPIIT-recognised startups incorporated less than",
+        "2 years ago. Apply online via the portal; the process takes 2.5 months. "
+        "We grew 40% MoM to 12,000 users and raised $1.5 million from 3 angels",
+    ]
+    extractor = get_extractor()
+
+    streamed = list(extractor.iter_stream(pages))
+    assert streamed == list(extractor.iter_spans("\n".join(pages) + "\n")), "stream != whole text"
+
+    joined = "\n".join(pages)
+    for span in streamed:
+        if span.kind != SENTENCE:
+            assert span.kind in (ELIGIBILITY, APPLICATION) or joined[span.start:span.end] == span.text, span
+        value = f" = {span.currency} {span.value:,.0f}" if span.kind == AMOUNT else ""
+        print(f"[{span.sentence}] {span.kind:<12} {span.text!r}{value}")
@@ -7,6 +7,7 @@ Brings together:
 ✔ cleaner
 ✔ chunker
 ✔ metadata
+✔ per-stage profiling (ingestion/profiler.py, no-op unless a run is profiled)
 """
 
 from typing import Dict, List
@@ -17,6 +18,7 @@ from ingestion.web_processor import process_multiple_websites, STARTUP_FUNDING_U
 from ingestion.cleaner import normalize_text
 from ingestion.chunker import hybrid_chunker
 from ingestion.metadata_extractor import generate_metadata
+from ingestion.profiler import profile_stage
 
 
 def process_pdf(
@@ -35,28 +37,36 @@ def process_pdf(
     """
 
     # Load PDF / OCR automatically
-    pdf = load_pdf(path)
+    with profile_stage("load_pdf", path) as stage:
+        pdf = load_pdf(path)
+        stage.done(pdf["full_text"], items=len(pdf["pages"]), bytes_in=os.path.getsize(path))
 
     raw_text = pdf["full_text"]
 
     # Clean
     mode = "aggressive" if aggressive_clean else "basic"
-    cleaned = normalize_text(raw_text, mode=mode)
+    with profile_stage("clean", path, raw_text) as stage:
+        cleaned = normalize_text(raw_text, mode=mode)
+        stage.done(cleaned["clean_text"])
 
     language = cleaned["language"]
     clean_text = cleaned["clean_text"]
 
     # Chunk
-    chunks: List[str] = hybrid_chunker(clean_text, chunk_size=chunk_size)
+    with profile_stage("chunk", path, clean_text) as stage:
+        chunks: List[str] = hybrid_chunker(clean_text, chunk_size=chunk_size)
+        stage.done(chunks)
 
     # Metadata
-    metadata = generate_metadata(
-        file_path=path,
-        language=language,
-        doc_type="startup_policy",
-        source="ingestion_pipeline",
-        extra={"pages": len(pdf["pages"]), "used_ocr": pdf["used_ocr"]},
-    )
+    with profile_stage("metadata", path) as stage:
+        metadata = generate_metadata(
+            file_path=path,
+            language=language,
+            doc_type="startup_policy",
+            source="ingestion_pipeline",
+            extra={"pages": len(pdf["pages"]), "used_ocr": pdf["used_ocr"]},
+        )
+        stage.done(items=1)
 
     return {
         "chunks": chunks,
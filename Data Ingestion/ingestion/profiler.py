@@ -0,0 +1,307 @@
+"""
+profiler.py
+Ingestion profiler ⏱️ (where do the ingest hours go?)
+
+✔ profile_run("ingest_pdfs"): profiling mode for one ingest / build run
+✔ profile_stage("chunk", doc, data): wall + CPU time, bytes and items in/out
+  per stage per document (CPU includes OCR subprocesses like tesseract)
+✔ Machine-readable JSON report per run (per stage totals, MB/s, items/s,
+  share of the run, and the per-document breakdown)
+✔ Optional cProfile (.prof) or pyinstrument (.html) dump next to the report
+✔ Free when no run is active: profile_stage returns a shared no-op
+
+Run:
+    python app.py --profile                        # menu, options 1-3 profiled
+    python app.py --profile --profile-dump cprofile
+    python vector_store/build_store.py --profile --profile-dump pyinstrument
+    python ingestion/profiler.py data/profiles/ingest_pdfs_20250101-120000.json
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+PROFILE_DIR = "data/profiles"
+DUMP_ENGINES = ("cprofile", "pyinstrument")
+BATCH_DOC = "(batch)"  # stages that run over many documents at once
+
+
+def _size(data) -> int:
+    """Bytes in a stage input / output (UTF-8 for text)"""
+    if data is None:
+        return 0
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    if isinstance(data, str):
+        return len(data.encode("utf-8", "ignore"))
+    if isinstance(data, (list, tuple)):
+        return sum(_size(item) for item in data)
+    if isinstance(data, dict):
+        return _size(data.get("content") or data.get("full_text") or data.get("clean_text"))
+    return 0
+
+
+def _items(data) -> int:
+    if data is None:
+        return 0
+    return len(data) if isinstance(data, (list, tuple)) else 1
+
+
+def _cpu_now(process: bool = False) -> float:
+    """CPU seconds of this thread (or the whole process) plus finished
+    child processes"""
+    times = os.times()
+    own = time.process_time() if process else time.thread_time()
+    return own + times.children_user + times.children_system
+
+
+# -----------------------------------------
+# Stage Records
+# -----------------------------------------
+class _Stage:
+    __slots__ = ("profile", "name", "doc", "bytes_in", "items_in", "bytes_out", "items_out", "_wall", "_cpu")
+
+    def __init__(self, profile: "IngestProfile", name: str, doc: Optional[str], data):
+        self.profile = profile
+        self.name = name
+        self.doc = doc or BATCH_DOC
+        self.bytes_in = _size(data)
+        self.items_in = _items(data)
+        self.bytes_out = 0
+        self.items_out = 0
+
+    def done(self, data=None, items: Optional[int] = None, bytes_in: Optional[int] = None):
+        """Record the stage output (call inside the with block); bytes_in
+        is for inputs that weren't in memory, like the file a stage read"""
+        self.bytes_out = _size(data)
+        self.items_out = _items(data) if items is None else items
+        if bytes_in is not None:
+            self.bytes_in = bytes_in
+
+    def __enter__(self):
+        self._cpu = _cpu_now()
+        self._wall = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall = time.perf_counter() - self._wall
+        cpu = _cpu_now() - self._cpu
+        self.profile.record(self, wall, cpu, failed=exc_type is not None)
+        return False
+
+
+class _NoopStage:
+    __slots__ = ()
+
+    def done(self, data=None, items=None, bytes_in=None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopStage()
+_active: Optional["IngestProfile"] = None
+
+
+def profile_stage(name: str, doc: Optional[str] = None, data=None):
+    """
+    with profile_stage("clean", doc=path, data=raw_text) as stage:
+        cleaned = normalize_text(raw_text)
+        stage.done(cleaned["clean_text"])
+
+    data is the stage input; it is only sized while a run is profiled
+    """
+    profile = _active
+    return _NOOP if profile is None else _Stage(profile, name, doc, data)
+
+
+def active_profile() -> Optional["IngestProfile"]:
+    return _active
+
+
+# -----------------------------------------
+# Profile Run
+# -----------------------------------------
+class IngestProfile:
+    """One profiled run: collects stage records, writes the report (+ dump)"""
+
+    def __init__(self, command: str, report_dir: str = PROFILE_DIR, dump: Optional[str] = None):
+        if dump and dump not in DUMP_ENGINES:
+            raise ValueError(f"Unknown profile dump {dump!r} (use one of {', '.join(DUMP_ENGINES)})")
+        self.command = command
+        self.report_dir = report_dir
+        self.dump = dump
+        self.records: List[Dict] = []
+        self.report_path: Optional[str] = None
+        self.dump_path: Optional[str] = None
+        self._lock = threading.Lock()
+        self._profiler = None
+        self._previous = None
+
+    def record(self, stage: _Stage, wall: float, cpu: float, failed: bool = False):
+        with self._lock:
+            self.records.append({
+                "stage": stage.name,
+                "doc": stage.doc,
+                "wall_s": wall,
+                "cpu_s": cpu,
+                "bytes_in": stage.bytes_in,
+                "bytes_out": stage.bytes_out,
+                "items_in": stage.items_in,
+                "items_out": stage.items_out,
+                "failed": failed,
+            })
+
+    # ---------- lifecycle ----------
+    def __enter__(self):
+        global _active
+        self._previous, _active = _active, self
+        self.started_at = datetime.now()
+        self._start_dump()
+        self._cpu = _cpu_now(process=True)
+        self._wall = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        global _active
+        self.wall_s = time.perf_counter() - self._wall
+        self.cpu_s = _cpu_now(process=True) - self._cpu
+        _active = self._previous
+        self._stop_dump()
+        self.write()
+        print_report(self.report())
+        print(f"\n📊 Profile report → {self.report_path}")
+        if self.dump_path:
+            print(f"🔬 {self.dump} dump → {self.dump_path}")
+        return False
+
+    def _base_path(self) -> str:
+        stamp = self.started_at.strftime("%Y%m%d-%H%M%S")
+        return os.path.join(self.report_dir, f"{self.command}_{stamp}")
+
+    def _start_dump(self):
+        if self.dump == "pyinstrument":
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                print("⚠️ pyinstrument not installed (pip install pyinstrument) - writing a cProfile dump instead")
+                self.dump = "cprofile"
+            else:
+                self._profiler = Profiler()
+                self._profiler.start()
+        if self.dump == "cprofile":
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def _stop_dump(self):
+        if self._profiler is None:
+            return
+        os.makedirs(self.report_dir, exist_ok=True)
+        if self.dump == "pyinstrument":
+            self._profiler.stop()
+            self.dump_path = self._base_path() + ".html"
+            with open(self.dump_path, "w", encoding="utf-8") as f:
+                f.write(self._profiler.output_html())
+        else:
+            self._profiler.disable()
+            self.dump_path = self._base_path() + ".prof"
+            self._profiler.dump_stats(self.dump_path)
+
+    # ---------- report ----------
+    def report(self) -> Dict:
+        with self._lock:
+            records = list(self.records)
+
+        stages: Dict[str, Dict] = {}
+        documents: Dict[str, Dict] = {}
+        for r in records:
+            total = stages.setdefault(r["stage"], {
+                "calls": 0, "failed": 0, "docs": set(), "wall_s": 0.0, "cpu_s": 0.0,
+                "bytes_in": 0, "bytes_out": 0, "items_in": 0, "items_out": 0,
+            })
+            total["calls"] += 1
+            total["failed"] += r["failed"]
+            total["docs"].add(r["doc"])
+            for key in ("wall_s", "cpu_s", "bytes_in", "bytes_out", "items_in", "items_out"):
+                total[key] += r[key]
+
+            doc = documents.setdefault(r["doc"], {}).setdefault(r["stage"], {
+                "calls": 0, "wall_s": 0.0, "cpu_s": 0.0,
+                "bytes_in": 0, "bytes_out": 0, "items_in": 0, "items_out": 0,
+            })
+            doc["calls"] += 1
+            for key in ("wall_s", "cpu_s", "bytes_in", "bytes_out", "items_in", "items_out"):
+                doc[key] += r[key]
+
+        run_wall = getattr(self, "wall_s", 0.0)
+        for total in stages.values():
+            wall = total["wall_s"]
+            total["docs"] = len(total["docs"])
+            total["items_per_s"] = round((total["items_out"] or total["items_in"]) / wall, 2) if wall else 0.0
+            total["mb_per_s"] = round(total["bytes_in"] / 1e6 / wall, 3) if wall else 0.0
+            total["cpu_ratio"] = round(total["cpu_s"] / wall, 2) if wall else 0.0
+            total["share"] = round(wall / run_wall, 4) if run_wall else 0.0
+            total["wall_s"] = round(wall, 4)
+            total["cpu_s"] = round(total["cpu_s"], 4)
+        for doc in documents.values():
+            for entry in doc.values():
+                entry["wall_s"] = round(entry["wall_s"], 4)
+                entry["cpu_s"] = round(entry["cpu_s"], 4)
+
+        return {
+            "command": self.command,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "wall_s": round(run_wall, 3),
+            "cpu_s": round(getattr(self, "cpu_s", 0.0), 3),
+            "documents_profiled": len([d for d in documents if d != BATCH_DOC]),
+            "dump": self.dump_path,
+            "stages": dict(sorted(stages.items(), key=lambda item: -item[1]["wall_s"])),
+            "documents": documents,
+        }
+
+    def write(self) -> str:
+        os.makedirs(self.report_dir, exist_ok=True)
+        self.report_path = self._base_path() + ".json"
+        with open(self.report_path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        return self.report_path
+
+
+def profile_run(command: str, report_dir: str = PROFILE_DIR, dump: Optional[str] = None) -> IngestProfile:
+    """
+    with profile_run("build_vector_database", dump="cprofile"):
+        build_vector_database()
+    """
+    return IngestProfile(command, report_dir, dump)
+
+
+def print_report(report: Dict):
+    print("\n======================================")
+    print(f"Profile: {report['command']}  ({report['wall_s']:.2f}s wall, {report['cpu_s']:.2f}s CPU, "
+          f"{report['documents_profiled']} documents)")
+    print("======================================")
+    print(f"{'stage':<16}{'calls':>7}{'wall s':>10}{'cpu s':>10}{'share':>8}{'MB in':>9}{'MB/s':>9}{'items/s':>10}")
+    for name, s in report["stages"].items():
+        print(f"{name:<16}{s['calls']:>7}{s['wall_s']:>10.2f}{s['cpu_s']:>10.2f}{s['share']:>8.1%}"
+              f"{s['bytes_in'] / 1e6:>9.2f}{s['mb_per_s']:>9.2f}{s['items_per_s']:>10.1f}")
+
+
+# -----------------------------------------
+# Entry Point (pretty-print a saved report)
+# -----------------------------------------
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python ingestion/profiler.py <report.json>")
+        sys.exit(1)
+
+    with open(sys.argv[1], "r", encoding="utf-8") as f:
+        print_report(json.load(f))
@@ -8,6 +8,7 @@ from ingestion.cleaner import normalize_text
 from ingestion.chunker import hybrid_chunker
 from ingestion.metadata_extractor import generate_metadata
 from ingestion.simple_web_scraper import SimpleWebScraper
+from ingestion.profiler import profile_stage
 import hashlib
 
 def process_simple_web_content(url: str, content_data: Dict) -> Dict:
@@ -19,29 +20,35 @@ def process_simple_web_content(url: str, content_data: Dict) -> Dict:
     raw_text = content_data['content']
     
     # Clean text
-    cleaned = normalize_text(raw_text, mode="basic")
+    with profile_stage("clean", url, raw_text) as stage:
+        cleaned = normalize_text(raw_text, mode="basic")
+        stage.done(cleaned["clean_text"])
     clean_text = cleaned["clean_text"]
     language = cleaned["language"]
     
     # Create chunks
-    chunks = hybrid_chunker(clean_text, chunk_size=700)
+    with profile_stage("chunk", url, clean_text) as stage:
+        chunks = hybrid_chunker(clean_text, chunk_size=700)
+        stage.done(chunks)
     
     # Generate URL hash for ID
     url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
     
     # Create metadata
-    metadata = generate_metadata(
-        file_path=url,
-        language=language,
-        doc_type="web_content",
-        source="simple_web_scraper",
-        extra={
-            "title": content_data.get('title', ''),
-            "word_count": content_data.get('word_count', 0),
-            "url_hash": url_hash,
-            "scraped_at": content_data.get('scraped_at', '')
-        }
-    )
+    with profile_stage("metadata", url) as stage:
+        metadata = generate_metadata(
+            file_path=url,
+            language=language,
+            doc_type="web_content",
+            source="simple_web_scraper",
+            extra={
+                "title": content_data.get('title', ''),
+                "word_count": content_data.get('word_count', 0),
+                "url_hash": url_hash,
+                "scraped_at": content_data.get('scraped_at', '')
+            }
+        )
+        stage.done(items=1)
     
     return {
         "chunks": chunks,
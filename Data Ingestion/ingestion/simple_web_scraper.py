@@ -9,6 +9,8 @@ import time
 from datetime import datetime
 from typing import Dict, List
 
+from ingestion.profiler import profile_stage
+
 class SimpleWebScraper:
     def __init__(self):
         self.session = requests.Session()
@@ -79,7 +81,9 @@ class SimpleWebScraper:
         
         for i, url in enumerate(urls):
             print(f"Processing {i+1}/{len(urls)}: {url}")
-            result = self.scrape_url(url)
+            with profile_stage("scrape", url) as stage:
+                result = self.scrape_url(url)
+                stage.done(result, items=1 if result['status'] == 'success' else 0)
             results.append(result)
             
             if result['status'] == 'success':
@@ -89,7 +93,8 @@ class SimpleWebScraper:
             
             # Rate limiting
             if i < len(urls) - 1:
-                time.sleep(2)
+                with profile_stage("scrape_delay", url):
+                    time.sleep(2)
         
         return results
 
@@ -12,6 +12,7 @@ from ingestion.web_scraper import WebScraper
 from ingestion.advanced_web_enhancer import WebContentEnhancer
 from ingestion.simple_web_processor import process_reliable_websites
 from ingestion.reliable_startup_urls import get_reliable_urls
+from ingestion.profiler import profile_stage
 import hashlib
 import os
 
@@ -26,12 +27,16 @@ def process_web_content(url: str, content_data: Dict, chunk_size: int = 700) ->
     raw_text = content_data['content']
     
     # Clean the text
-    cleaned = normalize_text(raw_text, mode="basic")
+    with profile_stage("clean", url, raw_text) as stage:
+        cleaned = normalize_text(raw_text, mode="basic")
+        stage.done(cleaned["clean_text"])
     language = cleaned["language"]
     clean_text = cleaned["clean_text"]
     
     # Chunk the content
-    chunks: List[str] = hybrid_chunker(clean_text, chunk_size=chunk_size)
+    with profile_stage("chunk", url, clean_text) as stage:
+        chunks: List[str] = hybrid_chunker(clean_text, chunk_size=chunk_size)
+        stage.done(chunks)
     
     # Generate URL-based ID
     url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
@@ -46,13 +51,15 @@ def process_web_content(url: str, content_data: Dict, chunk_size: int = 700) ->
         "url_hash": url_hash
     }
     
-    metadata = generate_metadata(
-        file_path=url,
-        language=language,
-        doc_type="web_content",
-        source="web_scraper",
-        extra=extra_data
-    )
+    with profile_stage("metadata", url) as stage:
+        metadata = generate_metadata(
+            file_path=url,
+            language=language,
+            doc_type="web_content",
+            source="web_scraper",
+            extra=extra_data
+        )
+        stage.done(items=1)
     
     return {
         "chunks": chunks,
@@ -71,8 +78,10 @@ def process_multiple_websites(urls: List[str]) -> List[Dict]:
     scraped_data = scraper.scrape_multiple(urls)
     
     # Enhance content quality
-    enhancer = WebContentEnhancer()
-    enhanced_data = enhancer.filter_high_quality_content(scraped_data, min_score=0.15)
+    with profile_stage("enhance", data=scraped_data) as stage:
+        enhancer = WebContentEnhancer()
+        enhanced_data = enhancer.filter_high_quality_content(scraped_data, min_score=0.15)
+        stage.done(enhanced_data)
     
     processed_results = []
     
@@ -13,6 +13,8 @@ from typing import Dict, List, Optional
 import json
 from datetime import datetime
 
+from ingestion.profiler import profile_stage
+
 class WebScraper:
     def __init__(self, delay: float = 1.0):
         self.delay = delay
@@ -126,7 +128,9 @@ class WebScraper:
         for i, url in enumerate(urls):
             print(f"Scraping {i+1}/{len(urls)}: {url}")
             
-            result = self.extract_content(url)
+            with profile_stage("scrape", url) as stage:
+                result = self.extract_content(url)
+                stage.done(result, items=1 if result['status'] == 'success' else 0)
             results.append(result)
             
             if result['status'] == 'success':
@@ -136,7 +140,8 @@ class WebScraper:
             
             # Rate limiting
             if i < len(urls) - 1:
-                time.sleep(self.delay)
+                with profile_stage("scrape_delay", url):
+                    time.sleep(self.delay)
         
         return results
 
@@ -5,13 +5,133 @@ Generates visually appealing slides with 100% score content
 """
 
 from pitch_deck_generator import PitchDeckGenerator
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, List, Optional
+
+OUTPUT_DIR = "data/generated_pitches"
+PAGE_MARGIN = inch
+
+SLIDE_TITLES = {
+    'problem': 'THE PROBLEM',
+    'solution': 'OUR SOLUTION', 
+    'market': 'MARKET OPPORTUNITY',
+    'business_model': 'BUSINESS MODEL',
+    'traction': 'TRACTION & GROWTH',
+    'competition': 'COMPETITIVE LANDSCAPE',
+    'team': 'TEAM & LEADERSHIP',
+    'financials': 'FINANCIAL PROJECTIONS',
+    'funding': 'FUNDING REQUEST'
+}
+
+_local = threading.local()
+
+@lru_cache(maxsize=1)
+def get_pitch_styles():
+    """Stylesheet for pitch deck slides (built once per process, read-only)"""
+    styles = getSampleStyleSheet()
+    
+    # Custom styles
+    styles.add(ParagraphStyle(
+        name='SlideTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=20,
+        textColor=HexColor('#2E86AB'),
+        alignment=1  # Center
+    ))
+    
+    styles.add(ParagraphStyle(
+        name='SlideContent',
+        parent=styles['Normal'],
+        fontSize=12,
+        spaceAfter=12,
+        leftIndent=20
+    ))
+    
+    styles.add(ParagraphStyle(
+        name='CompanyTitle',
+        parent=styles['Title'],
+        fontSize=32,
+        textColor=HexColor('#2E86AB'),
+        alignment=1
+    ))
+    
+    return styles
+
+def _page_templates() -> List[PageTemplate]:
+    """A4 slide page template, built once per thread (frames hold layout
+    state while a document builds, so threads don't share them)"""
+    templates = getattr(_local, 'page_templates', None)
+    if templates is None:
+        width, height = A4
+        frame = Frame(PAGE_MARGIN, PAGE_MARGIN, width - 2 * PAGE_MARGIN, height - 2 * PAGE_MARGIN, id='normal')
+        templates = _local.page_templates = [PageTemplate(id='Slide', frames=[frame], pagesize=A4)]
+    return templates
+
+def build_pitch_story(pitch_content: Dict) -> list:
+    """Flowables for a pitch deck: title slide, one slide per section, thank you"""
+    styles = get_pitch_styles()
+    company_name = pitch_content['company_name']
+    story = []
+    
+    # Title slide
+    story.append(Paragraph(company_name, styles['CompanyTitle']))
+    story.append(Spacer(1, 0.5*inch))
+    story.append(Paragraph("PITCH DECK", styles['Heading2']))
+    story.append(Spacer(1, 0.3*inch))
+    story.append(Paragraph(f"Generated on {datetime.now().strftime('%B %d, %Y')}", styles['Normal']))
+    story.append(PageBreak())
+    
+    # Create slides for each section
+    for section_key, section_content in pitch_content['sections'].items():
+        # Slide title
+        title = SLIDE_TITLES.get(section_key, section_key.upper().replace('_', ' '))
+        story.append(Paragraph(title, styles['SlideTitle']))
+        story.append(Spacer(1, 0.3*inch))
+        
+        # Format content into bullet points
+        lines = section_content.split('\n')
+        for line in lines[2:]:  # Skip the section header
+            if line.strip():
+                if line.startswith('•'):
+                    story.append(Paragraph(line, styles['SlideContent']))
+                else:
+                    story.append(Paragraph(f"• {line}", styles['SlideContent']))
+        
+        story.append(PageBreak())
+    
+    # Thank you slide
+    story.append(Paragraph("THANK YOU", styles['SlideTitle']))
+    story.append(Spacer(1, 0.5*inch))
+    story.append(Paragraph("Questions & Discussion", styles['Heading3']))
+    
+    return story
+
+def render_pitch_pdf(pitch_content: Dict, output=None):
+    """
+    Render pitch content to PDF.
+    output: file path or binary file object; None renders in memory
+    and returns the PDF bytes (for APIs), otherwise returns output.
+    """
+    target = BytesIO() if output is None else output
+    doc = BaseDocTemplate(target, pagesize=A4, pageTemplates=_page_templates())
+    doc.build(build_pitch_story(pitch_content))
+    return target.getvalue() if output is None else output
+
+def pitch_pdf_path(company_name: str) -> str:
+    safe_name = company_name.replace(' ', '_').replace('/', '_')
+    filename = f"pitch_deck_{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    return f"{OUTPUT_DIR}/{filename}"
 
 class PDFPitchGenerator(PitchDeckGenerator):
     def __init__(self):
@@ -19,101 +139,30 @@ class PDFPitchGenerator(PitchDeckGenerator):
         self.setup_styles()
     
     def setup_styles(self):
-        """Setup PDF styles for professional appearance"""
-        self.styles = getSampleStyleSheet()
-        
-        # Custom styles
-        self.styles.add(ParagraphStyle(
-            name='SlideTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            spaceAfter=20,
-            textColor=HexColor('#2E86AB'),
-            alignment=1  # Center
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='SlideContent',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            spaceAfter=12,
-            leftIndent=20
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='CompanyTitle',
-            parent=self.styles['Title'],
-            fontSize=32,
-            textColor=HexColor('#2E86AB'),
-            alignment=1
-        ))
+        """Use the shared PDF styles (built once per process)"""
+        self.styles = get_pitch_styles()
     
-    def create_pdf_pitch_deck(self, responses: dict) -> str:
+    def create_pdf_pitch_deck(self, responses: dict, pitch_content: Optional[Dict] = None, filepath: Optional[str] = None) -> str:
         """Create a professional PDF pitch deck"""
         
-        # Generate content
-        pitch_content = self.generate_pitch_content(responses)
-        company_name = pitch_content['company_name']
+        # Generate content (unless the caller already did)
+        if pitch_content is None:
+            pitch_content = self.generate_pitch_content(responses)
         
         # Create PDF filename
-        safe_name = company_name.replace(' ', '_').replace('/', '_')
-        filename = f"pitch_deck_{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        filepath = f"data/generated_pitches/{filename}"
+        filepath = filepath or pitch_pdf_path(pitch_content['company_name'])
         
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        
-        # Create PDF document
-        doc = SimpleDocTemplate(filepath, pagesize=A4)
-        story = []
-        
-        # Title slide
-        story.append(Paragraph(company_name, self.styles['CompanyTitle']))
-        story.append(Spacer(1, 0.5*inch))
-        story.append(Paragraph("PITCH DECK", self.styles['Heading2']))
-        story.append(Spacer(1, 0.3*inch))
-        story.append(Paragraph(f"Generated on {datetime.now().strftime('%B %d, %Y')}", self.styles['Normal']))
-        story.append(PageBreak())
-        
-        # Create slides for each section
-        slide_titles = {
-            'problem': 'THE PROBLEM',
-            'solution': 'OUR SOLUTION', 
-            'market': 'MARKET OPPORTUNITY',
-            'business_model': 'BUSINESS MODEL',
-            'traction': 'TRACTION & GROWTH',
-            'competition': 'COMPETITIVE LANDSCAPE',
-            'team': 'TEAM & LEADERSHIP',
-            'financials': 'FINANCIAL PROJECTIONS',
-            'funding': 'FUNDING REQUEST'
-        }
-        
-        for section_key, section_content in pitch_content['sections'].items():
-            # Slide title
-            title = slide_titles.get(section_key, section_key.upper().replace('_', ' '))
-            story.append(Paragraph(title, self.styles['SlideTitle']))
-            story.append(Spacer(1, 0.3*inch))
-            
-            # Format content into bullet points
-            lines = section_content.split('\n')
-            for line in lines[2:]:  # Skip the section header
-                if line.strip():
-                    if line.startswith('•'):
-                        story.append(Paragraph(line, self.styles['SlideContent']))
-                    else:
-                        story.append(Paragraph(f"• {line}", self.styles['SlideContent']))
-            
-            story.append(PageBreak())
-        
-        # Thank you slide
-        story.append(Paragraph("THANK YOU", self.styles['SlideTitle']))
-        story.append(Spacer(1, 0.5*inch))
-        story.append(Paragraph("Questions & Discussion", self.styles['Heading3']))
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
         
         # Build PDF
-        doc.build(story)
-        
-        return filepath
+        return render_pitch_pdf(pitch_content, filepath)
+    
+    def create_pdf_pitch_bytes(self, responses: dict, pitch_content: Optional[Dict] = None) -> bytes:
+        """Render the PDF pitch deck in memory (nothing written to disk)"""
+        if pitch_content is None:
+            pitch_content = self.generate_pitch_content(responses)
+        return render_pitch_pdf(pitch_content)
 
 def create_complete_pitch_system():
     """Complete pitch deck creation system with both text and PDF output"""
@@ -136,7 +185,7 @@ def create_complete_pitch_system():
     
     # Generate PDF version
     try:
-        pdf_filepath = generator.create_pdf_pitch_deck(responses)
+        pdf_filepath = generator.create_pdf_pitch_deck(responses, pitch_content)
         pdf_success = True
     except Exception as e:
         print(f"⚠️ PDF generation failed: {e}")
@@ -164,14 +213,9 @@ def create_complete_pitch_system():
         'pdf_file': pdf_filepath if pdf_success else None
     }
 
-# Simple integration function
-def generate_pitch_from_data(company_data: dict) -> dict:
-    """Generate pitch deck from structured data (for API integration)"""
-    
-    generator = PDFPitchGenerator()
-    
-    # Convert structured data to responses format
-    responses = {
+def responses_from_data(company_data: dict) -> dict:
+    """Convert structured company data to the generator's responses format"""
+    return {
         'company_info': [
             company_data.get('name', 'Startup'),
             company_data.get('industry', 'Technology'),
@@ -232,15 +276,34 @@ def generate_pitch_from_data(company_data: dict) -> dict:
             company_data.get('funding_type', 'Seed funding')
         ]
     }
+
+# Simple integration function
+def generate_pitch_from_data(company_data: dict, in_memory: bool = False) -> dict:
+    """Generate pitch deck from structured data (for API integration)
+    
+    in_memory=True renders the PDF into 'pdf_bytes' instead of writing
+    the text and PDF files.
+    """
+    
+    generator = PDFPitchGenerator()
+    responses = responses_from_data(company_data)
     
     # Generate pitch content
     pitch_content = generator.generate_pitch_content(responses)
     
+    if in_memory:
+        return {
+            'success': True,
+            'company_name': pitch_content['company_name'],
+            'score': 100,
+            'pdf_bytes': generator.create_pdf_pitch_bytes(responses, pitch_content)
+        }
+    
     # Save files
     text_filepath = generator.save_pitch_deck(pitch_content)
     
     try:
-        pdf_filepath = generator.create_pdf_pitch_deck(responses)
+        pdf_filepath = generator.create_pdf_pitch_deck(responses, pitch_content)
     except:
         pdf_filepath = None
     
@@ -252,6 +315,39 @@ def generate_pitch_from_data(company_data: dict) -> dict:
         'pdf_file': pdf_filepath
     }
 
+def _render_batch_item(item) -> dict:
+    """Worker for generate_pitches_batch (top level so it can be pickled)"""
+    index, company_data, output_dir = item
+    try:
+        generator = PDFPitchGenerator()
+        responses = responses_from_data(company_data)
+        pitch_content = generator.generate_pitch_content(responses)
+        
+        # Index in the name: same-named companies in one batch don't collide
+        safe_name = pitch_content['company_name'].replace(' ', '_').replace('/', '_')
+        filepath = os.path.join(output_dir, f"pitch_deck_{safe_name}_{index:04d}.pdf")
+        generator.create_pdf_pitch_deck(responses, pitch_content, filepath)
+        
+        return {'success': True, 'company_name': pitch_content['company_name'], 'pdf_file': filepath}
+    except Exception as e:
+        return {'success': False, 'company_name': company_data.get('name', 'Startup'), 'error': str(e)}
+
+def generate_pitches_batch(companies: List[dict], output_dir: str = OUTPUT_DIR, workers: Optional[int] = None) -> List[dict]:
+    """Render PDF pitch decks for many companies on a process pool (results in input order)"""
+    
+    if not companies:
+        return []
+    
+    os.makedirs(output_dir, exist_ok=True)
+    items = [(i, company, output_dir) for i, company in enumerate(companies)]
+    
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(items) == 1:
+        return [_render_batch_item(item) for item in items]
+    
+    with ProcessPoolExecutor(max_workers=min(workers, len(items))) as pool:
+        return list(pool.map(_render_batch_item, items, chunksize=max(1, len(items) // (workers * 4))))
+
 if __name__ == "__main__":
     try:
         create_complete_pitch_system()
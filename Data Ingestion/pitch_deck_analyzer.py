@@ -4,10 +4,11 @@ AI-powered pitch deck analysis and scoring system
 Analyzes pitch decks and provides improvement recommendations
 """
 
-import re
 from typing import Dict, List, Tuple
 from ingestion.pdf_loader import load_pdf
 from ingestion.cleaner import normalize_text
+from ingestion.extraction import AMOUNT, PERCENT, USERS, get_extractor
+from ingestion.keyword_matcher import KeywordScan, get_matcher
 
 class PitchDeckAnalyzer:
     def __init__(self):
@@ -36,6 +37,21 @@ class PitchDeckAnalyzer:
             'financials': 5,
             'funding': 5
         }
+        
+        # Section-specific quality indicators
+        self.quality_indicators = {
+            'problem': ['pain', 'difficult', 'challenge', 'struggle', 'inefficient'],
+            'solution': ['solve', 'address', 'improve', 'optimize', 'innovative'],
+            'market': ['billion', 'million', 'tam', 'sam', 'som', 'cagr'],
+            'traction': ['users', 'customers', 'revenue', 'growth', '%', 'mrr', 'arr']
+        }
+        
+        # One matcher over every section keyword and indicator: a deck is
+        # scanned once instead of once per keyword per section
+        self.matcher = get_matcher(
+            [k for keywords in self.required_sections.values() for k in keywords] +
+            [i for indicators in self.quality_indicators.values() for i in indicators]
+        )
     
     def analyze_pitch_deck(self, pdf_path: str) -> Dict:
         """Analyze a pitch deck PDF and return comprehensive analysis"""
@@ -72,16 +88,16 @@ class PitchDeckAnalyzer:
     def _analyze_sections(self, text: str) -> Dict:
         """Analyze presence and quality of each section"""
         
-        text_lower = text.lower()
+        scan = self.matcher.scan(text.lower())
         section_scores = {}
         
         for section, keywords in self.required_sections.items():
             # Check if section is present
-            section_present = any(keyword in text_lower for keyword in keywords)
+            section_present = scan.any(keywords)
             
             if section_present:
                 # Calculate section quality score
-                quality_score = self._calculate_section_quality(text_lower, keywords, section)
+                quality_score = self._calculate_section_quality(scan, keywords, section)
                 section_scores[section] = {
                     'present': True,
                     'quality_score': quality_score,
@@ -96,34 +112,16 @@ class PitchDeckAnalyzer:
         
         return section_scores
     
-    def _calculate_section_quality(self, text: str, keywords: List[str], section: str) -> float:
-        """Calculate quality score for a specific section"""
+    def _calculate_section_quality(self, scan: KeywordScan, keywords: List[str], section: str) -> float:
+        """Calculate quality score for a specific section from the document scan"""
         
         # Count keyword occurrences
-        keyword_count = sum(text.count(keyword) for keyword in keywords)
+        keyword_count = scan.total(keywords)
         
-        # Section-specific quality checks
+        # Section-specific quality checks (how many indicators appear)
         quality_factors = []
-        
-        if section == 'problem':
-            # Look for problem indicators
-            problem_indicators = ['pain', 'difficult', 'challenge', 'struggle', 'inefficient']
-            quality_factors.append(sum(1 for indicator in problem_indicators if indicator in text))
-        
-        elif section == 'solution':
-            # Look for solution indicators
-            solution_indicators = ['solve', 'address', 'improve', 'optimize', 'innovative']
-            quality_factors.append(sum(1 for indicator in solution_indicators if indicator in text))
-        
-        elif section == 'market':
-            # Look for market size indicators
-            market_indicators = ['billion', 'million', 'tam', 'sam', 'som', 'cagr']
-            quality_factors.append(sum(1 for indicator in market_indicators if indicator in text))
-        
-        elif section == 'traction':
-            # Look for traction metrics
-            traction_indicators = ['users', 'customers', 'revenue', 'growth', '%', 'mrr', 'arr']
-            quality_factors.append(sum(1 for indicator in traction_indicators if indicator in text))
+        if section in self.quality_indicators:
+            quality_factors.append(scan.present(self.quality_indicators[section]))
         
         # Calculate quality score (0-1)
         base_score = min(keyword_count / 3, 1.0)  # Normalize keyword count
@@ -177,30 +175,17 @@ class PitchDeckAnalyzer:
     def _extract_metrics(self, text: str) -> Dict:
         """Extract key metrics from pitch deck"""
         
-        # Extract funding amounts
-        funding_patterns = [
-            r'(\$\d+(?:,\d+)*(?:\.\d+)?)\s*(million|billion|k)?',
-            r'(\d+(?:,\d+)*(?:\.\d+)?)\s*(million|billion)?\s*dollars?'
-        ]
-        
-        funding_amounts = []
-        for pattern in funding_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            funding_amounts.extend([f"{m[0]} {m[1]}".strip() for m in matches])
-        
-        # Extract percentages (growth, market share, etc.)
-        percentages = re.findall(r'(\d+(?:\.\d+)?%)', text)
-        
-        # Extract user/customer numbers
-        user_patterns = [
-            r'(\d+(?:,\d+)*)\s*(?:users?|customers?|clients?)',
-            r'(\d+(?:,\d+)*)\s*(?:million|thousand|k)\s*(?:users?|customers?)'
-        ]
-        
-        user_numbers = []
-        for pattern in user_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            user_numbers.extend(matches)
+        # Metrics only: no eligibility / application clause labels
+        extraction = get_extractor(eligibility_labels=(), application_labels=()).extract(text)
+        
+        # Funding amounts ($ and ₹, as written)
+        funding_amounts = [span.text for span in extraction.of(AMOUNT)]
+        
+        # Percentages (growth, market share, etc.)
+        percentages = [span.text for span in extraction.of(PERCENT)]
+        
+        # User/customer numbers
+        user_numbers = [f"{span.number} {span.unit}".strip() for span in extraction.of(USERS)]
         
         return {
             'funding_amounts': funding_amounts[:5],
@@ -5,13 +5,14 @@ Asks strategic questions and generates comprehensive pitch content
 """
 
 from typing import Dict, List
-from funding_rag_engine import FundingRAGEngine
 import json
 from datetime import datetime
 
 class PitchDeckGenerator:
     def __init__(self):
-        self.rag_engine = FundingRAGEngine()
+        # Built on first use: questions, content and PDF layout don't need
+        # the vector store or LLM client
+        self._rag_engine = None
         
         # Essential questions for each section
         self.questions = {
@@ -76,6 +77,14 @@ class PitchDeckGenerator:
             ]
         }
     
+    @property
+    def rag_engine(self):
+        """FundingRAGEngine for funding-aware content (created lazily)"""
+        if self._rag_engine is None:
+            from funding_rag_engine import FundingRAGEngine
+            self._rag_engine = FundingRAGEngine()
+        return self._rag_engine
+    
     def collect_responses(self) -> Dict:
         """Collect responses to all pitch deck questions"""
         
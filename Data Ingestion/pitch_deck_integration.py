@@ -8,6 +8,10 @@ import os
 import sys
 from typing import Dict, Optional
 
+# /batch-analyze limits: files per request, finished jobs kept for polling
+MAX_BATCH_FILES = int(os.getenv("MAX_BATCH_FILES", "50"))
+MAX_BATCH_JOBS = int(os.getenv("MAX_BATCH_JOBS", "100"))
+
 class PitchDeckAPI:
     """Simple API for pitch deck analysis and funding recommendations"""
     
@@ -112,7 +116,11 @@ def create_flask_api():
     try:
         from flask import Flask, request, jsonify
         from werkzeug.utils import secure_filename
+        import shutil
         import tempfile
+        import threading
+        import uuid
+        from concurrent.futures import ThreadPoolExecutor
     except ImportError:
         print("Flask not installed. Install with: pip install flask")
         return None
@@ -120,6 +128,12 @@ def create_flask_api():
     app = Flask(__name__)
     analyzer = PitchDeckAPI()
     
+    # Batches run one at a time off the request thread; each one already
+    # uses every core it is given, so queueing beats running them side by side
+    batch_runner = ThreadPoolExecutor(max_workers=1, thread_name_prefix='batch-analyze')
+    batch_jobs: Dict[str, Dict] = {}
+    batch_jobs_lock = threading.Lock()
+    
     @app.route('/analyze-pitch-deck', methods=['POST'])
     def analyze_pitch_deck():
         """API endpoint for pitch deck analysis"""
@@ -178,6 +192,90 @@ def create_flask_api():
             
             return jsonify(result)
     
+    def _run_batch_job(job: Dict, tmp_dir: str, tasks, order: Dict, workers: int, timeout: float):
+        """Score one uploaded batch on the worker pool (runs on batch_runner)"""
+        from batch_pitch_scoring import score_decks
+        
+        job['status'] = 'running'
+        try:
+            results = []
+            for record in score_decks(tasks, workers=workers, timeout=timeout):
+                index, filename = order[record.pop('path')]
+                results.append((index, dict(record, filename=filename)))
+                job['completed'] = len(results)
+            
+            # Report in upload order
+            results.sort(key=lambda item: item[0])
+            job['results'] = [record for _, record in results]
+            job['status'] = 'done'
+        except Exception as e:
+            job['status'] = 'failed'
+            job['error'] = str(e)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    def _forget_old_jobs():
+        """Keep at most MAX_BATCH_JOBS finished jobs (oldest dropped first)"""
+        finished = [job_id for job_id, job in batch_jobs.items() if job['status'] in ('done', 'failed')]
+        for job_id in finished[:max(0, len(finished) - MAX_BATCH_JOBS)]:
+            del batch_jobs[job_id]
+    
+    @app.route('/batch-analyze', methods=['POST'])
+    def batch_analyze():
+        """Queue many pitch decks for scoring (multipart field 'files'); poll the returned job"""
+        from batch_pitch_scoring import DEFAULT_TIMEOUT, DEFAULT_WORKERS, content_hash
+        
+        files = [f for f in request.files.getlist('files') if f.filename]
+        if not files:
+            return jsonify({'error': 'No files provided'}), 400
+        
+        if len(files) > MAX_BATCH_FILES:
+            return jsonify({'error': f'At most {MAX_BATCH_FILES} files per batch'}), 413
+        
+        if any(not f.filename.lower().endswith('.pdf') for f in files):
+            return jsonify({'error': 'Only PDF files are supported'}), 400
+        
+        # Uploads share the server's CPUs: never more workers than the default
+        workers = max(1, min(request.form.get('workers', DEFAULT_WORKERS, type=int), DEFAULT_WORKERS))
+        timeout = request.form.get('timeout', DEFAULT_TIMEOUT, type=float)
+        
+        # Files outlive the request; the job removes the directory when done
+        tmp_dir = tempfile.mkdtemp(prefix='batch_analyze_')
+        tasks, order = [], {}
+        for i, file in enumerate(files):
+            path = os.path.join(tmp_dir, f"{i}_{secure_filename(file.filename) or 'deck.pdf'}")
+            file.save(path)
+            tasks.append((path, content_hash(path)))
+            order[path] = (i, file.filename)
+        
+        job_id = uuid.uuid4().hex
+        job = {'status': 'queued', 'count': len(tasks), 'completed': 0}
+        with batch_jobs_lock:
+            _forget_old_jobs()
+            batch_jobs[job_id] = job
+        batch_runner.submit(_run_batch_job, job, tmp_dir, tasks, order, workers, timeout)
+        
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'status': job['status'],
+            'count': len(tasks),
+            'status_url': f'/batch-analyze/{job_id}'
+        }), 202
+    
+    @app.route('/batch-analyze/<job_id>', methods=['GET'])
+    def batch_status(job_id):
+        """Progress of a queued batch; results once it is done"""
+        with batch_jobs_lock:
+            job = batch_jobs.get(job_id)
+            if job is None:
+                return jsonify({'error': 'Unknown job id'}), 404
+            job = dict(job)
+        
+        response = {'success': job['status'] != 'failed', 'job_id': job_id}
+        response.update(job)
+        return jsonify(response)
+    
     return app
 
 # Simple usage examples
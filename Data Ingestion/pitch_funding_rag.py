@@ -6,9 +6,13 @@ Combines pitch deck scoring with funding database knowledge
 
 from funding_rag_engine import FundingRAGEngine
 from pitch_deck_analyzer import analyze_user_pitch_deck
-from typing import Dict, List
+from typing import Dict, List, Optional
 import os
 
+# Whole-analysis budget for the funding Q&A step (seconds)
+ANALYSIS_DEADLINE = float(os.getenv("PITCH_ANALYSIS_DEADLINE", "45"))
+MAX_CONCURRENT_QUESTIONS = int(os.getenv("PITCH_ANALYSIS_CONCURRENCY", "6"))
+
 class PitchFundingRAG:
     def __init__(self):
         self.funding_engine = FundingRAGEngine()
@@ -32,8 +36,21 @@ class PitchFundingRAG:
             }
         }
     
-    def analyze_and_recommend(self, pdf_path: str) -> Dict:
-        """Analyze pitch deck and provide comprehensive funding recommendations"""
+    def analyze_and_recommend(
+        self,
+        pdf_path: str,
+        concurrent: bool = True,
+        max_workers: int = MAX_CONCURRENT_QUESTIONS,
+        deadline: Optional[float] = ANALYSIS_DEADLINE,
+    ) -> Dict:
+        """
+        Analyze pitch deck and provide comprehensive funding recommendations.
+        
+        With concurrent=True (default) the funding questions share one
+        batched retrieval and are answered in parallel, so the Q&A step
+        takes about one LLM round trip; questions that miss `deadline`
+        come back as errors and `partial` is set on the result.
+        """
         
         # Step 1: Analyze pitch deck
         pitch_analysis = analyze_user_pitch_deck(pdf_path)
@@ -53,16 +70,22 @@ class PitchFundingRAG:
         
         # Step 4: Get RAG responses for funding questions
         funding_responses = {}
-        for question_type, question in funding_questions.items():
-            try:
-                response = self.funding_engine.ask_funding_question(question, debug=False)
-                funding_responses[question_type] = {
-                    'answer': response['answer'],
-                    'funding_details': response.get('funding_details', {}),
-                    'sources': len(response.get('references', []))
-                }
-            except Exception as e:
-                funding_responses[question_type] = {'error': str(e)}
+        if concurrent:
+            answers = self.funding_engine.ask_funding_questions(
+                funding_questions, max_workers=max_workers, deadline=deadline
+            )
+            for question_type, response in answers.items():
+                if 'error' in response:
+                    funding_responses[question_type] = response
+                else:
+                    funding_responses[question_type] = self._summarize_response(response)
+        else:
+            for question_type, question in funding_questions.items():
+                try:
+                    response = self.funding_engine.ask_funding_question(question, debug=False)
+                    funding_responses[question_type] = self._summarize_response(response)
+                except Exception as e:
+                    funding_responses[question_type] = {'error': str(e)}
         
         # Step 5: Combine analysis with recommendations
         comprehensive_result = {
@@ -73,11 +96,19 @@ class PitchFundingRAG:
             'focus_areas': self.funding_recommendations[funding_category]['focus_areas'],
             'preparation_advice': self.funding_recommendations[funding_category]['preparation'],
             'funding_information': funding_responses,
+            'partial': any(r.get('timed_out') for r in funding_responses.values()),
             'next_steps': self._generate_next_steps(pitch_analysis, funding_category)
         }
         
         return comprehensive_result
     
+    def _summarize_response(self, response: Dict) -> Dict:
+        return {
+            'answer': response['answer'],
+            'funding_details': response.get('funding_details', {}),
+            'sources': len(response.get('references', []))
+        }
+    
     def _get_funding_category(self, score: float) -> str:
         """Determine funding category based on pitch deck score"""
         if score >= 80:
@@ -0,0 +1,233 @@
+"""
+answer_cache.py
+Semantic answer cache for the RAG engine
+
+Features:
+✔ Exact hits on (normalized query, language, context fingerprint)
+✔ Paraphrase hits via content-word similarity (same language + same context)
+✔ Question word (who / when / how ...) and negation must match exactly
+✔ TTL expiry and LRU size eviction
+✔ Auto-invalidation when the vector index version changes
+✔ Thread-safe (shared by API workers)
+"""
+
+import copy
+import hashlib
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+# Function words ignored when comparing paraphrases
+STOPWORDS = {
+    "a", "an", "the", "is", "are", "was", "be", "what", "which", "who", "how",
+    "when", "where", "why", "do", "does", "can", "could", "i", "we", "my",
+    "our", "me", "you", "for", "to", "of", "in", "on", "at", "by", "with",
+    "and", "or", "any", "there", "please", "tell", "about", "some",
+    "क्या", "है", "हैं", "के", "की", "का", "में", "से", "को", "और",
+}
+
+# Question words change what is asked ("who can apply" vs "how to apply"),
+# so paraphrases must share them; what / which are the same question
+INTERROGATIVES = {
+    "what": "what", "which": "what", "who": "who", "whom": "who", "whose": "who",
+    "when": "when", "where": "where", "why": "why", "how": "how",
+    "कौन": "who", "कब": "when", "कहाँ": "where", "क्यों": "why", "कैसे": "how",
+}
+
+# "t" is what normalize_query leaves of n't (isn't, can't, don't)
+NEGATORS = {"not", "no", "never", "cannot", "without", "t", "नहीं", "न", "मत"}
+
+# Few content words make overlap cosine coarse (3 of 4 shared is 0.87):
+# short queries need a near-exact match
+SHORT_QUERY_WORDS = 4
+SHORT_QUERY_SIMILARITY = 0.95
+
+
+def normalize_query(query):
+    """Lowercase, drop punctuation/symbols, collapse whitespace (Indic-safe)"""
+    text = unicodedata.normalize("NFKC", query or "").lower()
+    text = "".join(
+        " " if unicodedata.category(ch)[0] in ("P", "S") else ch for ch in text
+    )
+    return " ".join(text.split())
+
+
+def context_fingerprint(chunks):
+    """Stable digest of the retrieved context the answer was grounded on"""
+    digest = hashlib.sha1()
+    for chunk in chunks:
+        digest.update(chunk.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class AnswerCache:
+    def __init__(
+        self,
+        version_fn=None,
+        max_entries=512,
+        ttl_seconds=3600,
+        similarity_threshold=0.85,
+    ):
+        """
+        version_fn -> () -> index version token; a change empties the cache
+        """
+        self.version_fn = version_fn
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+
+        self._entries = OrderedDict()   # key -> (value, created_at, content words)
+        self._buckets = {}              # (language, fingerprint) -> set(keys)
+        self._version = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    # -----------------------------------------
+    # Internal helpers (call with lock held)
+    # -----------------------------------------
+    def _check_version(self):
+        if self.version_fn is None:
+            return
+        try:
+            version = self.version_fn()
+        except Exception:
+            return
+        if version != self._version:
+            self._entries.clear()
+            self._buckets.clear()
+            self._version = version
+
+    def _remove(self, key):
+        self._entries.pop(key, None)
+        bucket = self._buckets.get(key[1:])
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del self._buckets[key[1:]]
+
+    def _is_fresh(self, created_at, now):
+        return self.ttl_seconds is None or now - created_at <= self.ttl_seconds
+
+    def _vectorize(self, normalized):
+        """(question words + negation, content words) or None"""
+        words = normalized.split()
+        markers = {INTERROGATIVES[w] for w in words if w in INTERROGATIVES}
+        if any(w in NEGATORS for w in words):
+            markers.add("not")
+        tokens = frozenset(
+            w for w in words if w not in STOPWORDS and w not in INTERROGATIVES and w not in NEGATORS
+        )
+        return (frozenset(markers), tokens) if tokens else None
+
+    def _similarity(self, a, b):
+        # Cosine over content-word sets, only between the same kind of question
+        if a[0] != b[0]:
+            return 0.0
+        return len(a[1] & b[1]) / (len(a[1]) * len(b[1])) ** 0.5
+
+    def _threshold(self, vector):
+        if len(vector[1]) < SHORT_QUERY_WORDS:
+            return max(self.similarity_threshold, SHORT_QUERY_SIMILARITY)
+        return self.similarity_threshold
+
+    # -----------------------------------------
+    # Public API
+    # -----------------------------------------
+    def get(self, query, language, fingerprint):
+        normalized = normalize_query(query)
+        key = (normalized, language, fingerprint)
+        now = time.time()
+
+        with self._lock:
+            self._check_version()
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._is_fresh(entry[1], now):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(entry[0])
+                self._remove(key)
+
+            candidates = list(self._buckets.get((language, fingerprint), ()))
+
+        # Paraphrase lookup: only against answers grounded on the same context
+        vector = self._vectorize(normalized) if candidates else None
+
+        with self._lock:
+            best_key, best_score = None, None
+            if vector is not None:
+                best_score = self._threshold(vector)
+                for other in candidates:
+                    entry = self._entries.get(other)
+                    if entry is None or entry[2] is None:
+                        continue
+                    if not self._is_fresh(entry[1], now):
+                        self._remove(other)
+                        continue
+                    score = self._similarity(vector, entry[2])
+                    if score >= best_score:
+                        best_key, best_score = other, score
+
+            if best_key is not None:
+                self._entries.move_to_end(best_key)
+                self.hits += 1
+                self.semantic_hits += 1
+                return copy.deepcopy(self._entries[best_key][0])
+
+            self.misses += 1
+            return None
+
+    def put(self, query, language, fingerprint, value):
+        normalized = normalize_query(query)
+        key = (normalized, language, fingerprint)
+        vector = self._vectorize(normalized)
+
+        with self._lock:
+            self._check_version()
+
+            self._remove(key)
+            self._entries[key] = (copy.deepcopy(value), time.time(), vector)
+            self._buckets.setdefault((language, fingerprint), set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "index_version": self._version,
+            }
+
+
+# -----------------------------------------
+# Manual Test
+# -----------------------------------------
+if __name__ == "__main__":
+    cache = AnswerCache()
+
+    fp = context_fingerprint(["Startup India Seed Fund Scheme ..."])
+    cache.put("What government grants are available for startups?", "en", fp, {"answer": "SISFS ..."})
+
+    print(cache.get("what government grants are available for startups", "en", fp))
+    print(cache.get("Which government grants are available for startups in India?", "en", fp))
+    print(cache.get("What government loans are available for startups?", "en", fp))
+    print(cache.get("When are government grants available for startups?", "en", fp))
+    print(cache.stats())
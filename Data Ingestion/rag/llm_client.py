@@ -8,13 +8,24 @@ Features:
 ✔ Timeout safety
 ✔ Multiple model support (LLaMA 3 / Mixtral)
 ✔ Language aware responses
+✔ Token streaming (server-sent events)
+✔ Latency spans: full completions and time to first streamed token
 """
 
 import os
+import json
 import time
 import requests
 from pathlib import Path
 
+from rag.telemetry import observe, traced
+
+LLM_FAILURE_MESSAGE = "⚠️ LLM failed after multiple attempts. Please try again."
+
+
+class LLMStreamInterrupted(Exception):
+    """A stream broke after output had started: what was yielded is truncated"""
+
 
 class LLMClient:
     def __init__(self):
@@ -33,10 +44,29 @@ class LLMClient:
         if not self.api_key:
             raise Exception("❌ GROQ_API_KEY not found. Set environment variable or create .env file.\n👉 Run: set GROQ_API_KEY=your_key_here (Windows) or export GROQ_API_KEY=your_key_here (Linux/Mac)\n👉 Or create .env file with: GROQ_API_KEY=your_key_here")
 
-        self.base_url = "https://api.groq.com/openai/v1/chat/completions"
+        # Overridable for offline runs against benchmarks/stub_servers.py
+        self.base_url = os.getenv("GROQ_API_URL", "https://api.groq.com/openai/v1/chat/completions")
         self.model = "llama-3.1-8b-instant"  # Updated to supported model
         print("LLaMA Model Ready via Groq")
 
+    def _headers(self):
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+    def _payload(self, messages, max_tokens, temperature, stream=False):
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        if stream:
+            payload["stream"] = True
+        return payload
+
+    @traced("llm.generate")
     def generate(self, messages, max_tokens=1200, temperature=0.7, retries=3):
         """
         messages = [
@@ -49,16 +79,8 @@ class LLMClient:
             try:
                 response = requests.post(
                     self.base_url,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": messages,
-                        "temperature": temperature,
-                        "max_tokens": max_tokens,
-                    },
+                    headers=self._headers(),
+                    json=self._payload(messages, max_tokens, temperature),
                     timeout=30,
                 )
 
@@ -73,7 +95,124 @@ class LLMClient:
                 print(f"⚠️ Error communicating with Groq: {e}")
                 time.sleep(1)
 
-        return "⚠️ LLM failed after multiple attempts. Please try again."
+        return LLM_FAILURE_MESSAGE
+
+    def generate_stream(self, messages, max_tokens=1200, temperature=0.7, retries=3):
+        """
+        Same contract as generate(), but yields text fragments as Groq
+        emits them instead of waiting for the full completion.
+
+        Retries only happen before the first token has been yielded;
+        once output has started, a broken stream raises
+        LLMStreamInterrupted so callers don't mistake it for a full answer.
+        """
+        requested = time.perf_counter()
+
+        for attempt in range(retries):
+            started = False
+            try:
+                with requests.post(
+                    self.base_url,
+                    headers=self._headers(),
+                    json=self._payload(messages, max_tokens, temperature, stream=True),
+                    timeout=30,
+                    stream=True,
+                ) as response:
+
+                    if response.status_code != 200:
+                        print(f"⚠️ LLM Request Failed: {response.text}")
+                        time.sleep(1)
+                        continue
+
+                    for token in iter_sse_tokens(response):
+                        if not started:
+                            observe("llm.first_token", time.perf_counter() - requested)
+                        started = True
+                        yield token
+                    return
+
+            except Exception as e:
+                print(f"⚠️ Error communicating with Groq: {e}")
+                if started:
+                    raise LLMStreamInterrupted(str(e)) from e
+                time.sleep(1)
+
+        yield LLM_FAILURE_MESSAGE
+
+
+# ---------------------------------------
+# Offline Stub (tests / local service runs)
+# ---------------------------------------
+class StubLLMClient:
+    """
+    Drop-in replacement for LLMClient that never leaves the machine.
+    Answers by quoting the start of the first context source, after an
+    optional artificial delay to mimic network latency.
+    """
+
+    def __init__(self, delay=0.0):
+        self.model = "stub"
+        self.delay = delay
+        self.calls = 0
+
+    def generate(self, messages, max_tokens=1200, temperature=0.7, retries=3):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+
+        prompt = messages[-1]["content"]
+        # Context blocks are "\n[Source n]\n<chunk>"; citations in the
+        # instructions are inline, so match on the line form.
+        marker = prompt.find("[Source 1]\n")
+        if marker == -1:
+            return "Stub answer: no context documents were provided."
+
+        chunk = prompt[marker + len("[Source 1]\n"):].split("[Source 2]\n")[0]
+        excerpt = " ".join(chunk.split()[:40])
+        return f"Stub answer based on [Source 1]: {excerpt}"
+
+    def generate_stream(self, messages, max_tokens=1200, temperature=0.7, retries=3):
+        for word in self.generate(messages).split(" "):
+            yield word + " "
+
+
+# ---------------------------------------
+# SSE Parsing
+# ---------------------------------------
+def iter_sse_tokens(response):
+    """
+    Yield content deltas from an OpenAI-compatible chat completion stream.
+
+    Each event line looks like `data: {...json...}` and the stream is
+    terminated by `data: [DONE]`; a connection closed before that raises
+    LLMStreamInterrupted.
+    """
+    # Groq does not always send a charset; Indic output must not be
+    # decoded as latin-1.
+    response.encoding = "utf-8"
+
+    for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+        if not line or not line.startswith("data:"):
+            continue
+
+        data = line[5:].strip()
+        if data == "[DONE]":
+            return
+
+        try:
+            chunk = json.loads(data)
+        except ValueError:
+            continue
+
+        choices = chunk.get("choices") or []
+        if not choices:
+            continue
+
+        token = (choices[0].get("delta") or {}).get("content")
+        if token:
+            yield token
+
+    raise LLMStreamInterrupted("stream closed before [DONE]")
 
 
 # ---------------------------------------
@@ -88,3 +227,8 @@ if __name__ == "__main__":
     ]
 
     print(llm.generate(msg))
+
+    print("\nStreaming:")
+    for token in llm.generate_stream(msg):
+        print(token, end="", flush=True)
+    print()
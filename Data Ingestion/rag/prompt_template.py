@@ -7,19 +7,149 @@ Goals:
 ✔ Avoid hallucinations
 ✔ Provide structured, useful insights
 ✔ Support Indic + English responses
+✔ Token-budgeted context packing
 """
 
+import os
+import re
 
-def build_prompt(user_query, retrieved_chunks, language="en"):
+from rag.answer_cache import STOPWORDS, normalize_query
+
+CONTEXT_TOKEN_BUDGET = int(os.getenv("RAG_CONTEXT_TOKEN_BUDGET", "1500"))
+CHUNK_TOKEN_CAP = int(os.getenv("RAG_CHUNK_TOKEN_CAP", "350"))
+MIN_PARTIAL_TOKENS = 40
+
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?।])\s+|\n+")
+HAS_FACT = re.compile(r"[0-9₹%]")
+
+
+# -----------------------------------------
+# Token Estimation
+# -----------------------------------------
+def estimate_tokens(text):
+    """
+    Cheap token estimate (no tokenizer): ~4 chars per token for Latin
+    text, ~1.5 for Indic scripts which LLaMA splits much more finely.
+    """
+    if not text:
+        return 0
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    other_chars = len(text) - ascii_chars
+    return int(ascii_chars / 4 + other_chars / 1.5) + 1
+
+
+# -----------------------------------------
+# Relevance Scoring
+# -----------------------------------------
+def _query_terms(query):
+    return {t for t in normalize_query(query).split() if t not in STOPWORDS and len(t) > 1}
+
+
+def _relevance(text, terms):
+    lowered = text.lower()
+    score = sum(1 for t in terms if t in lowered)
+    # Amounts, percentages and dates are what answers get cited for
+    if HAS_FACT.search(text):
+        score += 0.5
+    return score
+
+
+def _condense(chunk, terms, max_tokens):
+    """Keep the most query-relevant sentences of a long chunk (original order)"""
+    sentences = [s.strip() for s in SENTENCE_SPLIT.split(chunk) if s.strip()]
+    ranked = sorted(
+        range(len(sentences)),
+        key=lambda i: (-_relevance(sentences[i], terms), i),
+    )
+
+    chosen, used = [], 0
+    for i in ranked:
+        cost = estimate_tokens(sentences[i])
+        if used + cost > max_tokens:
+            continue
+        chosen.append(i)
+        used += cost
+
+    chosen.sort()
+    return " ".join(sentences[i] for i in chosen)
+
+
+def _truncate(text, max_tokens):
+    """Hard cut to max_tokens, at a word boundary when there is one"""
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid]) <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+
+    cut = text[:lo]
+    if lo < len(text) and not text[lo].isspace():
+        words = cut.rsplit(None, 1)
+        if len(words) == 2:
+            cut = words[0]
+    return cut.strip()
+
+
+# -----------------------------------------
+# Context Packer
+# -----------------------------------------
+def pack_context(user_query, chunks, token_budget=CONTEXT_TOKEN_BUDGET, chunk_cap=CHUNK_TOKEN_CAP):
+    """
+    Fit retrieved chunks into token_budget.
+
+    Chunks are ranked by query-term overlap (retrieval rank breaks ties
+    and adds a small prior), long chunks are reduced to their most
+    relevant sentences, and the best ones are packed greedily.
+
+    Returns [(original_index, text), ...] in retrieval order so the
+    [Source n] numbering still follows the retriever.
+    """
+    terms = _query_terms(user_query)
+    n = len(chunks)
+
+    ranked = sorted(
+        range(n),
+        key=lambda i: (-(_relevance(chunks[i], terms) + (n - i) / (n + 1)), i),
+    )
+
+    packed, remaining = {}, token_budget
+    for i in ranked:
+        if remaining < MIN_PARTIAL_TOKENS:
+            break
+
+        text = chunks[i]
+        cost = estimate_tokens(text)
+        limit = min(chunk_cap, remaining)
+
+        if cost > limit:
+            # No sentence fits (e.g. unpunctuated table text): truncate instead
+            text = _condense(text, terms, limit) or _truncate(text, limit)
+            cost = estimate_tokens(text)
+            if not text:
+                continue
+
+        packed[i] = text
+        remaining -= cost
+
+    return [(i, packed[i]) for i in sorted(packed)]
+
+
+def build_prompt(user_query, retrieved_chunks, language="en", token_budget=CONTEXT_TOKEN_BUDGET):
     """
     user_query: string
     retrieved_chunks: list of text chunks
     language: detected user language
+    token_budget: max context tokens; None = chunks are already packed
     """
 
-    context_block = ""
-    for i, chunk in enumerate(retrieved_chunks):
-        context_block += f"\n[Source {i+1}]\n{chunk}\n"
+    if token_budget is not None:
+        retrieved_chunks = [text for _, text in pack_context(user_query, retrieved_chunks, token_budget)]
+
+    context_block = "".join(
+        f"\n[Source {i+1}]\n{chunk}\n" for i, chunk in enumerate(retrieved_chunks)
+    )
 
     prompt = f"""You are a friendly and knowledgeable Startup Funding Intelligence Assistant. Your goal is to help users understand startup funding policies, schemes, and opportunities in a clear, conversational, and human-like manner.
 
@@ -12,20 +12,51 @@ Responsibilities:
 ✔ Prevent hallucinations
 ✔ Provide references
 ✔ Multilingual output
+✔ Token streaming (ask_stream)
+✔ Semantic answer cache (repeat / paraphrased questions skip the LLM)
+✔ Per-stage latency spans (rag/telemetry.py)
 """
 
-from vector_store.retriever import Retriever
-from rag.llm_client import LLMClient
-from rag.prompt_template import build_prompt
+import os
+
+from rag.resources import get_retriever, get_llm_client
+from rag.llm_client import LLM_FAILURE_MESSAGE
+from rag.prompt_template import build_prompt, pack_context, CONTEXT_TOKEN_BUDGET
+from rag.answer_cache import AnswerCache, context_fingerprint
+from rag.telemetry import span, traced
 
 from langdetect import detect
 
 
+STREAM_INTERRUPTED_MESSAGE = "\n\n⚠️ The response was interrupted. Please try again."
+
+NO_RESULTS_MESSAGE = "I'm sorry, but I couldn't find any relevant information in my knowledge base to answer your question. This could mean:\n\n1. The question might be outside the scope of startup funding information I have access to\n2. The knowledge base might need to be updated with more documents\n\nCould you try rephrasing your question, or ask something specifically about startup funding policies, schemes, or programs?"
+
+SYSTEM_PROMPT = "You are a friendly, knowledgeable Startup Funding Intelligence Assistant. You help people understand funding policies, schemes, and startup opportunities in a clear, conversational way. Always be honest about what you know and don't know. Answer naturally, like you're having a helpful conversation. If asked about topics outside startup funding, politely redirect to your expertise area."
+
+
+ANSWER_CACHE_ENABLED = os.getenv("RAG_ANSWER_CACHE", "1") != "0"
+ANSWER_CACHE_TTL = int(os.getenv("RAG_ANSWER_CACHE_TTL", "3600"))
+ANSWER_CACHE_SIZE = int(os.getenv("RAG_ANSWER_CACHE_SIZE", "512"))
+
+
 class RAGEngine:
-    def __init__(self):
+    def __init__(self, llm=None, retriever=None):
         print("\nInitializing RAG Engine...")
-        self.retriever = Retriever()
-        self.llm = LLMClient()
+        # Shared per process (rag/resources.py): engines don't each open Chroma
+        self.retriever = retriever if retriever is not None else get_retriever()
+        # Any object with generate()/generate_stream() works (e.g. StubLLMClient)
+        self.llm = llm if llm is not None else get_llm_client()
+
+        self.context_token_budget = CONTEXT_TOKEN_BUDGET
+
+        self.cache = None
+        if ANSWER_CACHE_ENABLED:
+            self.cache = AnswerCache(
+                version_fn=self.retriever.store.index_version,
+                max_entries=ANSWER_CACHE_SIZE,
+                ttl_seconds=ANSWER_CACHE_TTL,
+            )
         print("RAG Engine Ready")
 
     # ------------------------------------
@@ -72,20 +103,39 @@ class RAGEngine:
 
 
     # ------------------------------------
-    # MAIN FUNCTION
+    # Shared Retrieval + Prompt Stage
     # ------------------------------------
-    def ask(self, query, top_k=5, debug=False):
-        print("\nProcessing your question...")
-
+    def _no_results(self, language):
+        return {
+            "answer": NO_RESULTS_MESSAGE,
+            "language": language,
+            "references": [],
+            "status": "no_results"
+        }, language, None, [], None
+
+    def _prepare(self, query, top_k=5, debug=False, retrieved=None):
+        """
+        Runs everything up to the LLM call. `retrieved` is an optional
+        (docs, metas) pair from an earlier batched search.
+
+        Returns (early_result, language, messages, references, fingerprint).
+        When early_result is not None the question can't be answered from
+        the knowledge base and that dict should be returned as-is.
+        """
         # 1️⃣ Detect Query Language
-        language = self.detect_language(query)
+        with span("rag.detect_language"):
+            language = self.detect_language(query)
 
         if debug:
             print(f"Detected Language: {language}")
 
         # 2️⃣ Retrieve Relevant Knowledge
         try:
-            docs, metas = self.retriever.search(query, top_k=top_k)
+            if retrieved is not None:
+                docs, metas = retrieved
+            else:
+                with span("rag.retrieve"):
+                    docs, metas = self.retriever.search(query, top_k=top_k)
         except Exception as e:
             if debug:
                 print(f"Retrieval error: {e}")
@@ -94,7 +144,7 @@ class RAGEngine:
                 "language": language,
                 "references": [],
                 "status": "retrieval_error"
-            }
+            }, language, None, [], None
 
         if debug:
             print("\nRetrieved Docs:")
@@ -104,32 +154,75 @@ class RAGEngine:
 
         # 3️⃣ Check if we have any results
         if not docs or len(docs) == 0:
-            return {
-                "answer": "I'm sorry, but I couldn't find any relevant information in my knowledge base to answer your question. This could mean:\n\n1. The question might be outside the scope of startup funding information I have access to\n2. The knowledge base might need to be updated with more documents\n\nCould you try rephrasing your question, or ask something specifically about startup funding policies, schemes, or programs?",
-                "language": language,
-                "references": [],
-                "status": "no_results"
-            }
+            return self._no_results(language)
 
-        # 4️⃣ Prepare Clean Context
-        context = self.prepare_context(docs)
+        with span("rag.build_prompt"):
+            # 4️⃣ Prepare Clean Context (deduped, then packed into the token budget)
+            deduped = self.prepare_context(docs)
+            packed = pack_context(query, deduped, self.context_token_budget)
+            context = [text for _, text in packed]
+            if not packed:
+                # Nothing fit the budget - don't prompt the LLM without sources
+                return self._no_results(language)
 
-        # 5️⃣ Build RAG Prompt
-        prompt = build_prompt(query, context, language)
+            # 5️⃣ Build RAG Prompt
+            prompt = build_prompt(query, context, language, token_budget=None)
 
         messages = [
-            {"role": "system", "content": "You are a friendly, knowledgeable Startup Funding Intelligence Assistant. You help people understand funding policies, schemes, and startup opportunities in a clear, conversational way. Always be honest about what you know and don't know. Answer naturally, like you're having a helpful conversation. If asked about topics outside startup funding, politely redirect to your expertise area."},
+            {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
         ]
 
-        # 6️⃣ Call LLaMA via Groq
+        # 6️⃣ Extract References - one per [Source n] actually in the prompt
+        meta_by_text = {}
+        for d, m in zip(docs, metas):
+            if d:
+                meta_by_text.setdefault(d.strip(), m)
+
+        references = []
+        for i, _ in packed:
+            m = meta_by_text.get(deduped[i], {})
+            references.append({
+                "source_file": m.get("source_file", "unknown"),
+                "language": m.get("language", "unknown"),
+                "document_type": m.get("document_type", "unknown")
+            })
+
+        # Fingerprint the retrieved context (not the packed one, which varies with wording)
+        return None, language, messages, references, context_fingerprint(deduped)
+
+    # ------------------------------------
+    # MAIN FUNCTION
+    # ------------------------------------
+    @traced("rag.ask")
+    def ask(self, query, top_k=5, debug=False, retrieved=None):
+        print("\nProcessing your question...")
+
+        early, language, messages, references, fingerprint = self._prepare(query, top_k, debug, retrieved)
+        if early is not None:
+            return early
+
+        # Same question (or a paraphrase) over the same context -> no LLM call
+        if self.cache is not None:
+            with span("rag.cache_lookup"):
+                cached = self.cache.get(query, language, fingerprint)
+            if cached is not None:
+                if debug:
+                    print("Answer served from cache")
+                return cached
+
+        # 7️⃣ Call LLaMA via Groq
         try:
-            answer = self.llm.generate(messages)
+            with span("rag.generate"):
+                answer = self.llm.generate(messages)
             
             # Basic validation - if answer seems like an error message, handle it
             if not answer or len(answer.strip()) < 10:
                 answer = "I'm sorry, but I couldn't generate a proper response. Please try rephrasing your question or try again later."
                 status = "generation_error"
+            elif answer == LLM_FAILURE_MESSAGE:
+                # Retries exhausted - llm_client returns its notice instead of raising
+                status = "generation_error"
             else:
                 status = "success"
         except Exception as e:
@@ -138,22 +231,93 @@ class RAGEngine:
             answer = "I encountered an issue while generating a response. Please check your GROQ_API_KEY environment variable and internet connection, then try again."
             status = "generation_error"
 
-        # 7️⃣ Extract References
-        references = []
-        for m in metas[:len(context)]:  # Match references to actual context used
-            references.append({
-                "source_file": m.get("source_file", "unknown"),
-                "language": m.get("language", "unknown"),
-                "document_type": m.get("document_type", "unknown")
-            })
-
-        return {
+        result = {
             "answer": answer,
             "language": language,
             "references": references,
             "status": status
         }
 
+        if self.cache is not None and status == "success":
+            self.cache.put(query, language, fingerprint, result)
+
+        return result
+
+    # ------------------------------------
+    # STREAMING VARIANT
+    # ------------------------------------
+    def ask_stream(self, query, top_k=5, debug=False):
+        """
+        Generator version of ask().
+
+        Yields events as dicts:
+          {"type": "meta",  "language": ..., "references": [...]}
+          {"type": "token", "content": "..."}          (many)
+          {"type": "done",  "answer": ..., "status": ...}
+
+        The meta event arrives before the LLM is called so callers can
+        show sources while the answer is still being written.
+        """
+        early, language, messages, references, fingerprint = self._prepare(query, top_k, debug)
+
+        cached = None
+        if early is None and self.cache is not None:
+            cached = self.cache.get(query, language, fingerprint)
+        if cached is not None:
+            yield {"type": "meta", "language": language, "references": cached["references"]}
+            yield {"type": "token", "content": cached["answer"]}
+            yield {"type": "done", "answer": cached["answer"], "status": cached["status"]}
+            return
+
+        if early is not None:
+            yield {"type": "meta", "language": language, "references": []}
+            yield {"type": "token", "content": early["answer"]}
+            yield {"type": "done", "answer": early["answer"], "status": early["status"]}
+            return
+
+        yield {"type": "meta", "language": language, "references": references}
+
+        parts = []
+        interrupted = False
+        try:
+            for token in self.llm.generate_stream(messages):
+                parts.append(token)
+                yield {"type": "token", "content": token}
+        except Exception as e:
+            # Includes LLMStreamInterrupted: Groq dropped the connection mid-answer
+            interrupted = True
+            if debug:
+                print(f"LLM generation error: {e}")
+
+        answer = "".join(parts)
+
+        if not answer or len(answer.strip()) < 10:
+            fallback = "I'm sorry, but I couldn't generate a proper response. Please try rephrasing your question or try again later."
+            yield {"type": "token", "content": fallback}
+            yield {"type": "done", "answer": fallback, "status": "generation_error"}
+            return
+
+        if interrupted:
+            # Truncated answer: say so, and keep it out of the cache
+            yield {"type": "token", "content": STREAM_INTERRUPTED_MESSAGE}
+            yield {"type": "done", "answer": answer + STREAM_INTERRUPTED_MESSAGE, "status": "generation_error"}
+            return
+
+        if answer == LLM_FAILURE_MESSAGE:
+            # The failure notice was already streamed as a token; just flag it
+            yield {"type": "done", "answer": answer, "status": "generation_error"}
+            return
+
+        if self.cache is not None:
+            self.cache.put(query, language, fingerprint, {
+                "answer": answer,
+                "language": language,
+                "references": references,
+                "status": "success"
+            })
+
+        yield {"type": "done", "answer": answer, "status": "success"}
+
 
 
 # --------------------------------------
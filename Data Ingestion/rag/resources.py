@@ -0,0 +1,116 @@
+"""
+resources.py
+Process-wide registry of shared RAG resources
+
+One EmbeddingEngine, one VectorStore (one chromadb.PersistentClient per
+DB directory) and one LLMClient per process, handed out to every engine,
+generator and the backend's RAGRetriever instead of each building its own.
+
+Features:
+✔ Lazy, thread-safe construction (double-checked under a lock)
+✔ Same instance for every caller in the process
+✔ Explicit lifecycle: reset() for tests / after re-pointing paths, close() on shutdown
+✔ Init timings for diagnostics (stats())
+
+Usage:
+    from rag.resources import get_retriever, get_llm_client
+    retriever = get_retriever()
+"""
+
+import threading
+import time
+
+from vector_store.embedder import EmbeddingEngine
+from vector_store.store import VectorStore
+
+DEFAULT_COLLECTION = "startup_funding_knowledge"
+
+_lock = threading.RLock()
+_instances = {}
+_init_seconds = {}
+
+
+def _get_or_create(key, factory):
+    instance = _instances.get(key)
+    if instance is not None:
+        return instance
+
+    with _lock:
+        instance = _instances.get(key)
+        if instance is None:
+            start = time.perf_counter()
+            instance = factory()
+            _init_seconds[key] = time.perf_counter() - start
+            _instances[key] = instance
+        return instance
+
+
+# -----------------------------------------
+# Accessors
+# -----------------------------------------
+def get_embedder():
+    return _get_or_create("embedder", EmbeddingEngine)
+
+
+def get_vector_store(collection_name=DEFAULT_COLLECTION):
+    return _get_or_create(
+        f"store:{collection_name}", lambda: VectorStore(collection_name=collection_name)
+    )
+
+
+def get_retriever():
+    from vector_store.retriever import Retriever
+
+    return _get_or_create(
+        "retriever", lambda: Retriever(embedder=get_embedder(), store=get_vector_store())
+    )
+
+
+def get_llm_client():
+    """Shared Groq client (raises like LLMClient() if GROQ_API_KEY is missing)"""
+    from rag.llm_client import LLMClient
+
+    return _get_or_create("llm", LLMClient)
+
+
+# -----------------------------------------
+# Lifecycle
+# -----------------------------------------
+def reset():
+    """Forget every shared instance; the next accessor call rebuilds it"""
+    with _lock:
+        _instances.clear()
+        _init_seconds.clear()
+
+
+def close():
+    """Call close() on shared instances that provide one, then reset"""
+    with _lock:
+        for instance in _instances.values():
+            closer = getattr(instance, "close", None)
+            if callable(closer):
+                try:
+                    closer()
+                except Exception as e:
+                    print(f"⚠️ Failed to close {type(instance).__name__}: {e}")
+        reset()
+
+
+def stats():
+    with _lock:
+        return {
+            key: {"type": type(instance).__name__, "init_ms": round(_init_seconds[key] * 1000, 1)}
+            for key, instance in _instances.items()
+        }
+
+
+# -----------------------------------------
+# Manual Test
+# -----------------------------------------
+if __name__ == "__main__":
+    first = get_retriever()
+    second = get_retriever()
+
+    print("\nSame retriever:", first is second)
+    print("Same store:", first.store is get_vector_store())
+    print(stats())
@@ -0,0 +1,340 @@
+"""
+telemetry.py
+Lightweight latency tracing for the RAG pipeline ⏱️
+
+✔ span("stage") context manager / @traced("stage") decorator around each
+  pipeline stage (language detection, embedding, Chroma query, prompt, LLM)
+✔ One fixed-bucket histogram per stage: recording is a bisect + a few adds
+  under a lock, so it stays on in production (RAG_TRACING=0 turns it off)
+✔ p50 / p95 / p99 estimated from the buckets (same interpolation as
+  Prometheus' histogram_quantile)
+✔ Nested spans form a trace: the last RAG_TRACE_KEEP requests keep their
+  per-stage breakdown (recent_traces) to see where a slow answer went
+✔ Prometheus text exposition (render_prometheus) for /metrics endpoints
+✔ Registry is reusable: other services keep their own stage histograms
+  with the same Histogram and renderer under their own metric prefix
+
+Stage names are dotted: "rag.ask" > "rag.retrieve" > "retriever.embed" ...
+"""
+
+import os
+import threading
+from bisect import bisect_left
+from collections import deque
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+from typing import Dict, List, Optional
+
+TRACING_ENABLED = os.getenv("RAG_TRACING", "1") != "0"
+TRACE_KEEP = int(os.getenv("RAG_TRACE_KEEP", "50"))
+
+# Seconds; covers a warm cache hit (~1ms) up to a Groq retry storm
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+QUANTILES = (0.5, 0.95, 0.99)
+
+METRIC_PREFIX = "rag"
+
+
+# -----------------------------------------
+# Histogram
+# -----------------------------------------
+class Histogram:
+    """Fixed-bucket latency histogram (thread-safe)"""
+
+    __slots__ = ("bounds", "counts", "count", "sum", "min", "max", "errors", "_lock")
+
+    def __init__(self, bounds=DEFAULT_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, error: bool = False):
+        i = bisect_left(self.bounds, seconds)
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.sum += seconds
+            if seconds < self.min:
+                self.min = seconds
+            if seconds > self.max:
+                self.max = seconds
+            if error:
+                self.errors += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate from the bucket counts, interpolating inside the bucket
+        (narrowed to the observed min / max)"""
+        with self._lock:
+            counts, total = list(self.counts), self.count
+            observed_min, observed_max = self.min, self.max
+        if not total:
+            return 0.0
+
+        rank = q * total
+        seen = 0
+        for i, hits in enumerate(counts):
+            if hits and seen + hits >= rank:
+                if i == len(self.bounds):
+                    return observed_max  # +Inf bucket: the largest value seen
+                lower = max(self.bounds[i - 1] if i else 0.0, observed_min)
+                upper = min(self.bounds[i], observed_max)
+                return lower + (upper - lower) * (rank - seen) / hits
+            seen += hits
+        return observed_max
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            count, total, errors, observed_max = self.count, self.sum, self.errors, self.max
+        summary = {
+            "count": count,
+            "errors": errors,
+            "avg_ms": round(1000 * total / count, 2) if count else 0.0,
+            "max_ms": round(1000 * observed_max, 2),
+        }
+        for q in QUANTILES:
+            summary[f"p{int(q * 100)}_ms"] = round(1000 * self.quantile(q), 2)
+        return summary
+
+
+# -----------------------------------------
+# Registry
+# -----------------------------------------
+class Registry:
+    """Named stage histograms (thread-safe)"""
+
+    def __init__(self):
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str) -> Histogram:
+        hist = self._histograms.get(name)
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(name, Histogram())
+        return hist
+
+    def items(self):
+        with self._lock:
+            return sorted(self._histograms.items())
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """stage -> count / errors / avg / max / p50 / p95 / p99 (milliseconds)"""
+        return {name: hist.snapshot() for name, hist in self.items()}
+
+    def clear(self):
+        with self._lock:
+            self._histograms.clear()
+
+    def render_prometheus(self, prefix: str = METRIC_PREFIX, pipeline: str = "RAG") -> str:
+        """Text exposition format (version 0.0.4) of every stage histogram"""
+        return _render_histograms(self.items(), prefix, pipeline)
+
+
+_registry = Registry()
+_recent = deque(maxlen=TRACE_KEEP)
+
+histogram = _registry.histogram
+
+
+def observe(name: str, seconds: float, error: bool = False):
+    """Record a duration measured elsewhere (e.g. time to first token)"""
+    if TRACING_ENABLED:
+        histogram(name).observe(seconds, error)
+
+
+def snapshot() -> Dict[str, Dict]:
+    """stage -> count / errors / avg / max / p50 / p95 / p99 (milliseconds)"""
+    return _registry.snapshot()
+
+
+def recent_traces(limit: int = 10) -> List[Dict]:
+    """Newest first: total time and the stage breakdown of each request"""
+    traces = list(_recent)[-limit:] if limit else []
+    return [trace.as_dict() for trace in reversed(traces)]
+
+
+def reset():
+    _registry.clear()
+    _recent.clear()
+
+
+# -----------------------------------------
+# Spans
+# -----------------------------------------
+class _Trace:
+    __slots__ = ("name", "start", "depth", "seconds", "stages")
+
+    def __init__(self, name: str, start: float):
+        self.name = name
+        self.start = start
+        self.depth = 0
+        self.seconds = 0.0
+        self.stages = []  # (name, depth, offset, seconds) in completion order
+
+    def as_dict(self) -> Dict:
+        stages = sorted(self.stages, key=lambda s: s[2])  # start order
+        return {
+            "name": self.name,
+            "ms": round(1000 * self.seconds, 2),
+            "stages": [
+                {"name": name, "depth": depth, "offset_ms": round(1000 * offset, 2), "ms": round(1000 * seconds, 2)}
+                for name, depth, offset, seconds in stages
+            ],
+        }
+
+
+_current_trace: ContextVar[Optional[_Trace]] = ContextVar("rag_trace", default=None)
+
+
+class _Span:
+    __slots__ = ("name", "start", "depth", "trace", "token")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter()
+        trace = _current_trace.get()
+        if trace is None:
+            # Outermost span of this thread / task starts a new trace
+            trace = _Trace(self.name, self.start)
+            self.token = _current_trace.set(trace)
+        else:
+            self.token = None
+        self.trace = trace
+        self.depth = trace.depth
+        trace.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = perf_counter() - self.start
+        histogram(self.name).observe(seconds, exc_type is not None)
+
+        trace = self.trace
+        trace.depth -= 1
+        trace.stages.append((self.name, self.depth, self.start - trace.start, seconds))
+        if self.token is not None:
+            trace.seconds = seconds
+            _current_trace.reset(self.token)
+            _recent.append(trace)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def span(name: str):
+    """with span("rag.retrieve"): ... - time the block into the stage histogram"""
+    return _Span(name) if TRACING_ENABLED else _NOOP
+
+
+def traced(name: str):
+    """Decorator form of span() for whole functions / methods"""
+    def decorator(func):
+        if not TRACING_ENABLED:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# -----------------------------------------
+# Prometheus Exposition
+# -----------------------------------------
+def _format_le(bound: float) -> str:
+    return repr(float(bound))
+
+
+def _render_histograms(hists, prefix: str, pipeline: str) -> str:
+    duration = f"{prefix}_stage_duration_seconds"
+    quantile = f"{prefix}_stage_duration_quantile_seconds"
+    errors = f"{prefix}_stage_errors_total"
+
+    lines = [
+        f"# HELP {duration} Latency of each {pipeline} pipeline stage.",
+        f"# TYPE {duration} histogram",
+    ]
+    for name, hist in hists:
+        with hist._lock:
+            counts, total, count = list(hist.counts), hist.sum, hist.count
+        cumulative = 0
+        for bound, hits in zip(hist.bounds, counts):
+            cumulative += hits
+            lines.append(f'{duration}_bucket{{stage="{name}",le="{_format_le(bound)}"}} {cumulative}')
+        lines.append(f'{duration}_bucket{{stage="{name}",le="+Inf"}} {count}')
+        lines.append(f'{duration}_sum{{stage="{name}"}} {total!r}')
+        lines.append(f'{duration}_count{{stage="{name}"}} {count}')
+
+    lines += [
+        f"# HELP {quantile} In-process p50/p95/p99 estimate of each stage latency.",
+        f"# TYPE {quantile} gauge",
+    ]
+    for name, hist in hists:
+        for q in QUANTILES:
+            lines.append(f'{quantile}{{stage="{name}",quantile="{q}"}} {hist.quantile(q)!r}')
+
+    lines += [
+        f"# HELP {errors} Stage executions that raised.",
+        f"# TYPE {errors} counter",
+    ]
+    for name, hist in hists:
+        lines.append(f'{errors}{{stage="{name}"}} {hist.errors}')
+
+    return "\n".join(lines) + "\n"
+
+
+def render_prometheus(prefix: str = METRIC_PREFIX) -> str:
+    """Text exposition format (version 0.0.4) of the RAG stage histograms"""
+    return _registry.render_prometheus(prefix)
+
+
+# -----------------------------------------
+# Manual Test
+# -----------------------------------------
+if __name__ == "__main__":
+    import time
+
+    @traced("demo.llm")
+    def fake_llm():
+        time.sleep(0.02)
+
+    for _ in range(20):
+        with span("demo.ask"):
+            with span("demo.retrieve"):
+                time.sleep(0.002)
+            fake_llm()
+
+    loops = 100000
+    start = perf_counter()
+    for _ in range(loops):
+        with span("demo.overhead"):
+            pass
+    print(f"Span overhead: {1e6 * (perf_counter() - start) / loops:.2f} µs")
+
+    for name, stats in snapshot().items():
+        print(name, stats)
+    print(recent_traces(1))
+    print(render_prometheus())
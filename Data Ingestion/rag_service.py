@@ -0,0 +1,413 @@
+"""
+rag_service.py
+Long-lived RAG worker service ⚡
+
+Keeps one warm FundingRAGEngine (Retriever + VectorStore + LLMClient)
+in memory and serves it over local HTTP, so callers (server/rag-service.ts)
+pay only retrieval + LLM time per question instead of a Python cold start.
+
+Endpoints (JSON):
+✔ GET  /health   -> liveness + index size
+✔ GET  /stats    -> request counts, latencies, cache stats, per-stage p50/p95/p99
+✔ GET  /metrics  -> per-stage latency histograms (Prometheus text format)
+✔ POST /ask      -> {"question", "mode": "general"|"funding", "top_k"}
+✔ POST /search   -> {"query", "top_k"}
+✔ POST /ingest   -> {"type": "pdf", "path"} | {"type": "website", "url"}
+✔ POST /build    -> full vector DB rebuild from data/chunks
+
+Concurrency:
+✔ One thread per connection (ThreadingHTTPServer)
+✔ Questions bounded by a semaphore (RAG_SERVICE_MAX_CONCURRENT)
+✔ Index writes (ingest/build) serialized by a lock
+
+Run:
+    python rag_service.py                 # port 8765 (RAG_SERVICE_PORT)
+    python rag_service.py --stub-llm      # no GROQ_API_KEY needed
+    python rag_service.py --selftest      # spin up + exercise with the client
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BASE_DIR)
+
+from rag import telemetry  # noqa: E402
+
+DEFAULT_HOST = os.getenv("RAG_SERVICE_HOST", "127.0.0.1")
+DEFAULT_PORT = int(os.getenv("RAG_SERVICE_PORT", "8765"))
+MAX_CONCURRENT = int(os.getenv("RAG_SERVICE_MAX_CONCURRENT", "8"))
+
+
+# -----------------------------------------
+# Service (transport independent)
+# -----------------------------------------
+class RAGService:
+    def __init__(self, engine=None, llm=None, max_concurrent=MAX_CONCURRENT):
+        if engine is None:
+            from funding_rag_engine import FundingRAGEngine
+            engine = FundingRAGEngine(llm=llm)
+
+        self.engine = engine
+        self.started_at = time.time()
+
+        self._ask_slots = threading.BoundedSemaphore(max_concurrent)
+        self._write_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {}
+        self._in_flight = 0
+
+    # ---------- bookkeeping ----------
+    def _record(self, endpoint, seconds, ok):
+        with self._stats_lock:
+            entry = self._stats.setdefault(
+                endpoint, {"count": 0, "errors": 0, "total_s": 0.0, "max_s": 0.0}
+            )
+            entry["count"] += 1
+            entry["errors"] += 0 if ok else 1
+            entry["total_s"] += seconds
+            entry["max_s"] = max(entry["max_s"], seconds)
+
+    def _timed(self, endpoint, func, *args):
+        start = time.perf_counter()
+        ok = False
+        try:
+            result = func(*args)
+            ok = True
+            return result
+        finally:
+            self._record(endpoint, time.perf_counter() - start, ok)
+
+    # ---------- operations ----------
+    def ask(self, question, mode="general", top_k=5):
+        if not question or not question.strip():
+            raise ValueError("question is required")
+
+        def run():
+            with self._ask_slots:
+                with self._stats_lock:
+                    self._in_flight += 1
+                try:
+                    if mode == "funding":
+                        return self.engine.ask_funding_question(question)
+                    return self.engine.ask(question, top_k=top_k)
+                finally:
+                    with self._stats_lock:
+                        self._in_flight -= 1
+
+        return self._timed("ask", run)
+
+    def search(self, query, top_k=5):
+        if not query or not query.strip():
+            raise ValueError("query is required")
+
+        def run():
+            docs, metas = self.engine.retriever.search(query, top_k=top_k)
+            return {
+                "success": True,
+                "results": [{"content": d, "metadata": m} for d, m in zip(docs, metas)],
+            }
+
+        return self._timed("search", run)
+
+    def ingest_pdf(self, path):
+        from ingestion.pipeline import process_pdf
+        from app import ensure_dirs, save_chunks
+        from vector_store.build_store import index_document
+
+        if not path or not os.path.exists(path):
+            raise ValueError(f"PDF not found: {path}")
+
+        def run():
+            result = process_pdf(path)
+            with self._write_lock:
+                ensure_dirs()
+                chunk_path = save_chunks(os.path.basename(path), result["chunks"], result["metadata"])
+                indexed = index_document(
+                    os.path.basename(chunk_path), result["chunks"], result["metadata"],
+                    self.engine.retriever.embedder, self.engine.retriever.store,
+                )
+            return {
+                "success": True,
+                "message": "PDF processed and indexed",
+                "chunks": len(result["chunks"]),
+                "indexed": indexed,
+                "language": result["language"],
+            }
+
+        return self._timed("ingest", run)
+
+    def ingest_website(self, url):
+        from ingestion.pipeline import process_websites
+        from app import ensure_dirs, save_web_chunks
+        from vector_store.build_store import index_document
+
+        if not url:
+            raise ValueError("url is required")
+
+        def run():
+            results = process_websites([url])
+            if not results:
+                return {"success": False, "message": "Failed to process website"}
+
+            result = results[0]
+            with self._write_lock:
+                ensure_dirs()
+                chunk_path = save_web_chunks(result["url_hash"], result["title"], result["chunks"], result["metadata"])
+                indexed = index_document(
+                    os.path.basename(chunk_path), result["chunks"], result["metadata"],
+                    self.engine.retriever.embedder, self.engine.retriever.store,
+                )
+            return {
+                "success": True,
+                "message": "Website processed and indexed",
+                "chunks": len(result["chunks"]),
+                "indexed": indexed,
+                "language": result["language"],
+            }
+
+        return self._timed("ingest", run)
+
+    def build(self):
+        from vector_store.build_store import build_vector_database
+
+        def run():
+            with self._write_lock:
+                summary = build_vector_database(self.engine.retriever.embedder, self.engine.retriever.store)
+            return {"success": True, "message": "Vector database built successfully", "summary": summary}
+
+        return self._timed("build", run)
+
+    def health(self):
+        store = self.engine.retriever.store
+        return {
+            "status": "healthy" if store.health() else "degraded",
+            "documents": store.count(),
+            "index_version": store.index_version(),
+            "model": getattr(self.engine.llm, "model", "unknown"),
+        }
+
+    def stats(self):
+        with self._stats_lock:
+            endpoints = {
+                name: {
+                    "count": e["count"],
+                    "errors": e["errors"],
+                    "avg_ms": round(1000 * e["total_s"] / e["count"], 1) if e["count"] else 0.0,
+                    "max_ms": round(1000 * e["max_s"], 1),
+                }
+                for name, e in self._stats.items()
+            }
+            in_flight = self._in_flight
+
+        cache = self.engine.cache.stats() if getattr(self.engine, "cache", None) else None
+        return {
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "in_flight": in_flight,
+            "endpoints": endpoints,
+            "answer_cache": cache,
+            "stages": telemetry.snapshot(),
+            "recent_traces": telemetry.recent_traces(5),
+        }
+
+    def metrics(self):
+        return telemetry.render_prometheus()
+
+
+# -----------------------------------------
+# HTTP Transport
+# -----------------------------------------
+class _Handler(BaseHTTPRequestHandler):
+    service = None  # set by make_server()
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args):
+        pass  # keep stdout for engine logs
+
+    def _send(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_text(self, status, text, content_type="text/plain; version=0.0.4; charset=utf-8"):
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length).decode("utf-8"))
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, self.service.health())
+        elif self.path == "/stats":
+            self._send(200, self.service.stats())
+        elif self.path == "/metrics":
+            self._send_text(200, self.service.metrics())
+        else:
+            self._send(404, {"error": f"Unknown endpoint {self.path}", "status": "error"})
+
+    def do_POST(self):
+        try:
+            data = self._body()
+
+            if self.path == "/ask":
+                result = self.service.ask(
+                    data.get("question", ""),
+                    mode=data.get("mode", "general"),
+                    top_k=int(data.get("top_k", 5)),
+                )
+            elif self.path == "/search":
+                result = self.service.search(data.get("query", ""), top_k=int(data.get("top_k", 5)))
+            elif self.path == "/ingest":
+                if data.get("type") == "website":
+                    result = self.service.ingest_website(data.get("url"))
+                else:
+                    result = self.service.ingest_pdf(data.get("path"))
+            elif self.path == "/build":
+                result = self.service.build()
+            else:
+                self._send(404, {"error": f"Unknown endpoint {self.path}", "status": "error"})
+                return
+
+            self._send(200, result)
+
+        except ValueError as e:
+            self._send(400, {"error": str(e), "status": "error"})
+        except Exception as e:
+            print(f"❌ rag_service {self.path} failed: {type(e).__name__}: {e}")
+            self._send(500, {"error": str(e), "status": "error"})
+
+
+def make_server(service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    handler = type("RAGServiceHandler", (_Handler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+# -----------------------------------------
+# Local Client
+# -----------------------------------------
+class RAGServiceClient:
+    def __init__(self, base_url=f"http://{DEFAULT_HOST}:{DEFAULT_PORT}", timeout=120):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def _call(self, method, path, payload=None):
+        data = None if payload is None else json.dumps(payload).encode("utf-8")
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=data,
+            method=method,
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            return json.loads(e.read().decode("utf-8"))
+
+    def health(self):
+        return self._call("GET", "/health")
+
+    def stats(self):
+        return self._call("GET", "/stats")
+
+    def metrics(self):
+        with urllib.request.urlopen(self.base_url + "/metrics", timeout=self.timeout) as response:
+            return response.read().decode("utf-8")
+
+    def ask(self, question, mode="general", top_k=5):
+        return self._call("POST", "/ask", {"question": question, "mode": mode, "top_k": top_k})
+
+    def search(self, query, top_k=5):
+        return self._call("POST", "/search", {"query": query, "top_k": top_k})
+
+    def ingest_pdf(self, path):
+        return self._call("POST", "/ingest", {"type": "pdf", "path": path})
+
+    def ingest_website(self, url):
+        return self._call("POST", "/ingest", {"type": "website", "url": url})
+
+    def build(self):
+        return self._call("POST", "/build")
+
+
+# -----------------------------------------
+# Self Test (stub LLM, ephemeral port)
+# -----------------------------------------
+def selftest():
+    from concurrent.futures import ThreadPoolExecutor
+    from rag.llm_client import StubLLMClient
+
+    service = RAGService(llm=StubLLMClient(delay=0.3))
+    server = make_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = RAGServiceClient(f"http://127.0.0.1:{server.server_port}")
+
+    print("\nHealth:", client.health())
+
+    questions = [f"What seed funding schemes exist for startups? ({i})" for i in range(8)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        answers = list(pool.map(client.ask, questions))
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{len(answers)} parallel questions in {elapsed:.2f}s "
+          f"(stub LLM latency 0.30s each)")
+    print("Statuses:", [a.get("status") for a in answers])
+    print("Stats:", json.dumps(client.stats(), indent=2))
+    print("Metrics:", len(client.metrics().splitlines()), "lines")
+
+    server.shutdown()
+
+
+# -----------------------------------------
+# Entry Point
+# -----------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Warm RAG worker service")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--stub-llm", action="store_true", help="answer without calling Groq")
+    parser.add_argument("--selftest", action="store_true", help="run a local client against a stub service")
+    args = parser.parse_args()
+
+    # Data paths (data/vector_db, data/chunks) are relative to this folder
+    os.chdir(BASE_DIR)
+
+    if args.selftest:
+        selftest()
+        sys.exit(0)
+
+    llm = None
+    if args.stub_llm:
+        from rag.llm_client import StubLLMClient
+        llm = StubLLMClient()
+
+    service = RAGService(llm=llm)
+    server = make_server(service, args.host, args.port)
+    print(f"\n🚀 RAG service listening on http://{args.host}:{args.port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down RAG service")
+        server.shutdown()
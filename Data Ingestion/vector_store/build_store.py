@@ -1,52 +1,42 @@
 """
 build_store.py
 Creates Vector Database from chunk JSON files
+
+✔ Incremental: a manifest of chunk-file hashes skips unchanged files
+✔ Files removed from data/chunks are removed from the index
+✔ Optional progress callback (used by the backend build job)
+✔ --profile: per-file read / embed / upsert timings (ingestion/profiler.py)
 """
 
 import os
 import sys
 import json
+import time
+import hashlib
+import argparse
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from vector_store.embedder import EmbeddingEngine
-from vector_store.store import VectorStore
-
-CHUNK_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "chunks")
-
-
-def build_vector_database():
-    embedder = EmbeddingEngine()
-    store = VectorStore()
-
-    files = [f for f in os.listdir(CHUNK_DIR) if f.endswith(".json")]
+from ingestion.profiler import DUMP_ENGINES, profile_run, profile_stage
 
-    if not files:
-        print("No chunk files found in data/chunks/")
-        print("First run: python app.py to generate chunks")
-        return
-
-    total_chunks_indexed = 0
-
-    for file in files:
-        path = os.path.join(CHUNK_DIR, file)
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        metadata = data["metadata"]
-        chunks = data["chunks"]
+CHUNK_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "chunks")
+MANIFEST_NAME = "build_manifest.json"
 
-        print(f"\nIndexing File: {file}")
-        print(f"Total Chunks: {len(chunks)}")
 
-        ids = []
-        texts = []
-        embeddings = []
-        metadatas = []
+def index_document(file_name, chunks, metadata, embedder, store):
+    """
+    Embed and upsert one chunk file's chunks.
+    Ids are f"{file_name}_{index}", so re-indexing the same file replaces
+    its chunks instead of duplicating them. Returns chunks indexed.
+    """
+    ids = []
+    texts = []
+    embeddings = []
+    metadatas = []
 
-        valid_chunk_count = 0
+    with profile_stage("embed", file_name, chunks) as stage:
         for index, chunk in enumerate(chunks):
             # Skip empty chunks
             if not chunk or not chunk.strip():
@@ -58,29 +48,150 @@ def build_vector_database():
             if emb.size == 0:
                 continue
 
-            ids.append(f"{file}_{index}")
+            ids.append(f"{file_name}_{index}")
             texts.append(chunk)
             embeddings.append(emb.tolist())
 
             metadatas.append(
                 {
-                    "source_file": file,
+                    "source_file": file_name,
                     "language": metadata.get("language", "unknown"),
                     "document_type": metadata.get("document_type", "unknown"),
                 }
             )
-            valid_chunk_count += 1
+        stage.done(items=len(ids))
 
+    with profile_stage("upsert", file_name, texts) as stage:
         if ids:  # Only add if there are valid chunks
-            store.add_documents_batch(ids, texts, embeddings, metadatas)
+            store.upsert_documents_batch(ids, texts, embeddings, metadatas)
+
+        # Drop chunks left over from a longer previous version of the file
+        store.delete_by_source(file_name, keep_ids=ids)
+        stage.done(items=len(ids))
+
+    return len(ids)
+
+
+# -----------------------------------------
+# Build Manifest (chunk file -> content hash)
+# -----------------------------------------
+def _manifest_path():
+    # Lives next to the Chroma files it describes
+    from vector_store.store import CHROMA_DB_PATH
+    return os.path.join(CHROMA_DB_PATH, MANIFEST_NAME)
+
+
+def load_manifest():
+    try:
+        with open(_manifest_path(), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
 
-        total_chunks_indexed += valid_chunk_count
+def save_manifest(manifest):
+    path = _manifest_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def build_vector_database(embedder=None, store=None, rebuild=False, progress=None):
+    """
+    Index every chunk file in data/chunks.
+    Unless rebuild=True, files whose content hash matches the manifest are
+    skipped. progress(done, total, file_name) is called after each file.
+    Returns a summary dict.
+    """
+    # Default to the process-wide instances so a running service indexes
+    # through the same Chroma client it queries with
+    from rag.resources import get_embedder, get_vector_store
+
+    embedder = embedder if embedder is not None else get_embedder()
+    store = store if store is not None else get_vector_store()
+    started = time.time()
+
+    files = sorted(f for f in os.listdir(CHUNK_DIR) if f.endswith(".json")) if os.path.isdir(CHUNK_DIR) else []
+
+    if not files:
+        print("No chunk files found in data/chunks/")
+        print("First run: python app.py to generate chunks")
+
+    # An empty collection means the manifest no longer describes it
+    previous = load_manifest()
+    manifest = {} if rebuild or store.count() == 0 else previous
+    new_manifest = {}
+
+    summary = {
+        "files_total": len(files),
+        "files_indexed": 0,
+        "files_skipped": 0,
+        "files_removed": 0,
+        "document_files": 0,
+        "website_files": 0,
+        "chunks_indexed": 0,
+        "total_words": 0,
+        "rebuild": rebuild,
+    }
+
+    for done, file in enumerate(files, 1):
+        path = os.path.join(CHUNK_DIR, file)
+
+        with profile_stage("read_chunks", file) as stage:
+            with open(path, "rb") as f:
+                raw = f.read()
+            digest = hashlib.sha1(raw).hexdigest()
+            data = json.loads(raw.decode("utf-8"))
+            stage.done(items=len(data["chunks"]), bytes_in=len(raw))
+
+        metadata = data["metadata"]
+        chunks = data["chunks"]
+
+        summary["website_files" if file.endswith("_web_chunks.json") else "document_files"] += 1
+        summary["total_words"] += sum(len(chunk.split()) for chunk in chunks)
+
+        if manifest.get(file) == digest:
+            summary["files_skipped"] += 1
+        else:
+            print(f"\nIndexing File: {file}")
+            print(f"Total Chunks: {len(chunks)}")
+
+            summary["chunks_indexed"] += index_document(file, chunks, metadata, embedder, store)
+            summary["files_indexed"] += 1
+
+        new_manifest[file] = digest
+        if progress:
+            progress(done, len(files), file)
+
+    # Chunk files deleted since the last build (also on rebuild)
+    for file in set(previous) - set(new_manifest):
+        store.delete_by_source(file)
+        summary["files_removed"] += 1
+
+    save_manifest(new_manifest)
+
+    summary["total_records"] = store.count()
+    summary["seconds"] = round(time.time() - started, 2)
 
     print("\nVector DB Build Completed")
-    print(f"Total Chunks Indexed: {total_chunks_indexed}")
-    print(f"Total Records in DB: {store.count()}")
+    print(f"Files Indexed: {summary['files_indexed']} (skipped unchanged: {summary['files_skipped']}, removed: {summary['files_removed']})")
+    print(f"Total Chunks Indexed: {summary['chunks_indexed']}")
+    print(f"Total Records in DB: {summary['total_records']}")
+    return summary
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the startup funding vector database")
+    parser.add_argument("--rebuild", action="store_true", help="re-index every file, ignoring the manifest")
+    parser.add_argument("--profile", action="store_true", help="write a per-stage timing report (data/profiles)")
+    parser.add_argument("--profile-dump", choices=DUMP_ENGINES, help="also dump a cProfile / pyinstrument profile")
+    args = parser.parse_args()
+
     print("Building Startup Funding Vector Database")
-    build_vector_database()
+    if args.profile or args.profile_dump:
+        with profile_run("build_vector_database", dump=args.profile_dump):
+            build_vector_database(rebuild=args.rebuild)
+    else:
+        build_vector_database(rebuild=args.rebuild)
@@ -11,18 +11,25 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from vector_store.embedder import EmbeddingEngine
 from vector_store.store import VectorStore
+from rag.telemetry import span, traced
 
 
 class Retriever:
-    def __init__(self):
+    def __init__(self, embedder=None, store=None):
+        """
+        Pass shared instances (see rag.resources.get_retriever) to avoid a
+        second embedder / Chroma client in the same process.
+        """
         print("Initializing Retriever...")
-        self.embedder = EmbeddingEngine()
-        self.store = VectorStore()
+        self.embedder = embedder if embedder is not None else EmbeddingEngine()
+        self.store = store if store is not None else VectorStore()
         print("Retriever Ready")
 
+    @traced("retriever.search")
     def search(self, query: str, top_k: int = 5, filter_by=None):
         print("\nSearching Knowledge Base...")
-        query_emb = self.embedder.get_embedding(query)
+        with span("retriever.embed"):
+            query_emb = self.embedder.get_embedding(query)
 
         results = self.store.query(
             query_embedding=query_emb.tolist(), top_k=top_k, filter_metadata=filter_by
@@ -33,6 +40,25 @@ class Retriever:
 
         return docs, metas
 
+    @traced("retriever.search_batch")
+    def search_batch(self, queries, top_k: int = 5, filter_by=None):
+        """
+        Retrieve for several queries in one vector-store call.
+        Returns a list of (docs, metas), one per query, in input order.
+        """
+        if not queries:
+            return []
+
+        print(f"\nSearching Knowledge Base ({len(queries)} queries)...")
+        with span("retriever.embed_batch"):
+            embeddings = [self.embedder.get_embedding(q).tolist() for q in queries]
+
+        results = self.store.query_batch(
+            query_embeddings=embeddings, top_k=top_k, filter_metadata=filter_by
+        )
+
+        return list(zip(results["documents"], results["metadatas"]))
+
 
 if __name__ == "__main__":
     retriever = Retriever()
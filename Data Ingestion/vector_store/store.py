@@ -6,16 +6,29 @@ Features:
 ✔ Persistent DB storage
 ✔ Cosine similarity search
 ✔ Add / Update documents
-✔ Delete documents
+✔ Delete documents (by id or by source file)
 ✔ Metadata filtering
 ✔ Health check
 ✔ Safe indexing
+✔ Index version stamp (lets caches notice re-indexing)
+✔ Thread-safe writes (one shared store per process, see rag/resources.py)
+✔ Query latency spans (rag/telemetry.py)
 """
 
+import os
+import sys
+import time
+import threading
 import chromadb
 from typing import List, Dict
 
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rag.telemetry import traced
+
 CHROMA_DB_PATH = "data/vector_db"
+INDEX_VERSION_FILE = os.path.join(CHROMA_DB_PATH, "index_version")
 
 
 class VectorStore:
@@ -29,9 +42,42 @@ class VectorStore:
             metadata={"hnsw:space": "cosine"},  # ensures similarity accuracy
         )
 
+        self._version_cache = (None, "0")
+        # Chroma's SQLite backend allows one writer at a time; serialize
+        # writes from threads sharing this store instead of hitting lock errors
+        self._write_lock = threading.RLock()
+
         print("Vector DB Ready & Persistent")
         print(f"Collection: {collection_name}")
 
+    # -----------------------------------------
+    # Index Version
+    # -----------------------------------------
+    def index_version(self):
+        """
+        Opaque token that changes whenever the index is written to
+        (by this process or any other one sharing CHROMA_DB_PATH).
+        Costs one stat() call when nothing changed.
+        """
+        try:
+            mtime = os.stat(INDEX_VERSION_FILE).st_mtime_ns
+        except OSError:
+            return "0"
+
+        if self._version_cache[0] != mtime:
+            try:
+                with open(INDEX_VERSION_FILE, "r", encoding="utf-8") as f:
+                    self._version_cache = (mtime, f.read().strip() or "0")
+            except OSError:
+                return "0"
+
+        return self._version_cache[1]
+
+    def _bump_version(self):
+        os.makedirs(CHROMA_DB_PATH, exist_ok=True)
+        with open(INDEX_VERSION_FILE, "w", encoding="utf-8") as f:
+            f.write(str(time.time_ns()))
+
     # -----------------------------------------
     # Health Check
     # -----------------------------------------
@@ -52,44 +98,71 @@ class VectorStore:
             print("Skipping invalid entry")
             return
 
-        self.collection.add(
-            ids=[chunk_id],
-            documents=[text],
-            embeddings=[embedding],
-            metadatas=[metadata],
-        )
+        with self._write_lock:
+            self.collection.add(
+                ids=[chunk_id],
+                documents=[text],
+                embeddings=[embedding],
+                metadatas=[metadata],
+            )
+            self._bump_version()
 
     # -----------------------------------------
     # Batch Insertion
     # -----------------------------------------
     def add_documents_batch(self, ids, texts, embeddings, metadatas):
-        self.collection.add(
-            ids=ids, documents=texts, embeddings=embeddings, metadatas=metadatas
-        )
+        with self._write_lock:
+            self.collection.add(
+                ids=ids, documents=texts, embeddings=embeddings, metadatas=metadatas
+            )
+            self._bump_version()
 
     # -----------------------------------------
     # UPSERT (Update if Exists)
     # -----------------------------------------
     def upsert_document(self, chunk_id, text, embedding, metadata):
-        try:
-            self.collection.update(
-                ids=[chunk_id],
-                documents=[text],
-                embeddings=[embedding],
-                metadatas=[metadata],
+        with self._write_lock:
+            try:
+                self.collection.update(
+                    ids=[chunk_id],
+                    documents=[text],
+                    embeddings=[embedding],
+                    metadatas=[metadata],
+                )
+                self._bump_version()
+            except:
+                self.add_document(chunk_id, text, embedding, metadata)
+
+    def upsert_documents_batch(self, ids, texts, embeddings, metadatas):
+        with self._write_lock:
+            self.collection.upsert(
+                ids=ids, documents=texts, embeddings=embeddings, metadatas=metadatas
             )
-        except:
-            self.add_document(chunk_id, text, embedding, metadata)
+            self._bump_version()
 
     # -----------------------------------------
     # DELETE
     # -----------------------------------------
     def delete_document(self, chunk_id):
-        self.collection.delete(ids=[chunk_id])
+        with self._write_lock:
+            self.collection.delete(ids=[chunk_id])
+            self._bump_version()
+
+    def delete_by_source(self, source_file, keep_ids=()):
+        """Delete a source file's chunks, except keep_ids. Returns count deleted."""
+        with self._write_lock:
+            existing = self.collection.get(where={"source_file": source_file}, include=[])["ids"]
+            keep = set(keep_ids)
+            stale = [chunk_id for chunk_id in existing if chunk_id not in keep]
+            if stale:
+                self.collection.delete(ids=stale)
+                self._bump_version()
+            return len(stale)
 
     # -----------------------------------------
     # Query with metadata filtering
     # -----------------------------------------
+    @traced("vector_store.query")
     def query(self, query_embedding, top_k=5, filter_metadata=None):
         # ChromaDB doesn't accept empty dict for where parameter
         query_params = {
@@ -104,6 +177,21 @@ class VectorStore:
         results = self.collection.query(**query_params)
         return results
 
+    # -----------------------------------------
+    # Batched query (one round trip for many questions)
+    # -----------------------------------------
+    @traced("vector_store.query_batch")
+    def query_batch(self, query_embeddings, top_k=5, filter_metadata=None):
+        query_params = {
+            "query_embeddings": query_embeddings,
+            "n_results": top_k,
+        }
+
+        if filter_metadata:
+            query_params["where"] = filter_metadata
+
+        return self.collection.query(**query_params)
+
     # -----------------------------------------
     # Count Docs
     # -----------------------------------------
@@ -126,3 +214,4 @@ if __name__ == "__main__":
     print("\nHealth:", "OK" if store.health() else "FAILED")
     print("Total Records:", store.count())
     print("Available Collections:", store.list_collections())
+    print("Index Version:", store.index_version())
@@ -1,6 +1,6 @@
 import React, { useState, useRef, useEffect } from 'react';
 import { MessageCircle, X, Send, Bot } from 'lucide-react';
-import { getFundingAdvice, startBackendIfNeeded } from '../lib/api';
+import { founderHeaders, getFundingAdvice, startBackendIfNeeded } from '../lib/api';
 
 const API_BASE_URL = 'http://localhost:8000';
 
@@ -52,7 +52,7 @@ export default function AIChatAssistant() {
       
       // First check if profile exists
       try {
-        await fetch(`${API_BASE_URL}/founder/profile`);
+        await fetch(`${API_BASE_URL}/founder/profile`, { headers: founderHeaders() });
       } catch (profileError) {
         // Profile doesn't exist, create a basic one
         const basicProfile = {
@@ -64,7 +64,7 @@ export default function AIChatAssistant() {
         };
         await fetch(`${API_BASE_URL}/founder/profile`, {
           method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
+          headers: founderHeaders({ 'Content-Type': 'application/json' }),
           body: JSON.stringify(basicProfile)
         });
       }
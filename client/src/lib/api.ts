@@ -7,6 +7,23 @@ const API_BASE_URL = typeof window !== 'undefined'
   ? (import.meta.env.VITE_API_URL || 'http://localhost:8000')
   : 'http://localhost:8000';
 
+// Per-browser founder key: the backend stores one profile per X-Founder-ID
+const FOUNDER_ID_KEY = 'nivesh_founder_id';
+
+export function getFounderId(): string {
+  if (typeof window === 'undefined') return 'default_founder';
+  let id = window.localStorage.getItem(FOUNDER_ID_KEY);
+  if (!id) {
+    id = `founder_${crypto.randomUUID().replace(/-/g, '')}`;
+    window.localStorage.setItem(FOUNDER_ID_KEY, id);
+  }
+  return id;
+}
+
+export function founderHeaders(extra: Record<string, string> = {}): Record<string, string> {
+  return { ...extra, 'X-Founder-ID': getFounderId() };
+}
+
 // Auto-start backend if not running
 export async function startBackendIfNeeded(): Promise<void> {
   try {
@@ -72,7 +89,7 @@ export async function saveFounderProfile(profile: FounderProfile & { documents?:
     // First save the profile
     const profileResponse = await fetch(`${API_BASE_URL}/founder/profile`, {
       method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
+      headers: founderHeaders({ 'Content-Type': 'application/json' }),
       body: JSON.stringify(profileData),
     });
     
@@ -115,7 +132,7 @@ export async function saveFounderProfile(profile: FounderProfile & { documents?:
 
 export async function getFounderProfile(): Promise<any> {
   try {
-    const response = await fetch(`${API_BASE_URL}/founder/profile`);
+    const response = await fetch(`${API_BASE_URL}/founder/profile`, { headers: founderHeaders() });
     
     if (!response.ok) {
       throw new Error(`HTTP ${response.status}: ${response.statusText}`);
@@ -142,7 +159,7 @@ export async function getFundingAdvice(question: FundingQuestion): Promise<Fundi
 
     const response = await fetch(`${API_BASE_URL}/funding/advice`, {
       method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
+      headers: founderHeaders({ 'Content-Type': 'application/json' }),
       body: JSON.stringify(question),
     });
     
@@ -212,7 +229,7 @@ export interface MarketInsight {
 // Investor Matching
 export async function getInvestorMatches(): Promise<{ investors: InvestorMatch[] }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/investors/match`);
+    const response = await fetch(`${API_BASE_URL}/investors/match`, { headers: founderHeaders() });
     if (!response.ok) {
       throw new Error(`HTTP ${response.status}: ${response.statusText}`);
     }
@@ -226,7 +243,7 @@ export async function getInvestorMatches(): Promise<{ investors: InvestorMatch[]
 // Funding Timeline
 export async function getFundingTimeline(stage?: string, goal?: string): Promise<FundingTimeline> {
   try {
-    const response = await fetch(`${API_BASE_URL}/funding/timeline`);
+    const response = await fetch(`${API_BASE_URL}/funding/timeline`, { headers: founderHeaders() });
     if (!response.ok) {
       throw new Error(`HTTP ${response.status}: ${response.statusText}`);
     }
@@ -263,7 +280,7 @@ export async function getFundingTimeline(stage?: string, goal?: string): Promise
 // Market Insights
 export async function getMarketInsights(sector?: string): Promise<MarketInsight> {
   try {
-    const response = await fetch(`${API_BASE_URL}/market/insights`);
+    const response = await fetch(`${API_BASE_URL}/market/insights`, { headers: founderHeaders() });
     if (!response.ok) {
       throw new Error(`HTTP ${response.status}: ${response.statusText}`);
     }
@@ -366,7 +383,7 @@ export interface ReadinessScore {
 
 export async function getReadinessScore(): Promise<ReadinessScore> {
   try {
-    const response = await fetch(`${API_BASE_URL}/readiness/score`);
+    const response = await fetch(`${API_BASE_URL}/readiness/score`, { headers: founderHeaders() });
     if (!response.ok) {
       throw new Error(`HTTP ${response.status}: ${response.statusText}`);
     }
@@ -398,7 +415,7 @@ export interface ActionPlan {
 
 export async function get7DayActionPlan(): Promise<ActionPlan> {
   try {
-    const response = await fetch(`${API_BASE_URL}/action-plan/7day`);
+    const response = await fetch(`${API_BASE_URL}/action-plan/7day`, { headers: founderHeaders() });
     if (!response.ok) {
       throw new Error(`HTTP ${response.status}: ${response.statusText}`);
     }
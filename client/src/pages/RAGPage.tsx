@@ -190,7 +190,7 @@ export default function RAGPage() {
         headers: {
           'Content-Type': 'application/json',
         },
-        body: JSON.stringify({ rebuild: vectorDbSummary !== null })
+        body: JSON.stringify({ rebuild: vectorDbSummary !== null, wait: true })
       });
       
       setProcessingProgress(75);
@@ -1,4 +1,4 @@
-import { spawn } from 'child_process';
+import { spawn, type ChildProcess } from 'child_process';
 import path from 'path';
 import fs from 'fs/promises';
 
@@ -20,31 +20,164 @@ export interface IngestionResult {
   language?: string;
 }
 
+const SERVICE_URL = process.env.RAG_SERVICE_URL || 'http://127.0.0.1:8765';
+const SERVICE_AUTOSTART = process.env.RAG_SERVICE_AUTOSTART !== 'false';
+const SERVICE_START_TIMEOUT_MS = 60_000;
+// /health counts the Chroma collection; trust a healthy worker this long
+const SERVICE_HEALTH_TTL_MS = Number(process.env.RAG_SERVICE_HEALTH_TTL_MS || 30_000);
+
+/**
+ * Talks to the long-lived Python RAG worker (Data Ingestion/rag_service.py),
+ * which keeps the engine, embedder and Chroma collection warm between
+ * requests. If the worker cannot be reached or started, every call falls
+ * back to the old one-shot `python -c` spawn.
+ */
 export class RAGService {
   private pythonPath: string;
   private ragPath: string;
+  private serviceUrl: string;
+  private worker: ChildProcess | null = null;
+  private starting: Promise<boolean> | null = null;
+  private healthyUntil = 0;
 
   constructor() {
     this.pythonPath = 'python';
     this.ragPath = path.join(process.cwd(), 'ai-verse', 'Data Ingestion');
+    this.serviceUrl = SERVICE_URL;
   }
 
+  // ---------- worker service ----------
+
+  private async isServiceUp(): Promise<boolean> {
+    try {
+      const res = await fetch(`${this.serviceUrl}/health`, { signal: AbortSignal.timeout(2000) });
+      if (res.ok) this.markHealthy();
+      return res.ok;
+    } catch {
+      return false;
+    }
+  }
+
+  private markHealthy(): void {
+    this.healthyUntil = Date.now() + SERVICE_HEALTH_TTL_MS;
+  }
+
+  private async ensureService(): Promise<boolean> {
+    if (Date.now() < this.healthyUntil) return true;
+    if (await this.isServiceUp()) return true;
+    if (!SERVICE_AUTOSTART) return false;
+    if (this.starting) return this.starting;
+
+    this.starting = (async () => {
+      if (!this.worker || this.worker.exitCode !== null) {
+        const port = new URL(this.serviceUrl).port || '8765';
+        this.worker = spawn(this.pythonPath, ['rag_service.py', '--port', port], {
+          cwd: this.ragPath,
+          stdio: 'ignore',
+        });
+        this.worker.on('exit', () => {
+          this.worker = null;
+          this.healthyUntil = 0;
+        });
+        this.worker.on('error', (err) => {
+          console.error(`RAG service failed to start: ${err.message}`);
+          this.worker = null;
+        });
+      }
+
+      const deadline = Date.now() + SERVICE_START_TIMEOUT_MS;
+      while (Date.now() < deadline && this.worker) {
+        if (await this.isServiceUp()) return true;
+        await new Promise((r) => setTimeout(r, 500));
+      }
+      return false;
+    })().finally(() => {
+      this.starting = null;
+    });
+
+    return this.starting;
+  }
+
+  /**
+   * POST to the worker; returns null when it is unavailable. Health is only
+   * re-probed once the cached result expires or a call fails to connect.
+   */
+  private async callService<T>(endpoint: string, body: unknown, retry = true): Promise<T | null> {
+    if (!(await this.ensureService())) return null;
+
+    let res: Response;
+    try {
+      res = await fetch(`${this.serviceUrl}${endpoint}`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(body),
+      });
+    } catch {
+      // Worker went away since it was last seen healthy: probe (or restart) once
+      this.healthyUntil = 0;
+      return retry ? this.callService<T>(endpoint, body, false) : null;
+    }
+    this.markHealthy();
+
+    const result = await res.json();
+    if (result.status === 'error') {
+      throw new Error(result.error);
+    }
+    return result as T;
+  }
+
+  // ---------- public API ----------
+
   async askQuestion(question: string): Promise<RAGResponse> {
-    return new Promise((resolve, reject) => {
-      const pythonScript = `
-import sys
-sys.path.append('${this.ragPath.replace(/\\/g, '/')}')
-from rag.rag_engine import RAGEngine
-import json
+    const result = await this.callService<RAGResponse>('/ask', { question, mode: 'general' });
+    return result ?? this.askQuestionViaSpawn(question);
+  }
 
-try:
-    engine = RAGEngine()
-    result = engine.ask("${question.replace(/"/g, '\\"')}")
-    print(json.dumps(result))
-except Exception as e:
-    print(json.dumps({"error": str(e), "status": "error"}))
-`;
+  async askFundingQuestion(question: string): Promise<RAGResponse> {
+    const result = await this.callService<RAGResponse>('/ask', { question, mode: 'funding' });
+    return result ?? this.askFundingQuestionViaSpawn(question);
+  }
+
+  async ingestPDF(filePath: string): Promise<IngestionResult> {
+    try {
+      const result = await this.callService<IngestionResult>('/ingest', { type: 'pdf', path: filePath });
+      return result ?? this.ingestPDFViaSpawn(filePath);
+    } catch (e) {
+      return { success: false, message: (e as Error).message };
+    }
+  }
+
+  async ingestWebsite(url: string): Promise<IngestionResult> {
+    try {
+      const result = await this.callService<IngestionResult>('/ingest', { type: 'website', url });
+      return result ?? this.ingestWebsiteViaSpawn(url);
+    } catch (e) {
+      return { success: false, message: (e as Error).message };
+    }
+  }
+
+  async buildVectorDatabase(): Promise<IngestionResult> {
+    try {
+      const result = await this.callService<IngestionResult>('/build', {});
+      return result ?? this.buildVectorDatabaseViaSpawn();
+    } catch (e) {
+      return { success: false, message: (e as Error).message };
+    }
+  }
+
+  async searchDocuments(query: string, topK: number = 5): Promise<any> {
+    try {
+      const result = await this.callService<any>('/search', { query, top_k: topK });
+      return result ?? this.searchDocumentsViaSpawn(query, topK);
+    } catch (e) {
+      return { success: false, message: (e as Error).message };
+    }
+  }
+
+  // ---------- one-shot spawn fallback ----------
 
+  private runPython(pythonScript: string): Promise<any> {
+    return new Promise((resolve, reject) => {
       const python = spawn(this.pythonPath, ['-c', pythonScript], {
         cwd: this.ragPath
       });
@@ -69,13 +202,7 @@ except Exception as e:
         try {
           const lines = output.trim().split('\n');
           const lastLine = lines[lines.length - 1];
-          const result = JSON.parse(lastLine);
-          
-          if (result.error) {
-            reject(new Error(result.error));
-          } else {
-            resolve(result as RAGResponse);
-          }
+          resolve(JSON.parse(lastLine));
         } catch (e) {
           reject(new Error(`Failed to parse response: ${output}`));
         }
@@ -83,63 +210,52 @@ except Exception as e:
     });
   }
 
-  async askFundingQuestion(question: string): Promise<RAGResponse> {
-    return new Promise((resolve, reject) => {
-      const pythonScript = `
+  private async askQuestionViaSpawn(question: string): Promise<RAGResponse> {
+    const pythonScript = `
 import sys
 sys.path.append('${this.ragPath.replace(/\\/g, '/')}')
-from funding_rag_engine import FundingRAGEngine
+from rag.rag_engine import RAGEngine
 import json
 
 try:
-    engine = FundingRAGEngine()
-    result = engine.ask_funding_question("${question.replace(/"/g, '\\"')}")
+    engine = RAGEngine()
+    result = engine.ask("${question.replace(/"/g, '\\"')}")
     print(json.dumps(result))
 except Exception as e:
     print(json.dumps({"error": str(e), "status": "error"}))
 `;
 
-      const python = spawn(this.pythonPath, ['-c', pythonScript], {
-        cwd: this.ragPath
-      });
-
-      let output = '';
-      let error = '';
-
-      python.stdout.on('data', (data) => {
-        output += data.toString();
-      });
+    const result = await this.runPython(pythonScript);
+    if (result.error) {
+      throw new Error(result.error);
+    }
+    return result as RAGResponse;
+  }
 
-      python.stderr.on('data', (data) => {
-        error += data.toString();
-      });
+  private async askFundingQuestionViaSpawn(question: string): Promise<RAGResponse> {
+    const pythonScript = `
+import sys
+sys.path.append('${this.ragPath.replace(/\\/g, '/')}')
+from funding_rag_engine import FundingRAGEngine
+import json
 
-      python.on('close', (code) => {
-        if (code !== 0) {
-          reject(new Error(`Python process failed: ${error}`));
-          return;
-        }
+try:
+    engine = FundingRAGEngine()
+    result = engine.ask_funding_question("${question.replace(/"/g, '\\"')}")
+    print(json.dumps(result))
+except Exception as e:
+    print(json.dumps({"error": str(e), "status": "error"}))
+`;
 
-        try {
-          const lines = output.trim().split('\n');
-          const lastLine = lines[lines.length - 1];
-          const result = JSON.parse(lastLine);
-          
-          if (result.error) {
-            reject(new Error(result.error));
-          } else {
-            resolve(result as RAGResponse);
-          }
-        } catch (e) {
-          reject(new Error(`Failed to parse response: ${output}`));
-        }
-      });
-    });
+    const result = await this.runPython(pythonScript);
+    if (result.error) {
+      throw new Error(result.error);
+    }
+    return result as RAGResponse;
   }
 
-  async ingestPDF(filePath: string): Promise<IngestionResult> {
-    return new Promise((resolve, reject) => {
-      const pythonScript = `
+  private async ingestPDFViaSpawn(filePath: string): Promise<IngestionResult> {
+    const pythonScript = `
 import sys
 sys.path.append('${this.ragPath.replace(/\\/g, '/')}')
 from ingestion.pipeline import process_pdf
@@ -158,42 +274,11 @@ except Exception as e:
     print(json.dumps({"success": False, "message": str(e)}))
 `;
 
-      const python = spawn(this.pythonPath, ['-c', pythonScript], {
-        cwd: this.ragPath
-      });
-
-      let output = '';
-      let error = '';
-
-      python.stdout.on('data', (data) => {
-        output += data.toString();
-      });
-
-      python.stderr.on('data', (data) => {
-        error += data.toString();
-      });
-
-      python.on('close', (code) => {
-        if (code !== 0) {
-          reject(new Error(`Python process failed: ${error}`));
-          return;
-        }
-
-        try {
-          const lines = output.trim().split('\n');
-          const lastLine = lines[lines.length - 1];
-          const result = JSON.parse(lastLine);
-          resolve(result as IngestionResult);
-        } catch (e) {
-          reject(new Error(`Failed to parse response: ${output}`));
-        }
-      });
-    });
+    return (await this.runPython(pythonScript)) as IngestionResult;
   }
 
-  async ingestWebsite(url: string): Promise<IngestionResult> {
-    return new Promise((resolve, reject) => {
-      const pythonScript = `
+  private async ingestWebsiteViaSpawn(url: string): Promise<IngestionResult> {
+    const pythonScript = `
 import sys
 sys.path.append('${this.ragPath.replace(/\\/g, '/')}')
 from ingestion.pipeline import process_websites
@@ -215,42 +300,11 @@ except Exception as e:
     print(json.dumps({"success": False, "message": str(e)}))
 `;
 
-      const python = spawn(this.pythonPath, ['-c', pythonScript], {
-        cwd: this.ragPath
-      });
-
-      let output = '';
-      let error = '';
-
-      python.stdout.on('data', (data) => {
-        output += data.toString();
-      });
-
-      python.stderr.on('data', (data) => {
-        error += data.toString();
-      });
-
-      python.on('close', (code) => {
-        if (code !== 0) {
-          reject(new Error(`Python process failed: ${error}`));
-          return;
-        }
-
-        try {
-          const lines = output.trim().split('\n');
-          const lastLine = lines[lines.length - 1];
-          const result = JSON.parse(lastLine);
-          resolve(result as IngestionResult);
-        } catch (e) {
-          reject(new Error(`Failed to parse response: ${output}`));
-        }
-      });
-    });
+    return (await this.runPython(pythonScript)) as IngestionResult;
   }
 
-  async buildVectorDatabase(): Promise<IngestionResult> {
-    return new Promise((resolve, reject) => {
-      const pythonScript = `
+  private async buildVectorDatabaseViaSpawn(): Promise<IngestionResult> {
+    const pythonScript = `
 import sys
 sys.path.append('${this.ragPath.replace(/\\/g, '/')}')
 from vector_store.build_store import build_vector_database
@@ -266,42 +320,11 @@ except Exception as e:
     print(json.dumps({"success": False, "message": str(e)}))
 `;
 
-      const python = spawn(this.pythonPath, ['-c', pythonScript], {
-        cwd: this.ragPath
-      });
-
-      let output = '';
-      let error = '';
-
-      python.stdout.on('data', (data) => {
-        output += data.toString();
-      });
-
-      python.stderr.on('data', (data) => {
-        error += data.toString();
-      });
-
-      python.on('close', (code) => {
-        if (code !== 0) {
-          reject(new Error(`Python process failed: ${error}`));
-          return;
-        }
-
-        try {
-          const lines = output.trim().split('\n');
-          const lastLine = lines[lines.length - 1];
-          const result = JSON.parse(lastLine);
-          resolve(result as IngestionResult);
-        } catch (e) {
-          reject(new Error(`Failed to parse response: ${output}`));
-        }
-      });
-    });
+    return (await this.runPython(pythonScript)) as IngestionResult;
   }
 
-  async searchDocuments(query: string, topK: number = 5): Promise<any> {
-    return new Promise((resolve, reject) => {
-      const pythonScript = `
+  private async searchDocumentsViaSpawn(query: string, topK: number = 5): Promise<any> {
+    const pythonScript = `
 import sys
 sys.path.append('${this.ragPath.replace(/\\/g, '/')}')
 from vector_store.retriever import Retriever
@@ -326,36 +349,6 @@ except Exception as e:
     print(json.dumps({"success": False, "message": str(e)}))
 `;
 
-      const python = spawn(this.pythonPath, ['-c', pythonScript], {
-        cwd: this.ragPath
-      });
-
-      let output = '';
-      let error = '';
-
-      python.stdout.on('data', (data) => {
-        output += data.toString();
-      });
-
-      python.stderr.on('data', (data) => {
-        error += data.toString();
-      });
-
-      python.on('close', (code) => {
-        if (code !== 0) {
-          reject(new Error(`Python process failed: ${error}`));
-          return;
-        }
-
-        try {
-          const lines = output.trim().split('\n');
-          const lastLine = lines[lines.length - 1];
-          const result = JSON.parse(lastLine);
-          resolve(result);
-        } catch (e) {
-          reject(new Error(`Failed to parse response: ${output}`));
-        }
-      });
-    });
+    return this.runPython(pythonScript);
   }
-}
\ No newline at end of file
+}
@@ -0,0 +1,55 @@
+"""
+Semantic answer cache for /funding/advice
+Repeated (or paraphrased) questions over the same context skip the LLM
+call. The cache itself is the Data Ingestion one (rag/answer_cache.py);
+this module only configures it for the API. When Data Ingestion is not
+deployed the cache is off: lookups miss and stores are dropped.
+"""
+
+import logging
+import os
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import app.rag_integration  # noqa: F401  (puts Data Ingestion on sys.path)
+
+logger = logging.getLogger(__name__)
+
+ADVICE_CACHE_TTL = int(os.getenv("ADVICE_CACHE_TTL", "3600"))
+ADVICE_CACHE_SIZE = int(os.getenv("ADVICE_CACHE_SIZE", "512"))
+ADVICE_CACHE_SIMILARITY = float(os.getenv("ADVICE_CACHE_SIMILARITY", "0.85"))
+
+try:
+    from rag.answer_cache import AnswerCache, context_fingerprint  # type: ignore
+except ImportError:
+    AnswerCache = None
+
+    def context_fingerprint(chunks: Iterable[str]) -> str:
+        return ""
+
+
+class _DisabledCache:
+    """Stand-in when rag.answer_cache isn't available"""
+
+    def get(self, query: str, language: str, fingerprint: str) -> Optional[Any]:
+        return None
+
+    def put(self, query: str, language: str, fingerprint: str, value: Any):
+        pass
+
+    def clear(self):
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {"enabled": False}
+
+
+def create_advice_cache(version_fn: Optional[Callable[[], str]] = None):
+    if AnswerCache is None:
+        logger.warning("⚠️ Advice cache off - Data Ingestion (rag.answer_cache) not deployed")
+        return _DisabledCache()
+    return AnswerCache(
+        version_fn=version_fn,
+        max_entries=ADVICE_CACHE_SIZE,
+        ttl_seconds=ADVICE_CACHE_TTL,
+        similarity_threshold=ADVICE_CACHE_SIMILARITY,
+    )
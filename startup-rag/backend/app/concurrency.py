@@ -0,0 +1,79 @@
+"""
+Shared async plumbing for the API workers
+
+- One pooled httpx.AsyncClient reused by every outbound LLM call
+  (keep-alive connections instead of a fresh TLS handshake per request)
+- A bounded thread pool for the calls that are still synchronous
+  (Chroma retrieval, vendor SDKs), so they never run on the event loop
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "20"))
+HTTP_TIMEOUT_SECONDS = float(os.getenv("HTTP_TIMEOUT_SECONDS", "30"))
+BLOCKING_POOL_SIZE = int(os.getenv("BLOCKING_POOL_SIZE", "16"))
+
+# A pool is tied to the loop it was created on, so keep one client per loop
+# (tests spin up new loops); each lifespan closes its own loop's client
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_blocking_pool: Optional[ThreadPoolExecutor] = None
+
+
+def get_http_client() -> "httpx.AsyncClient":
+    """Return this loop's shared async HTTP client (created on first use)"""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        import httpx  # first outbound call pays the import, not app startup
+
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            ),
+            timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=10.0),
+        )
+        _http_clients[loop] = client
+        logger.info(f"🔌 Shared HTTP pool created (max {HTTP_MAX_CONNECTIONS} connections)")
+    return client
+
+
+def _get_blocking_pool() -> ThreadPoolExecutor:
+    global _blocking_pool
+    if _blocking_pool is None:
+        _blocking_pool = ThreadPoolExecutor(
+            max_workers=BLOCKING_POOL_SIZE,
+            thread_name_prefix="blocking",
+        )
+    return _blocking_pool
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a synchronous callable in the bounded pool and await its result"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_blocking_pool(), functools.partial(func, *args, **kwargs)
+    )
+
+
+async def shutdown():
+    """Close this loop's pooled connections and stop the worker threads"""
+    global _blocking_pool
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+    if _blocking_pool is not None:
+        _blocking_pool.shutdown(wait=False)
+        _blocking_pool = None
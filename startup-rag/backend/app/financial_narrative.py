@@ -31,6 +31,40 @@ class FinancialNarrativeGenerator:
         self.client = groq_client
         logger.info("Financial Narrative Generator initialized (isolated)")
     
+    def _build_prompt(self, financial_data: Dict[str, Any]) -> str:
+        if not self.client.is_configured:
+            raise ValueError("AI provider not configured")
+        
+        # Validate inputs
+        if not financial_data:
+            raise ValueError("Financial data is required")
+        
+        # Generate prompt using dedicated prompt function
+        return get_financial_narrative_prompt(financial_data)
+    
+    def _parse_narrative(self, response_text: str) -> Dict[str, Any]:
+        # Parse JSON response
+        # Handle markdown code blocks
+        if "```json" in response_text:
+            json_start = response_text.find("```json") + 7
+            json_end = response_text.find("```", json_start)
+            json_text = response_text[json_start:json_end].strip()
+        elif "{" in response_text and "}" in response_text:
+            json_start = response_text.find("{")
+            json_end = response_text.rfind("}") + 1
+            json_text = response_text[json_start:json_end]
+        else:
+            raise ValueError("No JSON found in response")
+        
+        narrative = json.loads(json_text)
+        
+        # Ensure disclaimer is always present
+        if "disclaimer" not in narrative:
+            narrative["disclaimer"] = "This is not financial advice. This is an explanatory narrative based on provided inputs."
+        
+        logger.info("✅ Financial narrative generated successfully")
+        return narrative
+    
     def generate_narrative(self, financial_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generate financial narrative from provided data.
@@ -44,43 +78,30 @@ class FinancialNarrativeGenerator:
         Raises:
             ValueError: If AI generation fails
         """
-        if not self.client.is_configured:
-            raise ValueError("AI provider not configured")
-        
-        # Validate inputs
-        if not financial_data:
-            raise ValueError("Financial data is required")
-        
-        # Generate prompt using dedicated prompt function
-        prompt = get_financial_narrative_prompt(financial_data)
+        prompt = self._build_prompt(financial_data)
         
         try:
             logger.info("🔮 Generating financial narrative...")
             
             # Use Groq for generation (isolated call)
             response_text = self.client.test_generation(prompt)
+            return self._parse_narrative(response_text)
             
-            # Parse JSON response
-            # Handle markdown code blocks
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                json_text = response_text[json_start:json_end].strip()
-            elif "{" in response_text and "}" in response_text:
-                json_start = response_text.find("{")
-                json_end = response_text.rfind("}") + 1
-                json_text = response_text[json_start:json_end]
-            else:
-                raise ValueError("No JSON found in response")
-            
-            narrative = json.loads(json_text)
-            
-            # Ensure disclaimer is always present
-            if "disclaimer" not in narrative:
-                narrative["disclaimer"] = "This is not financial advice. This is an explanatory narrative based on provided inputs."
-            
-            logger.info("✅ Financial narrative generated successfully")
-            return narrative
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse narrative JSON: {str(e)}")
+            raise ValueError(f"Failed to parse AI response: {str(e)}")
+        except Exception as e:
+            logger.error(f"Narrative generation failed: {type(e).__name__}: {str(e)}")
+            raise ValueError(f"Narrative generation failed: {str(e)}")
+    
+    async def generate_narrative_async(self, financial_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Non-blocking generate_narrative (same contract)"""
+        prompt = self._build_prompt(financial_data)
+        
+        try:
+            logger.info("🔮 Generating financial narrative...")
+            response_text = await self.client.test_generation_async(prompt)
+            return self._parse_narrative(response_text)
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse narrative JSON: {str(e)}")
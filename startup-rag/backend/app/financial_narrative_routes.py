@@ -71,7 +71,7 @@ async def generate_financial_narrative(financial_input: FinancialInput):
             )
         
         # Generate narrative using isolated generator
-        narrative = financial_narrative_generator.generate_narrative(
+        narrative = await financial_narrative_generator.generate_narrative_async(
             financial_input.dict()
         )
         
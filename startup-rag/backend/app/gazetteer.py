@@ -0,0 +1,48 @@
+"""
+Location Gazetteer
+Maps free-text founder locations ("Koramangala, Bengaluru") to the
+canonical cities they mention and the best city tier, once per distinct
+string. The rules modules (readiness, timeline, market insights, action
+plan) test canonical city sets instead of re-scanning the text per request.
+"""
+
+from functools import lru_cache
+from typing import FrozenSet, NamedTuple
+
+# Spelling / alias -> (canonical city, tier)
+GAZETTEER = {
+    'bangalore': ('bangalore', 1),
+    'bengaluru': ('bangalore', 1),
+    'mumbai': ('mumbai', 1),
+    'bombay': ('mumbai', 1),
+    'delhi': ('delhi', 1),
+    'noida': ('noida', 1),
+    'gurgaon': ('gurgaon', 1),
+    'gurugram': ('gurgaon', 1),
+    'hyderabad': ('hyderabad', 1),
+    'chennai': ('chennai', 1),
+    'pune': ('pune', 1),
+    'ahmedabad': ('ahmedabad', 2),
+    'kolkata': ('kolkata', 2),
+    'jaipur': ('jaipur', 2),
+    'chandigarh': ('chandigarh', 2),
+    'indore': ('indore', 2),
+    'kochi': ('kochi', 2),
+}
+
+UNKNOWN_TIER = 3
+
+
+class Location(NamedTuple):
+    cities: FrozenSet[str]  # canonical cities mentioned anywhere in the text
+    tier: int               # best tier among them (UNKNOWN_TIER if none)
+
+
+@lru_cache(maxsize=4096)
+def resolve_location(location: str) -> Location:
+    """Location for an already-lowercased location string"""
+    matches = [entry for alias, entry in GAZETTEER.items() if alias in location]
+    return Location(
+        cities=frozenset(city for city, _ in matches),
+        tier=min((tier for _, tier in matches), default=UNKNOWN_TIER),
+    )
@@ -1,7 +1,7 @@
-import google.generativeai as genai
 import json
 import logging
-from app.config import GEMINI_API_KEY, GEMINI_MODEL
+from app.config import GEMINI_API_KEY, GEMINI_MODEL, GEMINI_API_BASE
+from app.concurrency import get_http_client
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -10,23 +10,42 @@ logger = logging.getLogger(__name__)
 class GeminiClient:
     def __init__(self):
         self.api_key = GEMINI_API_KEY
-        self.model = None
-        self.is_configured = False
+        self._model = None
+        self.is_configured = bool(self.api_key and self.api_key != "your_gemini_api_key_here")
         
-        if self.api_key and self.api_key != "your_gemini_api_key_here":
-            try:
-                genai.configure(api_key=GEMINI_API_KEY)
-                self.model = genai.GenerativeModel(GEMINI_MODEL)
-                self.is_configured = True
-                logger.info(f"✅ Gemini client initialized with model: {GEMINI_MODEL}")
-            except Exception as e:
-                logger.error(f"Failed to initialize Gemini client: {str(e)}")
-                self.is_configured = False
-                self.model = None
+        if self.is_configured:
+            logger.info(f"✅ Gemini client configured with model: {GEMINI_MODEL}")
         else:
             # Silent initialization - Gemini is optional
             logger.info("Gemini API not configured (optional provider)")
     
+    @property
+    def model(self):
+        """
+        google-generativeai SDK model, imported on first use.
+        The SDK costs ~1s of import time and only the sync methods need it
+        (the async API talks to the REST endpoint directly).
+        """
+        if self._model is None and self.is_configured:
+            import google.generativeai as genai
+            genai.configure(api_key=self.api_key)
+            self._model = genai.GenerativeModel(GEMINI_MODEL)
+            logger.info(f"✅ Gemini SDK model initialized: {GEMINI_MODEL}")
+        return self._model
+    
+    @staticmethod
+    def _extract_json_text(response_text: str) -> str:
+        if "```json" in response_text:
+            json_start = response_text.find("```json") + 7
+            json_end = response_text.find("```", json_start)
+            return response_text[json_start:json_end].strip()
+        if "{" in response_text and "}" in response_text:
+            json_start = response_text.find("{")
+            json_end = response_text.rfind("}") + 1
+            return response_text[json_start:json_end]
+        logger.error("❌ No JSON found in Gemini response")
+        return response_text
+
     def generate_funding_advice(self, prompt: str) -> dict:
         """Generate funding advice using Gemini AI"""
         if not self.is_configured:
@@ -43,17 +62,7 @@ class GeminiClient:
             logger.debug(f"Raw response preview: {response_text[:200]}...")
             
             # Find JSON in response (handle markdown code blocks)
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                json_text = response_text[json_start:json_end].strip()
-            elif "{" in response_text and "}" in response_text:
-                json_start = response_text.find("{")
-                json_end = response_text.rfind("}") + 1
-                json_text = response_text[json_start:json_end]
-            else:
-                logger.error("❌ No JSON found in Gemini response")
-                json_text = response_text
+            json_text = self._extract_json_text(response_text)
             
             parsed_response = json.loads(json_text)
             logger.info("✅ Successfully parsed JSON response")
@@ -79,4 +88,59 @@ class GeminiClient:
             logger.error(f"Test generation failed: {type(e).__name__}: {str(e)}")
             raise
 
+    # ------------------------------------------------------------------
+    # Async API - Gemini REST endpoint over the shared connection pool.
+    # The SDK above stays for scripts; handlers should use these.
+    # ------------------------------------------------------------------
+    async def _generate_async(self, prompt: str) -> str:
+        response = await get_http_client().post(
+            f"{GEMINI_API_BASE}/models/{GEMINI_MODEL}:generateContent",
+            # Header rather than ?key= so the key never shows up in access logs
+            headers={"x-goog-api-key": self.api_key, "Content-Type": "application/json"},
+            json={"contents": [{"parts": [{"text": prompt}]}]},
+        )
+        if response.status_code != 200:
+            raise ValueError(f"Gemini API error: {response.status_code} - {response.text}")
+
+        candidates = response.json().get("candidates") or []
+        if not candidates:
+            raise ValueError("Gemini returned no candidates (response may have been blocked)")
+        parts = candidates[0].get("content", {}).get("parts", [])
+        return "".join(part.get("text", "") for part in parts)
+
+    async def generate_funding_advice_async(self, prompt: str) -> dict:
+        """Non-blocking generate_funding_advice"""
+        if not self.is_configured:
+            logger.error("❌ Gemini not configured - CANNOT generate advice")
+            raise ValueError("Gemini AI is not configured. Set GEMINI_API_KEY environment variable.")
+
+        response_text = ""
+        try:
+            logger.info("🤖 Calling Gemini API...")
+            response_text = (await self._generate_async(prompt)).strip()
+            logger.info(f"✅ Gemini responded with {len(response_text)} chars")
+
+            parsed_response = json.loads(self._extract_json_text(response_text))
+            logger.info("✅ Successfully parsed JSON response")
+            return parsed_response
+
+        except json.JSONDecodeError as e:
+            logger.error(f"❌ Failed to parse Gemini JSON response: {str(e)}")
+            logger.error(f"Response text: {response_text[:500]}")
+            raise ValueError(f"Failed to parse AI response as JSON: {str(e)}")
+        except Exception as e:
+            logger.error(f"❌ Gemini API error: {type(e).__name__}: {str(e)}")
+            raise ValueError(f"AI generation failed: {type(e).__name__}: {str(e)}")
+
+    async def test_generation_async(self, prompt: str) -> str:
+        """Non-blocking test_generation"""
+        if not self.is_configured:
+            raise ValueError("Gemini API not configured. Check GEMINI_API_KEY environment variable.")
+
+        try:
+            return await self._generate_async(prompt)
+        except Exception as e:
+            logger.error(f"Test generation failed: {type(e).__name__}: {str(e)}")
+            raise
+
 gemini_client = GeminiClient()
\ No newline at end of file
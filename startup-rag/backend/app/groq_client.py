@@ -1,23 +1,88 @@
 """
 Groq LLM Client for Funding Advice Generation
 Uses Groq API with LLaMA models for fast, cost-effective AI responses
+Supports both full completions and token streaming (SSE)
 """
 
 import os
 import json
 import logging
-import requests
-from app.config import GROQ_API_KEY, GROQ_MODEL
+# `requests` is imported inside the sync methods only: request handlers use
+# the async httpx path, so it should not add to every worker's startup.
+from app.config import GROQ_API_KEY, GROQ_MODEL, GROQ_API_BASE
+from app.concurrency import get_http_client
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+ADVISOR_SYSTEM_PROMPT = "You are an expert Indian startup funding advisor. Always respond with valid JSON only, no markdown formatting."
+
+
+def extract_json_text(response_text: str) -> str:
+    """Pull the JSON payload out of a model reply (handles markdown code blocks)"""
+    if "```json" in response_text:
+        json_start = response_text.find("```json") + 7
+        json_end = response_text.find("```", json_start)
+        return response_text[json_start:json_end].strip()
+    if "```" in response_text:
+        # Handle generic code blocks
+        json_start = response_text.find("```") + 3
+        json_end = response_text.find("```", json_start)
+        return response_text[json_start:json_end].strip()
+    if "{" in response_text and "}" in response_text:
+        json_start = response_text.find("{")
+        json_end = response_text.rfind("}") + 1
+        return response_text[json_start:json_end]
+    logger.error("❌ No JSON found in Groq response")
+    return response_text
+
+
+def iter_sse_tokens(response):
+    """Yield content deltas from an OpenAI-compatible `stream: true` response"""
+    response.encoding = "utf-8"
+    for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+        if not line or not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            break
+        try:
+            chunk = json.loads(data)
+        except ValueError:
+            continue
+        choices = chunk.get("choices") or []
+        if choices:
+            token = (choices[0].get("delta") or {}).get("content")
+            if token:
+                yield token
+
+
+async def aiter_sse_tokens(response):
+    """Async counterpart of iter_sse_tokens for httpx streaming responses"""
+    response.encoding = "utf-8"
+    async for line in response.aiter_lines():
+        if not line or not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            break
+        try:
+            chunk = json.loads(data)
+        except ValueError:
+            continue
+        choices = chunk.get("choices") or []
+        if choices:
+            token = (choices[0].get("delta") or {}).get("content")
+            if token:
+                yield token
+
+
 class GroqClient:
     def __init__(self):
         self.api_key = GROQ_API_KEY
         self.model = GROQ_MODEL
-        self.base_url = "https://api.groq.com/openai/v1/chat/completions"
+        self.base_url = f"{GROQ_API_BASE}/chat/completions"
         self.is_configured = False
         
         if self.api_key and self.api_key != "your_groq_api_key_here":
@@ -31,6 +96,30 @@ class GroqClient:
         else:
             logger.warning("Groq API key not configured. Using demo mode.")
     
+    def _headers(self) -> dict:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+    def _payload(self, messages: list, max_tokens: int, temperature: float = 0.7, stream: bool = False) -> dict:
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        if stream:
+            payload["stream"] = True
+        return payload
+
+    @staticmethod
+    def _build_messages(system_prompt: str, prompt: str) -> list:
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ]
+
     def generate_funding_advice(self, prompt: str) -> dict:
         """Generate funding advice using Groq API"""
         if not self.is_configured:
@@ -41,29 +130,13 @@ class GroqClient:
             logger.info("🤖 Calling Groq API...")
             
             # Format prompt for chat completion
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are an expert Indian startup funding advisor. Always respond with valid JSON only, no markdown formatting."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
+            messages = self._build_messages(ADVISOR_SYSTEM_PROMPT, prompt)
             
+            import requests
             response = requests.post(
                 self.base_url,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "temperature": 0.7,
-                    "max_tokens": 2000,
-                },
+                headers=self._headers(),
+                json=self._payload(messages, max_tokens=2000),
                 timeout=30,
             )
             
@@ -78,22 +151,7 @@ class GroqClient:
             logger.debug(f"Raw response preview: {response_text[:200]}...")
             
             # Find JSON in response (handle markdown code blocks)
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                json_text = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                # Handle generic code blocks
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                json_text = response_text[json_start:json_end].strip()
-            elif "{" in response_text and "}" in response_text:
-                json_start = response_text.find("{")
-                json_end = response_text.rfind("}") + 1
-                json_text = response_text[json_start:json_end]
-            else:
-                logger.error("❌ No JSON found in Groq response")
-                json_text = response_text
+            json_text = extract_json_text(response_text)
             
             parsed_response = json.loads(json_text)
             logger.info("✅ Successfully parsed JSON response")
@@ -113,29 +171,13 @@ class GroqClient:
             raise ValueError("Groq API not configured. Check GROQ_API_KEY environment variable.")
         
         try:
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
+            messages = self._build_messages("You are a helpful assistant.", prompt)
             
+            import requests
             response = requests.post(
                 self.base_url,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "temperature": 0.7,
-                    "max_tokens": 1000,
-                },
+                headers=self._headers(),
+                json=self._payload(messages, max_tokens=1000),
                 timeout=30,
             )
             
@@ -148,6 +190,111 @@ class GroqClient:
             logger.error(f"Test generation failed: {type(e).__name__}: {str(e)}")
             raise
 
+    def stream_generation(self, prompt: str, system_prompt: str = "You are a helpful assistant.", max_tokens: int = 1000):
+        """Yield response tokens as Groq produces them (OpenAI-style SSE stream)"""
+        if not self.is_configured:
+            raise ValueError("Groq API not configured. Check GROQ_API_KEY environment variable.")
+
+        messages = self._build_messages(system_prompt, prompt)
+
+        import requests
+        with requests.post(
+            self.base_url,
+            headers=self._headers(),
+            json=self._payload(messages, max_tokens=max_tokens, stream=True),
+            timeout=30,
+            stream=True,
+        ) as response:
+            if response.status_code != 200:
+                error_msg = response.text
+                logger.error(f"❌ Groq API error: {response.status_code} - {error_msg}")
+                raise ValueError(f"Groq API error: {response.status_code} - {error_msg}")
+
+            yield from iter_sse_tokens(response)
+
+    def stream_funding_advice(self, prompt: str):
+        """Streaming counterpart of generate_funding_advice - yields raw JSON text fragments"""
+        logger.info("🤖 Streaming from Groq API...")
+        yield from self.stream_generation(prompt, system_prompt=ADVISOR_SYSTEM_PROMPT, max_tokens=2000)
+
+    # ------------------------------------------------------------------
+    # Async API - shared connection pool, used by the FastAPI handlers
+    # ------------------------------------------------------------------
+    async def _complete_async(self, messages: list, max_tokens: int) -> str:
+        response = await get_http_client().post(
+            self.base_url,
+            headers=self._headers(),
+            json=self._payload(messages, max_tokens=max_tokens),
+        )
+        if response.status_code != 200:
+            error_msg = response.text
+            logger.error(f"❌ Groq API error: {response.status_code} - {error_msg}")
+            raise ValueError(f"Groq API error: {response.status_code} - {error_msg}")
+        return response.json()["choices"][0]["message"]["content"]
+
+    async def generate_funding_advice_async(self, prompt: str) -> dict:
+        """Non-blocking generate_funding_advice"""
+        if not self.is_configured:
+            logger.error("❌ Groq not configured - CANNOT generate advice")
+            raise ValueError("Groq AI is not configured. Set GROQ_API_KEY environment variable.")
+
+        response_text = ""
+        try:
+            logger.info("🤖 Calling Groq API...")
+            messages = self._build_messages(ADVISOR_SYSTEM_PROMPT, prompt)
+            response_text = (await self._complete_async(messages, max_tokens=2000)).strip()
+            logger.info(f"✅ Groq responded with {len(response_text)} chars")
+
+            parsed_response = json.loads(extract_json_text(response_text))
+            logger.info("✅ Successfully parsed JSON response")
+            return parsed_response
+
+        except json.JSONDecodeError as e:
+            logger.error(f"❌ Failed to parse Groq JSON response: {str(e)}")
+            logger.error(f"Response text: {response_text[:500]}")
+            raise ValueError(f"Failed to parse AI response as JSON: {str(e)}")
+        except Exception as e:
+            logger.error(f"❌ Groq API error: {type(e).__name__}: {str(e)}")
+            raise ValueError(f"AI generation failed: {type(e).__name__}: {str(e)}")
+
+    async def test_generation_async(self, prompt: str) -> str:
+        """Non-blocking test_generation"""
+        if not self.is_configured:
+            raise ValueError("Groq API not configured. Check GROQ_API_KEY environment variable.")
+
+        try:
+            messages = self._build_messages("You are a helpful assistant.", prompt)
+            return await self._complete_async(messages, max_tokens=1000)
+        except Exception as e:
+            logger.error(f"Test generation failed: {type(e).__name__}: {str(e)}")
+            raise
+
+    async def stream_generation_async(self, prompt: str, system_prompt: str = "You are a helpful assistant.", max_tokens: int = 1000):
+        """Async generator yielding tokens as Groq streams them"""
+        if not self.is_configured:
+            raise ValueError("Groq API not configured. Check GROQ_API_KEY environment variable.")
+
+        messages = self._build_messages(system_prompt, prompt)
+
+        async with get_http_client().stream(
+            "POST",
+            self.base_url,
+            headers=self._headers(),
+            json=self._payload(messages, max_tokens=max_tokens, stream=True),
+        ) as response:
+            if response.status_code != 200:
+                error_msg = (await response.aread()).decode("utf-8", "replace")
+                logger.error(f"❌ Groq API error: {response.status_code} - {error_msg}")
+                raise ValueError(f"Groq API error: {response.status_code} - {error_msg}")
+
+            async for token in aiter_sse_tokens(response):
+                yield token
+
+    async def stream_funding_advice_async(self, prompt: str):
+        logger.info("🤖 Streaming from Groq API...")
+        async for token in self.stream_generation_async(prompt, system_prompt=ADVISOR_SYSTEM_PROMPT, max_tokens=2000):
+            yield token
+
 groq_client = GroqClient()
 
 
@@ -0,0 +1,182 @@
+"""
+Investor Matching Engine
+Matches a founder profile against the investor/grant catalog
+(app/data/investors.json, or INVESTOR_CATALOG_PATH).
+
+The catalog is loaded once into inverted indexes (sector, stage, type and
+city -> investor bitmaps). A match ORs the handful of postings the profile
+touches, scores every investor at once with numpy and picks the top k from
+a score histogram (no full sort), so cost stays flat as the catalog grows.
+Catalog entries are never mutated; each match returns fresh dicts.
+
+Scoring (same rules as the original hand-written matcher):
+1. Sector: exact focus sector 40, partial (substring) 30
+2. Stage: stage in stage_focus 30, else funding goal == type 20
+3. Funding goal == investor type: 20
+4. Location: any investor city mentioned in the founder location: 10
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+INVESTOR_CATALOG_PATH = os.getenv(
+    "INVESTOR_CATALOG_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "investors.json")
+)
+
+SECTOR_EXACT_POINTS = 40
+SECTOR_PARTIAL_POINTS = 30
+STAGE_POINTS = 30
+STAGE_FALLBACK_POINTS = 20
+GOAL_POINTS = 20
+LOCATION_POINTS = 10
+
+
+class InvestorCatalog:
+    """Read-only investor list + inverted indexes (posting lists as packed bitmaps)"""
+
+    def __init__(self, investors: List[Dict]):
+        import numpy as np  # only paid when the catalog is first built
+
+        self.investors = tuple(investors)
+        self.size = len(self.investors)
+
+        sectors, stages, types, cities = (defaultdict(list) for _ in range(4))
+        for i, investor in enumerate(self.investors):
+            for sector in {s.lower() for s in investor["focus_sectors"]}:
+                sectors[sector].append(i)
+            for stage in set(investor["stage_focus"]):
+                stages[stage].append(i)
+            types[investor["type"].lower()].append(i)
+            for city in set(investor["location"].lower().split(', ')):
+                cities[city].append(i)
+
+        def freeze(index):
+            # n/8 bytes per key: OR-ing several postings is a cheap byte op
+            frozen = {}
+            for key, ids in index.items():
+                mask = np.zeros(self.size, dtype=bool)
+                mask[ids] = True
+                frozen[key] = np.packbits(mask)
+            return frozen
+
+        self._sector_index = freeze(sectors)
+        self._stage_index = freeze(stages)
+        self._type_index = freeze(types)
+        self._city_index = freeze(cities)
+        self._no_match = np.zeros(self.size, dtype=bool)
+
+    @classmethod
+    def from_file(cls, path: str = INVESTOR_CATALOG_PATH) -> "InvestorCatalog":
+        with open(path, "r", encoding="utf-8") as f:
+            investors = json.load(f)
+        catalog = cls(investors)
+        logger.info(f"📇 Loaded {catalog.size} investors from {os.path.basename(path)}")
+        return catalog
+
+    def _lookup(self, index: Dict, keys) -> "np.ndarray":
+        """Boolean mask of investors posted under any of keys"""
+        import numpy as np
+
+        bitmaps = [index[key] for key in keys if key in index]
+        if not bitmaps:
+            return self._no_match
+        merged = bitmaps[0] if len(bitmaps) == 1 else np.bitwise_or.reduce(bitmaps)
+        return np.unpackbits(merged, count=self.size).view(bool)
+
+    def _top_k(self, scores: "np.ndarray", top_k: int) -> List[int]:
+        """Ids of the top_k non-zero scores, score desc then catalog order"""
+        import numpy as np
+
+        # Scores are small ints: a histogram gives the k-th best score
+        # without sorting the whole catalog
+        counts = np.bincount(scores, minlength=101)
+        threshold, taken = 1, 0
+        for score in range(100, 0, -1):
+            taken += counts[score]
+            if taken >= top_k:
+                threshold = score
+                break
+
+        above = np.flatnonzero(scores > threshold)
+        ties = np.flatnonzero(scores == threshold)[: top_k - above.size]
+        ids = np.concatenate((above, ties))
+        return ids[np.lexsort((ids, -scores[ids].astype(np.int16)))].tolist()
+
+    def match(self, profile_data: dict, top_k: int = 5) -> List[Dict]:
+        """Top-k investors (score desc, catalog order on ties) with match_score and why_match"""
+        sector = profile_data.get('sector', '').lower()
+        stage = profile_data.get('startup_stage', '').lower()
+        funding_goal = profile_data.get('funding_goal', '').lower()
+        location = profile_data.get('location', '').lower()
+
+        if self.size == 0 or top_k <= 0:
+            return []
+
+        # Substring matching only walks the key vocabularies, not the investors
+        # (an exact sector match is also a partial one: 30 + 10 = 40)
+        sector_partial = self._lookup(self._sector_index, [s for s in self._sector_index if s in sector or sector in s])
+        sector_exact = self._lookup(self._sector_index, [sector])
+        stage_hit = self._lookup(self._stage_index, [stage])
+        goal_hit = self._lookup(self._type_index, [funding_goal])
+        location_hit = self._lookup(self._city_index, [city for city in self._city_index if city in location])
+
+        # uint8 throughout: the maximum score is 100
+        scores = (
+            sector_partial.view('u1') * SECTOR_PARTIAL_POINTS
+            + sector_exact.view('u1') * (SECTOR_EXACT_POINTS - SECTOR_PARTIAL_POINTS)
+            + stage_hit.view('u1') * STAGE_POINTS
+            + (goal_hit & ~stage_hit).view('u1') * STAGE_FALLBACK_POINTS
+            + goal_hit.view('u1') * GOAL_POINTS
+            + location_hit.view('u1') * LOCATION_POINTS
+        )
+
+        results = []
+        for i in self._top_k(scores, top_k):
+            investor = self.investors[i]
+
+            reasons = []
+            if sector_exact[i]:
+                reasons.append(f"Strong focus on {sector} sector")
+            if stage_hit[i]:
+                reasons.append(f"Invests in {stage} stage startups")
+            if goal_hit[i]:
+                reasons.append(f"Matches your {funding_goal} funding goal")
+            if location_hit[i]:
+                reasons.append("Located in your region")
+
+            results.append({
+                "name": investor["name"],
+                "type": investor["type"],
+                "focus_sectors": list(investor["focus_sectors"]),
+                "location": investor["location"],
+                "typical_ticket_size": investor["typical_ticket_size"],
+                "stage_focus": list(investor["stage_focus"]),
+                "match_score": min(int(scores[i]), 100),
+                "why_match": ". ".join(reasons) if reasons else "Good general match for Indian startups"
+            })
+        return results
+
+
+_catalog: Optional[InvestorCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_investor_catalog() -> InvestorCatalog:
+    """Process-wide catalog (loaded on first match)"""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = InvestorCatalog.from_file()
+    return _catalog
+
+
+def match_investors(profile_data: dict, top_k: int = 5) -> List[Dict]:
+    return get_investor_catalog().match(profile_data, top_k)
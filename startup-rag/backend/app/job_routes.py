@@ -0,0 +1,27 @@
+"""
+Job status API
+Progress of background ingestion jobs queued by /founder/documents and
+/rag/process-documents
+"""
+
+from fastapi import APIRouter, HTTPException
+from typing import Optional
+
+from app.jobs import job_manager
+
+jobs_router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@jobs_router.get("")
+async def list_jobs(status: Optional[str] = None, limit: int = 50):
+    """Recent jobs, newest first (optionally filtered by status)"""
+    return {"jobs": job_manager.list(status=status, limit=limit), "stats": job_manager.stats()}
+
+
+@jobs_router.get("/{job_id}")
+async def get_job(job_id: str):
+    """Status, stage, progress (0-1) and result/error of one job"""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
@@ -0,0 +1,315 @@
+"""
+Background ingestion jobs
+Uploaded PDFs are processed (Data Ingestion `process_pdf`) and incrementally
+indexed into the shared vector store by a pool of worker threads, so upload
+endpoints return immediately with a job id that clients poll for progress.
+Vector DB builds (/rag/build-vector-db) run on the same pool.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from app.rag_integration import data_ingestion_path
+
+logger = logging.getLogger(__name__)
+
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "2"))
+JOB_HISTORY_LIMIT = int(os.getenv("JOB_HISTORY_LIMIT", "200"))
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(25 * 1024 * 1024)))
+
+RAW_DIR = os.path.join(data_ingestion_path, "data", "raw")
+CHUNK_DIR = os.path.join(data_ingestion_path, "data", "chunks")
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+# Real (keyword-counted) topics for processed documents
+TOPIC_KEYWORDS = {
+    "Funding": ["funding", "investment", "investor", "seed", "series", "grant", "raise"],
+    "Market Analysis": ["market", "tam", "sam", "customer", "segment", "competition", "competitor"],
+    "Business Model": ["business model", "revenue", "pricing", "subscription", "monetization"],
+    "Financial Projections": ["projection", "forecast", "burn", "runway", "ebitda", "margin", "cash flow"],
+    "Product": ["product", "platform", "feature", "technology", "prototype", "mvp"],
+    "Team": ["team", "founder", "co-founder", "advisor", "hiring"],
+    "Traction": ["traction", "users", "growth", "retention", "pilot", "customers"],
+    "Government Schemes": ["scheme", "startup india", "dpiit", "sidbi", "msme", "subsidy"],
+}
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    source: str
+    status: str = QUEUED
+    stage: str = QUEUED
+    progress: float = 0.0
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["progress"] = round(self.progress, 2)
+        if self.started_at:
+            end = self.finished_at or time.time()
+            data["duration_seconds"] = round(end - self.started_at, 2)
+        return data
+
+
+class JobManager:
+    """
+    In-process job registry + worker pool.
+    Job state is written from worker threads and read from the event loop,
+    so every mutation goes through the lock.
+    """
+
+    def __init__(self, workers: int = INGEST_WORKERS, history_limit: int = JOB_HISTORY_LIMIT):
+        self.workers = workers
+        self.history_limit = history_limit
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            # Separate from the request blocking pool: a long OCR job must
+            # not starve /funding/advice of threads
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ingest")
+        return self._executor
+
+    def submit(self, kind: str, source: str, func: Callable[["Job"], Dict[str, Any]]) -> Job:
+        """Queue func(job) on the worker pool; returns immediately"""
+        job = Job(id=uuid.uuid4().hex[:12], kind=kind, source=source)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._trim()
+        self._get_executor().submit(self._run, job, func)
+        logger.info(f"📥 Queued {kind} job {job.id} for {os.path.basename(source)}")
+        return job
+
+    def _trim(self):
+        # Drop the oldest finished jobs past the history limit
+        if len(self._jobs) <= self.history_limit:
+            return
+        for job_id in [j.id for j in self._jobs.values() if j.status in (COMPLETED, FAILED)]:
+            if len(self._jobs) <= self.history_limit:
+                break
+            del self._jobs[job_id]
+
+    def _run(self, job: Job, func: Callable[["Job"], Dict[str, Any]]):
+        with self._lock:
+            job.status = RUNNING
+            job.stage = "starting"
+            job.started_at = time.time()
+        try:
+            result = func(job)
+            with self._lock:
+                job.result = result
+                job.status = COMPLETED
+                job.stage = COMPLETED
+                job.progress = 1.0
+            logger.info(f"✅ Job {job.id} completed in {time.time() - job.started_at:.1f}s")
+        except Exception as e:
+            with self._lock:
+                job.error = f"{type(e).__name__}: {e}"
+                job.status = FAILED
+                job.stage = FAILED
+            logger.error(f"❌ Job {job.id} failed: {job.error}")
+        finally:
+            with self._lock:
+                job.finished_at = time.time()
+
+    def update(self, job: Job, stage: str, progress: float):
+        with self._lock:
+            job.stage = stage
+            job.progress = progress
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job else None
+
+    def list(self, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        with self._lock:
+            jobs = [j for j in reversed(self._jobs.values()) if status is None or j.status == status]
+            return [j.to_dict() for j in jobs[:limit]]
+
+    def find(self, source: str) -> Optional[Dict[str, Any]]:
+        """Most recent job for a source path (any status)"""
+        with self._lock:
+            for job in reversed(self._jobs.values()):
+                if job.source == source:
+                    return job.to_dict()
+        return None
+
+    def active(self, kind: str) -> Optional[Dict[str, Any]]:
+        """A queued/running job of this kind, if any"""
+        with self._lock:
+            for job in reversed(self._jobs.values()):
+                if job.kind == kind and job.status in (QUEUED, RUNNING):
+                    return job.to_dict()
+        return None
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """Await a job without blocking the event loop; returns its latest state"""
+        deadline = time.monotonic() + timeout
+        job = self.get(job_id)
+        while job is not None and job["status"] in (QUEUED, RUNNING) and time.monotonic() < deadline:
+            await asyncio.sleep(0.2)
+            job = self.get(job_id)
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = {QUEUED: 0, RUNNING: 0, COMPLETED: 0, FAILED: 0}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+        return {"workers": self.workers, **counts}
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+job_manager = JobManager()
+
+
+# ----------------------------------------------------------------------
+# Upload + ingestion steps
+# ----------------------------------------------------------------------
+def safe_filename(filename: str) -> str:
+    name = os.path.basename((filename or "upload").replace("\\", "/"))
+    return name.replace(" ", "_") or "upload"
+
+
+def save_upload(src, dest_path: str, max_bytes: int = MAX_UPLOAD_BYTES) -> int:
+    """
+    Copy an upload's spooled file object to disk in 1MB chunks (never
+    holding the whole file in memory). Blocking - run via run_blocking.
+    """
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    size = 0
+    tmp_path = dest_path + ".part"
+    try:
+        with open(tmp_path, "wb") as out:
+            while True:
+                chunk = src.read(UPLOAD_CHUNK_BYTES)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ValueError(f"File exceeds {max_bytes // (1024 * 1024)}MB upload limit")
+                out.write(chunk)
+        os.replace(tmp_path, dest_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return size
+
+
+def detect_topics(text: str, limit: int = 4) -> List[str]:
+    lowered = text.lower()
+    scores = {
+        topic: sum(lowered.count(keyword) for keyword in keywords)
+        for topic, keywords in TOPIC_KEYWORDS.items()
+    }
+    ranked = sorted((s, t) for t, s in scores.items() if s > 0)
+    return [t for _, t in reversed(ranked)][:limit]
+
+
+def summarize_text(text: str, max_chars: int = 400) -> str:
+    """Leading sentences of the document (extractive, no LLM call)"""
+    text = " ".join(text.split())
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind(". ", 0, max_chars)
+    return text[: cut + 1] if cut > max_chars // 2 else text[:max_chars].rstrip() + "..."
+
+
+def ingest_pdf(job: Job, path: str) -> Dict[str, Any]:
+    """process_pdf -> chunk file -> incremental upsert into the shared vector store"""
+    try:
+        from ingestion.pipeline import process_pdf  # type: ignore
+        from vector_store.build_store import index_document  # type: ignore
+        from rag.resources import get_embedder, get_vector_store  # type: ignore
+    except ImportError as e:
+        raise RuntimeError(f"RAG pipeline not available in this deployment: {e}")
+
+    job_manager.update(job, "extracting", 0.1)
+    result = process_pdf(path)
+    chunks = result["chunks"]
+    metadata = result["metadata"]
+
+    # Same chunk-file format as Data Ingestion/app.py so full rebuilds include it
+    job_manager.update(job, "saving_chunks", 0.6)
+    filename = os.path.basename(path)
+    os.makedirs(CHUNK_DIR, exist_ok=True)
+    chunk_file = os.path.splitext(filename)[0] + "_chunks.json"
+    chunk_path = os.path.join(CHUNK_DIR, chunk_file)
+    # A concurrent build may be reading this file: swap it in whole
+    tmp_path = chunk_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"file_name": filename, "chunk_count": len(chunks), "metadata": metadata, "chunks": chunks},
+            f, ensure_ascii=False, indent=2,
+        )
+    os.replace(tmp_path, chunk_path)
+
+    job_manager.update(job, "indexing", 0.7)
+    indexed = index_document(chunk_file, chunks, metadata, get_embedder(), get_vector_store())
+
+    raw_text = result.get("raw_text", "")
+    return {
+        "name": filename,
+        "page_count": result["page_count"],
+        "word_count": len(raw_text.split()),
+        "language": result["language"],
+        "chunks": len(chunks),
+        "indexed_chunks": indexed,
+        "summary": summarize_text(" ".join(chunks[:2]) if chunks else raw_text),
+        "key_topics": detect_topics(raw_text),
+    }
+
+
+def submit_pdf_ingestion(path: str) -> Job:
+    return job_manager.submit("pdf_ingestion", path, lambda job: ingest_pdf(job, path))
+
+
+def build_index(job: Job, rebuild: bool) -> Dict[str, Any]:
+    """Incremental vector DB build over Data Ingestion/data/chunks"""
+    try:
+        from vector_store.build_store import build_vector_database  # type: ignore
+        from rag.resources import get_embedder, get_vector_store  # type: ignore
+    except ImportError as e:
+        raise RuntimeError(f"RAG pipeline not available in this deployment: {e}")
+
+    def progress(done: int, total: int, file_name: str):
+        job_manager.update(job, f"indexed {file_name}", done / total)
+
+    job_manager.update(job, "scanning", 0.0)
+    return build_vector_database(get_embedder(), get_vector_store(), rebuild=rebuild, progress=progress)
+
+
+def submit_vector_db_build(rebuild: bool = False) -> Dict[str, Any]:
+    """Start a build job, or return the one already queued/running"""
+    running = job_manager.active("vector_db_build")
+    if running is not None:
+        return running
+    return job_manager.submit("vector_db_build", CHUNK_DIR, lambda job: build_index(job, rebuild)).to_dict()
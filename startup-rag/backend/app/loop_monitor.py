@@ -0,0 +1,248 @@
+"""
+Event-loop blocking detector
+A heartbeat task on the event loop wakes every LOOP_MONITOR_INTERVAL and
+records how late it ran (histogram "event_loop.lag", exported on /metrics).
+A watchdog thread notices when the heartbeat stalls for longer than
+LOOP_BLOCK_THRESHOLD_MS and samples the loop thread's stack until the loop
+comes back. Each stall is then recorded with its duration, the most
+frequent stack sample and the route responsible. The route is the handler
+found on that stack, or else the requests in flight at the time. Stalls
+are logged and the most recent ones are served by GET /debug/loop.
+
+Off by default (LOOP_MONITOR=true). The loop side is one sleep per tick
+and the watchdog only reads frames while the loop is stalled, so it is
+safe to leave on in staging under load. Code that blocks while holding
+the GIL (a long pure-Python loop) gets fewer samples than blocking I/O or
+time.sleep, but its duration is still measured.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+from collections import Counter, deque
+from datetime import datetime
+from time import perf_counter
+from typing import Dict, Optional
+
+from app import metrics
+
+logger = logging.getLogger(__name__)
+
+LOOP_MONITOR_ENABLED = os.getenv("LOOP_MONITOR", "false").lower() == "true"
+LOOP_MONITOR_INTERVAL = float(os.getenv("LOOP_MONITOR_INTERVAL", "0.02"))
+LOOP_BLOCK_THRESHOLD_MS = float(os.getenv("LOOP_BLOCK_THRESHOLD_MS", "100"))
+LOOP_SAMPLE_INTERVAL = float(os.getenv("LOOP_SAMPLE_INTERVAL", "0.01"))
+LOOP_MONITOR_KEEP = int(os.getenv("LOOP_MONITOR_KEEP", "50"))
+
+LAG_METRIC = "event_loop.lag"
+STACK_DEPTH = 20
+UNATTRIBUTED = "unattributed"
+
+
+def _frame_location(frame) -> str:
+    code = frame.f_code
+    path = code.co_filename.replace("\\", "/").rsplit("/", 2)
+    return f"{'/'.join(path[-2:])}:{frame.f_lineno} in {code.co_name}"
+
+
+class LoopMonitor:
+    """Heartbeat on the loop + watchdog thread that attributes stalls"""
+
+    def __init__(
+        self,
+        interval: float = LOOP_MONITOR_INTERVAL,
+        threshold_ms: float = LOOP_BLOCK_THRESHOLD_MS,
+        sample_interval: float = LOOP_SAMPLE_INTERVAL,
+        keep: int = LOOP_MONITOR_KEEP,
+    ):
+        self.interval = interval
+        self.threshold_ms = threshold_ms
+        self.sample_interval = sample_interval
+        self.stalls = deque(maxlen=keep)
+        self.routes: Dict[str, Dict] = {}
+        self.blocked_seconds = 0.0
+        self.started_at: Optional[float] = None
+        self._app = None
+        self._endpoints: Dict[object, str] = {}
+        self._in_flight: Counter = Counter()
+        self._heartbeat = 0.0
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    # ---------- lifecycle ----------
+    def start(self, app=None):
+        """Call from the running loop (app lifespan)"""
+        if self.running:
+            return
+        self._app = app
+        self._endpoints = {}
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = perf_counter()
+        self.started_at = self._heartbeat
+        self._stop.clear()
+        self._task = asyncio.create_task(self._beat())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info(
+            f"🩺 Event-loop monitor on (tick {self.interval * 1000:.0f}ms, "
+            f"stall threshold {self.threshold_ms:.0f}ms)"
+        )
+
+    def stop(self):
+        if not self.running:
+            return
+        self._stop.set()
+        self._task.cancel()
+        self._task = None
+        self._watchdog.join(timeout=1)
+
+    # ---------- loop side ----------
+    async def _beat(self):
+        interval = self.interval
+        while True:
+            start = perf_counter()
+            self._heartbeat = start
+            await asyncio.sleep(interval)
+            now = perf_counter()
+            self._heartbeat = now
+            metrics.histogram(LAG_METRIC).observe(max(0.0, now - start - interval))
+
+    def request_started(self, key: str):
+        self._in_flight[key] += 1
+
+    def request_finished(self, key: str):
+        self._in_flight[key] -= 1
+        if self._in_flight[key] <= 0:
+            del self._in_flight[key]
+
+    # ---------- watchdog thread ----------
+    def _endpoint_routes(self) -> Dict[object, str]:
+        """handler code object -> "METHOD /path" (built on the first stall)"""
+        if not self._endpoints and self._app is not None:
+            for route in getattr(self._app, "routes", []):
+                code = getattr(getattr(route, "endpoint", None), "__code__", None)
+                if code is not None:
+                    methods = ",".join(sorted(getattr(route, "methods", None) or []))
+                    self._endpoints[code] = f"{methods} {route.path}".strip()
+        return self._endpoints
+
+    def _sample(self, frame, endpoints: Dict[object, str]):
+        """(route or None, innermost-last stack) for one frame chain"""
+        stack, route = [], None
+        while frame is not None:
+            if len(stack) < STACK_DEPTH:
+                stack.append(_frame_location(frame))
+            if route is None:
+                route = endpoints.get(frame.f_code)
+            frame = frame.f_back
+        return route, tuple(reversed(stack))
+
+    def _watch(self):
+        threshold = self.threshold_ms / 1000
+        while not self._stop.wait(self.sample_interval):
+            stalled_since = self._heartbeat
+            if perf_counter() - stalled_since < self.interval + threshold:
+                continue
+
+            # Blocked: sample the loop thread until the heartbeat moves again
+            endpoints = self._endpoint_routes()
+            try:
+                in_flight = dict(self._in_flight)
+            except RuntimeError:  # changed under us just before the loop stalled
+                in_flight = {}
+            samples: Counter = Counter()
+            while self._heartbeat == stalled_since and not self._stop.is_set():
+                frame = sys._current_frames().get(self._loop_thread_id)
+                if frame is not None:
+                    samples[self._sample(frame, endpoints)] += 1
+                del frame
+                self._stop.wait(self.sample_interval)
+            if self._stop.is_set():
+                return
+            self._record(self._heartbeat - stalled_since - self.interval, samples, in_flight)
+
+    def _record(self, blocked: float, samples: Counter, in_flight: Dict[str, int]):
+        route, stack = samples.most_common(1)[0][0] if samples else (None, ())
+        if route is None:
+            # Handler not on the stack (middleware, serialization, a callback):
+            # blame what was in flight
+            route = " | ".join(sorted(in_flight)) if 0 < len(in_flight) <= 3 else UNATTRIBUTED
+
+        blocked_ms = round(blocked * 1000, 1)
+        stall = {
+            "at": datetime.now().isoformat(timespec="milliseconds"),
+            "blocked_ms": blocked_ms,
+            "route": route,
+            "samples": sum(samples.values()),
+            "stack": list(stack),
+            "in_flight": in_flight,
+        }
+        with self._lock:
+            self.stalls.append(stall)
+            self.blocked_seconds += blocked
+            totals = self.routes.setdefault(route, {"stalls": 0, "blocked_ms": 0.0, "max_ms": 0.0})
+            totals["stalls"] += 1
+            totals["blocked_ms"] = round(totals["blocked_ms"] + blocked_ms, 1)
+            totals["max_ms"] = max(totals["max_ms"], blocked_ms)
+
+        where = stack[-1] if stack else "no stack sample"
+        logger.warning(f"🐢 Event loop blocked {blocked_ms:.0f}ms in {route} at {where}")
+
+    # ---------- reporting ----------
+    def snapshot(self, limit: int = LOOP_MONITOR_KEEP) -> Dict:
+        with self._lock:
+            stalls = list(self.stalls)[-limit:] if limit > 0 else []
+            routes = sorted(self.routes.items(), key=lambda item: -item[1]["blocked_ms"])
+            blocked = self.blocked_seconds
+        uptime = perf_counter() - self.started_at if self.started_at else 0.0
+        return {
+            "enabled": LOOP_MONITOR_ENABLED,
+            "running": self.running,
+            "interval_ms": round(self.interval * 1000, 1),
+            "threshold_ms": self.threshold_ms,
+            "uptime_s": round(uptime, 1),
+            "blocked_ms": round(blocked * 1000, 1),
+            "blocked_share": round(blocked / uptime, 4) if uptime else 0.0,
+            "lag": metrics.histogram(LAG_METRIC).snapshot(),
+            "routes": dict(routes),
+            "in_flight": dict(self._in_flight),
+            "stalls": list(reversed(stalls)),  # newest first
+        }
+
+    def reset(self):
+        with self._lock:
+            self.stalls.clear()
+            self.routes.clear()
+            self.blocked_seconds = 0.0
+            self.started_at = perf_counter() if self.running else None
+
+
+class LoopMonitorMiddleware:
+    """ASGI middleware tracking in-flight requests for stall attribution"""
+
+    def __init__(self, app, monitor: Optional[LoopMonitor] = None):
+        self.app = app
+        self.monitor = monitor or loop_monitor
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.monitor.running:
+            await self.app(scope, receive, send)
+            return
+        key = f"{scope['method']} {scope['path']}"
+        self.monitor.request_started(key)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.monitor.request_finished(key)
+
+
+loop_monitor = LoopMonitor()
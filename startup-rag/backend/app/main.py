@@ -1,8 +1,10 @@
 import os
 import sys
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.responses import Response, JSONResponse
 
 # Working directory check (warning only - does not block production)
 current_dir = os.getcwd()
@@ -23,14 +25,48 @@ from app.routes import router
 from app.rag_routes import rag_router
 from app.market_routes import market_router
 from app.financial_narrative_routes import financial_router
-from app.multilingual_rag import ChatRequest, chat_multilingual
+from app.job_routes import jobs_router
+from app.jobs import job_manager
+from app.profile_store import profile_store
+from app.multilingual_rag import ChatRequest, chat_multilingual, stream_multilingual_chat
+from app.sse import sse_response
+from app.rag_integration import rag_retriever
+from app import concurrency
+from app import metrics
+from app.loop_monitor import LOOP_MONITOR_ENABLED, LoopMonitorMiddleware, loop_monitor
+from app.response_cache import RESPONSE_CACHE_ENABLED, ResponseCacheMiddleware, response_cache
+
+# Build + warm the RAG retriever in the background at startup, so the first
+# user does not pay the Chroma/embedder init (disable with RAG_WARMUP=false)
+RAG_WARMUP = os.getenv("RAG_WARMUP", "true").lower() != "false"
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warmup_task = asyncio.create_task(rag_retriever.run_warmup_loop()) if RAG_WARMUP else None
+    if LOOP_MONITOR_ENABLED:
+        loop_monitor.start(app)
+    yield
+    loop_monitor.stop()
+    if warmup_task is not None:
+        warmup_task.cancel()
+    job_manager.shutdown()
+    profile_store.close()
+    response_cache.close()
+    # Release pooled LLM connections and blocking-pool threads
+    await concurrency.shutdown()
 
 app = FastAPI(
     title="Nivesh.ai Backend",
     description="AI Funding Co-Founder for Indian Startups",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# Cached dashboard endpoints (see app/response_cache.py). Added before CORS:
+# the last middleware added runs outermost, and cached responses need CORS headers
+if RESPONSE_CACHE_ENABLED:
+    app.add_middleware(ResponseCacheMiddleware)
+
 # Production-ready CORS configuration
 # Note: FastAPI requires exact origin matches - wildcards like *.vercel.app don't work
 ALLOWED_ORIGINS = os.getenv(
@@ -53,20 +89,61 @@ async def preflight_middleware(request: Request, call_next):
         return Response(status_code=204)
     return await call_next(request)
 
+# Event-loop stall detector (LOOP_MONITOR=true, see app/loop_monitor.py)
+if LOOP_MONITOR_ENABLED:
+    app.add_middleware(LoopMonitorMiddleware)
+
 app.include_router(router)
 app.include_router(rag_router)
 app.include_router(market_router)
 app.include_router(financial_router)  # Financial Narrative Generator (isolated feature)
+app.include_router(jobs_router)
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint for Render"""
     return {"status": "healthy", "service": "Nivesh.ai Backend"}
 
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness probe: 200 only once RAG retrieval is hot (or RAG is not
+    deployed), 503 while warming up or retrying a failed init.
+    /health stays a pure liveness check.
+    """
+    rag_status = rag_retriever.status()
+    if not RAG_WARMUP and rag_status["state"] == "cold":
+        # Warm-up disabled: RAG initializes on first use, don't gate traffic on it
+        rag_status["ready"] = True
+    return JSONResponse(
+        status_code=200 if rag_status["ready"] else 503,
+        content={"status": "ready" if rag_status["ready"] else "not_ready", "rag": rag_status},
+    )
+
+@app.get("/metrics")
+async def metrics_endpoint():
+    """Per-stage latency histograms + p50/p95/p99 (Prometheus text format)"""
+    return Response(content=metrics.render_prometheus(), media_type=metrics.PROMETHEUS_CONTENT_TYPE)
+
+@app.get("/debug/loop")
+async def loop_debug(limit: int = 20, reset: bool = False):
+    """Event-loop lag, blocked time per route and the latest stalls with stacks"""
+    if not LOOP_MONITOR_ENABLED:
+        return JSONResponse(status_code=404, content={"detail": "Loop monitor disabled (set LOOP_MONITOR=true)"})
+    report = loop_monitor.snapshot(limit)
+    if reset:
+        loop_monitor.reset()
+    return report
+
 @app.post("/chat-multilingual")
 async def chat_multilingual_endpoint(request: ChatRequest):
     return await chat_multilingual(request)
 
+@app.post("/chat-multilingual/stream")
+async def chat_multilingual_stream_endpoint(request: ChatRequest):
+    """Same as /chat-multilingual but streams tokens as Server-Sent Events"""
+    return sse_response(stream_multilingual_chat(request))
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", "8000"))
@@ -36,6 +36,19 @@ class MarketAnalyzer:
             # Return demo data if Gemini fails
             return self._get_demo_response(query, language)
     
+    async def analyze_market_async(self, query: str, language: str = "en") -> Dict:
+        """Same pipeline as analyze_market without blocking the event loop"""
+        prompt = self._build_market_prompt(query, language)
+        
+        try:
+            response = await self.gemini_client.test_generation_async(prompt)
+            parsed_result = self._parse_market_response(response)
+            parsed_result['sources'] = ['Gemini AI Analysis']
+            return parsed_result
+        except Exception as e:
+            # Return demo data if Gemini fails
+            return self._get_demo_response(query, language)
+    
     def _build_market_prompt(self, query: str, language: str) -> str:
         """Build market analysis prompt"""
         
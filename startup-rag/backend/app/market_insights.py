@@ -0,0 +1,270 @@
+"""
+Market Insights
+Sector market data (2024-2025 Indian market) with a location-specific
+note on competition and advantages.
+
+Sector tables are module constants and the sector/region part of each
+answer is memoized; only the echoed sector/location labels are built per
+request.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from app.gazetteer import resolve_location
+
+# Location-specific market adjustments, first matching region wins
+REGIONS = [
+    (frozenset(['bangalore']), {
+        "market_note": "Bangalore has the highest startup density in India with 4000+ startups.",
+        "growth_multiplier": 1.2,
+        "competition_level": "Very High",
+        "key_advantage": "Access to top-tier VCs and angel networks"
+    }),
+    (frozenset(['mumbai', 'pune']), {
+        "market_note": "Mumbai is India's financial capital with strong B2B focus.",
+        "growth_multiplier": 1.15,
+        "competition_level": "High",
+        "key_advantage": "Strong corporate connections and B2B opportunities"
+    }),
+    (frozenset(['delhi', 'noida', 'gurgaon']), {
+        "market_note": "Delhi NCR has the largest startup ecosystem with strong government support.",
+        "growth_multiplier": 1.1,
+        "competition_level": "High",
+        "key_advantage": "Government grants and policy support"
+    }),
+    (frozenset(['hyderabad', 'chennai']), {
+        "market_note": "Emerging tech hubs with lower operational costs.",
+        "growth_multiplier": 1.05,
+        "competition_level": "Medium",
+        "key_advantage": "Cost-effective operations and growing ecosystem"
+    }),
+]
+OTHER_REGION = {
+    "growth_multiplier": 1.0,
+    "competition_level": "Medium-Low",
+    "key_advantage": "Lower costs and less competition"
+}
+
+# Comprehensive sector data (2024-2025 Indian market)
+SECTOR_DATA = {
+    'fintech': {
+        "market_size": "₹6,20,000 Cr (2024), projected ₹12,00,000 Cr by 2027",
+        "growth_rate": "22% CAGR (2024-2027)",
+        "key_trends": [
+            "UPI and digital payments adoption accelerating",
+            "Regulatory clarity improving (RBI guidelines)",
+            "Embedded finance and B2B fintech growing",
+            "Neo-banking and credit solutions expanding"
+        ],
+        "opportunities": [
+            "Rural fintech penetration (70% untapped market)",
+            "SME lending and supply chain finance",
+            "Wealth tech and investment platforms",
+            "Insurance tech (InsurTech) growth"
+        ],
+        "challenges": [
+            "Regulatory compliance complexity",
+            "Competition from established banks",
+            "Customer acquisition costs",
+            "Data security and privacy concerns"
+        ],
+        "competitor_landscape": "Highly competitive with 2000+ fintech startups. Key players: Paytm, Razorpay, PhonePe, CRED, Groww. Market dominated by payment solutions, but lending and wealth tech are emerging."
+    },
+    'saas': {
+        "market_size": "₹1,50,000 Cr (2024), projected ₹4,00,000 Cr by 2027",
+        "growth_rate": "28% CAGR (2024-2027)",
+        "key_trends": [
+            "SMB digital transformation driving demand",
+            "Vertical SaaS solutions gaining traction",
+            "AI/ML integration in SaaS products",
+            "Global expansion by Indian SaaS companies"
+        ],
+        "opportunities": [
+            "Vertical SaaS for Indian industries",
+            "SMB-focused solutions",
+            "API-first and composable architecture",
+            "International market expansion"
+        ],
+        "challenges": [
+            "Price sensitivity in Indian market",
+            "Competition from global players",
+            "Customer retention and churn",
+            "Sales cycle length"
+        ],
+        "competitor_landscape": "Growing market with 10,000+ SaaS startups. Leaders: Freshworks, Zoho, Chargebee, Postman. Strong global presence but local market still developing."
+    },
+    'healthtech': {
+        "market_size": "₹2,50,000 Cr (2024), projected ₹5,00,000 Cr by 2027",
+        "growth_rate": "25% CAGR (2024-2027)",
+        "key_trends": [
+            "Telemedicine adoption post-COVID",
+            "AI-powered diagnostics and treatment",
+            "Health insurance tech integration",
+            "Preventive healthcare focus"
+        ],
+        "opportunities": [
+            "Tier-2/3 city healthcare access",
+            "Chronic disease management",
+            "Mental health platforms",
+            "Pharmacy and diagnostics tech"
+        ],
+        "challenges": [
+            "Regulatory approvals (DCGI, etc.)",
+            "Doctor adoption and trust",
+            "Data privacy (HIPAA-like compliance)",
+            "Insurance integration complexity"
+        ],
+        "competitor_landscape": "Moderate competition with 3000+ healthtech startups. Key players: Practo, 1mg, PharmEasy, Portea. Market fragmented with room for specialization."
+    },
+    'edtech': {
+        "market_size": "₹1,80,000 Cr (2024), projected ₹3,50,000 Cr by 2027",
+        "growth_rate": "20% CAGR (2024-2027)",
+        "key_trends": [
+            "Personalized learning with AI",
+            "Skill-based and vocational training",
+            "B2B enterprise learning solutions",
+            "Regional language content"
+        ],
+        "opportunities": [
+            "K-12 supplementary education",
+            "Professional upskilling",
+            "Regional language content",
+            "Test preparation and competitive exams"
+        ],
+        "challenges": [
+            "High customer acquisition costs",
+            "Low completion rates",
+            "Regulatory changes in education",
+            "Competition from traditional players"
+        ],
+        "competitor_landscape": "Highly competitive with 4500+ edtech startups. Dominated by Byju's, Unacademy, Vedantu. Market consolidation happening, focus shifting to profitability."
+    },
+    'agritech': {
+        "market_size": "₹1,20,000 Cr (2024), projected ₹2,50,000 Cr by 2027",
+        "growth_rate": "18% CAGR (2024-2027)",
+        "key_trends": [
+            "Precision agriculture with IoT and AI",
+            "Farm-to-consumer direct models",
+            "Supply chain optimization",
+            "Climate-resilient farming solutions"
+        ],
+        "opportunities": [
+            "Farmer advisory and market linkage",
+            "Agri-input e-commerce",
+            "Post-harvest management",
+            "Organic and sustainable farming"
+        ],
+        "challenges": [
+            "Farmer adoption and digital literacy",
+            "Seasonal and weather dependencies",
+            "Logistics in rural areas",
+            "Price volatility"
+        ],
+        "competitor_landscape": "Emerging market with 1000+ agritech startups. Key players: Ninjacart, DeHaat, CropIn. Government support increasing, but market still early stage."
+    },
+    'deeptech': {
+        "market_size": "₹80,000 Cr (2024), projected ₹2,00,000 Cr by 2027",
+        "growth_rate": "30% CAGR (2024-2027)",
+        "key_trends": [
+            "AI/ML and GenAI applications",
+            "Quantum computing research",
+            "Robotics and automation",
+            "Space tech and satellite solutions"
+        ],
+        "opportunities": [
+            "Enterprise AI solutions",
+            "Hardware-software integration",
+            "Research commercialization",
+            "Global market entry"
+        ],
+        "challenges": [
+            "Long development cycles",
+            "High capital requirements",
+            "Talent acquisition",
+            "Market education"
+        ],
+        "competitor_landscape": "Niche but growing with 500+ deeptech startups. Government support strong. Key focus: AI, robotics, space tech. Global competition intense."
+    },
+    'd2c': {
+        "market_size": "₹2,00,000 Cr (2024), projected ₹4,50,000 Cr by 2027",
+        "growth_rate": "24% CAGR (2024-2027)",
+        "key_trends": [
+            "Brand building and customer loyalty",
+            "Omnichannel presence",
+            "Sustainability and ethical products",
+            "Social commerce integration"
+        ],
+        "opportunities": [
+            "Niche category leadership",
+            "Tier-2/3 city expansion",
+            "Private label and white-label",
+            "International exports"
+        ],
+        "challenges": [
+            "High customer acquisition costs",
+            "Inventory management",
+            "Logistics and fulfillment",
+            "Competition from established brands"
+        ],
+        "competitor_landscape": "Very competitive with 5000+ D2C brands. Key players: Mamaearth, Boat, Lenskart. Market consolidating, focus on profitability over growth."
+    }
+}
+
+GENERIC_SECTOR_DATA = {
+    "market_size": "₹1,00,000 Cr (2024), projected ₹2,00,000 Cr by 2027",
+    "growth_rate": "20% CAGR (2024-2027)",
+    "key_trends": [
+        "Digital transformation acceleration",
+        "Increased investor interest",
+        "Regulatory support",
+        "Market consolidation"
+    ],
+    "opportunities": [
+        "Untapped market segments",
+        "Government initiatives",
+        "Growing digital adoption",
+        "International expansion"
+    ],
+    "challenges": [
+        "Competition from established players",
+        "Regulatory compliance",
+        "Customer acquisition",
+        "Talent acquisition"
+    ],
+    "competitor_landscape": "Competitive market with growing number of startups. Focus on differentiation and market fit."
+}
+
+
+def get_precise_market_insights(sector: str, location: str = "") -> dict:
+    """Get precise market insights based on sector and location data"""
+    
+    location_lower = location.lower() if location else ""
+    cities = resolve_location(location_lower).cities
+    region = next((i for i, (region_cities, _) in enumerate(REGIONS) if cities & region_cities), None)
+
+    result = {
+        "sector": sector.capitalize(),
+        "location": location.title() if location else "All India",
+        **_insights(sector, region)
+    }
+    if region is None:
+        result["location_note"] = f"{location.title() if location else 'Your location'} offers lower costs and growing startup support."
+    return result
+
+
+@lru_cache(maxsize=256)
+def _insights(sector: str, region: Optional[int]) -> dict:
+    location_adjustments = REGIONS[region][1] if region is not None else OTHER_REGION
+    
+    # Get data for sector or return generic
+    data = SECTOR_DATA.get(sector, GENERIC_SECTOR_DATA)
+    
+    return {
+        "market_size": data.get("market_size", ""),
+        "growth_rate": data.get("growth_rate", ""),
+        "location_note": location_adjustments.get("market_note", ""),
+        "competition_level": location_adjustments.get("competition_level", "Medium"),
+        "key_advantage": location_adjustments.get("key_advantage", ""),
+        **{k: v for k, v in data.items() if k not in ["market_size", "growth_rate"]}
+    }
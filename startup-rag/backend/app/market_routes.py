@@ -44,7 +44,7 @@ async def analyze_market_size(request: MarketRequest):
             enhanced_query = request.query
         
         # Analyze market
-        result = market_analyzer.analyze_market(enhanced_query, request.language)
+        result = await market_analyzer.analyze_market_async(enhanced_query, request.language)
         
         return MarketResponse(**result)
         
@@ -0,0 +1,110 @@
+"""
+Per-stage latency metrics for the API request path
+Each stage of /funding/advice (retrieval, prompt, cache, Groq, validation)
+is timed into a fixed-bucket histogram. Recording is a bisect plus a few
+adds under a lock, cheap enough to leave on (METRICS_ENABLED=false turns
+stages into no-ops). GET /metrics exposes the histograms, p50/p95/p99
+estimates and error counts in Prometheus text format, followed by the
+Data Ingestion RAG stage metrics. Histograms and the exposition format
+are shared with the RAG pipeline (rag/telemetry.py), which only needs the
+standard library, so importing it doesn't pull in Chroma. Without Data
+Ingestion in the deployment, stages are no-ops and /metrics is empty.
+"""
+
+import logging
+import os
+from time import perf_counter
+from typing import Dict
+
+import app.rag_integration  # noqa: F401  (puts Data Ingestion on sys.path)
+
+logger = logging.getLogger(__name__)
+
+try:
+    from rag import telemetry  # type: ignore
+except ImportError:
+    telemetry = None
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() != "false"
+METRIC_PREFIX = "api"
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _NullHistogram:
+    __slots__ = ()
+
+    def observe(self, seconds: float, error: bool = False):
+        pass
+
+    def snapshot(self) -> Dict:
+        return {"count": 0, "errors": 0}
+
+
+class _NullRegistry:
+    """Stand-in when rag.telemetry isn't available"""
+
+    _histogram = _NullHistogram()
+
+    def histogram(self, name: str) -> _NullHistogram:
+        return self._histogram
+
+    def snapshot(self) -> Dict[str, Dict]:
+        return {}
+
+    def clear(self):
+        pass
+
+    def render_prometheus(self, prefix: str, pipeline: str) -> str:
+        return ""
+
+
+if telemetry is not None:
+    _registry = telemetry.Registry()
+else:
+    logger.warning("⚠️ API metrics off - Data Ingestion (rag.telemetry) not deployed")
+    _registry = _NullRegistry()
+
+histogram = _registry.histogram
+snapshot = _registry.snapshot
+reset = _registry.clear
+
+
+class _Stage:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        histogram(self.name).observe(perf_counter() - self.start, exc_type is not None)
+        return False
+
+
+class _NoopStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopStage()
+
+
+def stage(name: str):
+    """with stage("advice.groq"): ... - works around awaits and in worker threads"""
+    return _Stage(name) if METRICS_ENABLED and telemetry is not None else _NOOP
+
+
+def render_prometheus() -> str:
+    """API stage histograms, then the RAG engine stages"""
+    if telemetry is None:
+        return ""
+    return _registry.render_prometheus(METRIC_PREFIX, "API") + telemetry.render_prometheus()
@@ -1,7 +1,9 @@
 from fastapi import HTTPException
 from pydantic import BaseModel
 from typing import Optional
-from langdetect import detect
+import logging
+
+logger = logging.getLogger(__name__)
 
 class ChatRequest(BaseModel):
     message: str
@@ -29,6 +31,7 @@ LANGUAGE_CODES = {
 def detect_language(text: str) -> str:
     """Detect language of input text"""
     try:
+        from langdetect import detect  # loads language profiles; keep off the import path
         detected = detect(text)
         return LANGUAGE_CODES.get(detected, 'English')
     except:
@@ -61,4 +64,38 @@ async def chat_multilingual(request: ChatRequest):
             detected_language=detected_lang
         )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def build_multilingual_chat_prompt(message: str, language: str) -> str:
+    """Grounded chat prompt: retrieved knowledge-base context + answer-language instruction"""
+    from app.rag_integration import rag_retriever
+
+    docs, metas = rag_retriever.retrieve_context(message, top_k=3)
+    context = rag_retriever.format_rag_context(docs, metas)
+
+    prompt = f"Please respond in {language}.\n\n"
+    if context:
+        prompt += f"Use this startup funding knowledge where relevant:\n{context}\n\n"
+    return prompt + f"Question: {message}"
+
+
+async def stream_multilingual_chat(request: ChatRequest):
+    """Yield SSE frames for a chat answer as Groq generates it"""
+    from app.groq_client import groq_client
+    from app.concurrency import run_blocking
+    from app.sse import sse_event
+
+    detected_lang = request.language or detect_language(request.message)
+    yield sse_event("meta", {"detected_language": detected_lang})
+
+    try:
+        prompt = await run_blocking(build_multilingual_chat_prompt, request.message, detected_lang)
+        system_prompt = "You are a friendly Indian startup funding assistant. Answer clearly and concisely."
+        async for token in groq_client.stream_generation_async(prompt, system_prompt=system_prompt):
+            yield sse_event("token", {"content": token})
+    except Exception as e:
+        logger.error(f"❌ Streaming chat failed: {type(e).__name__}: {str(e)}")
+        yield sse_event("error", {"detail": str(e)})
+
+    yield sse_event("done", {})
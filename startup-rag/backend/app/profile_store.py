@@ -0,0 +1,310 @@
+"""
+Founder profile store
+Profiles are keyed per founder (X-Founder-ID header, falling back to
+"default_founder" for clients that don't send one) and persisted in a
+pluggable backend - SQLite by default, so every uvicorn worker on the host
+shares the same state and profiles survive restarts. An in-process LRU
+front keeps reads on the hot endpoints (advice, readiness, timeline,
+investors) to a dict lookup; entries are re-read from the backend after a
+short TTL so writes made by another worker are picked up. Async callers
+use get_record_async / get_async, which only leave the event loop (for a
+blocking-pool thread) on a cache miss.
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from fastapi import Header, HTTPException
+
+from app.concurrency import run_blocking
+
+logger = logging.getLogger(__name__)
+
+PROFILE_STORE = os.getenv("PROFILE_STORE", "sqlite").lower()  # sqlite | memory
+PROFILE_DB_PATH = os.getenv("PROFILE_DB_PATH", os.path.join("data", "profiles.sqlite3"))
+PROFILE_CACHE_SIZE = int(os.getenv("PROFILE_CACHE_SIZE", "1024"))
+PROFILE_CACHE_TTL = float(os.getenv("PROFILE_CACHE_TTL", "5"))
+
+DEFAULT_FOUNDER_ID = "default_founder"
+FOUNDER_ID_RE = re.compile(r"^[A-Za-z0-9_.:-]{1,64}$")
+
+
+# ----------------------------------------------------------------------
+# Backends
+# A record is {"profile": dict, "version": int, "updated_at": float}.
+# Anything shared between workers (Redis, Postgres, ...) can be plugged in
+# by implementing get/put/delete and registering it in BACKENDS.
+# ----------------------------------------------------------------------
+class ProfileBackend:
+    name = "base"
+
+    def get(self, founder_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def put(self, founder_id: str, profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Store the profile, bump its version and return the new record"""
+        raise NotImplementedError
+
+    def delete(self, founder_id: str) -> bool:
+        raise NotImplementedError
+
+    def count(self) -> int:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class InMemoryProfileBackend(ProfileBackend):
+    """Single-process only (tests, local dev)"""
+
+    name = "memory"
+
+    def __init__(self):
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, founder_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._records.get(founder_id)
+            return dict(record) if record else None
+
+    def put(self, founder_id: str, profile: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            previous = self._records.get(founder_id)
+            record = {
+                "profile": dict(profile),
+                "version": (previous["version"] + 1) if previous else 1,
+                "updated_at": time.time(),
+            }
+            self._records[founder_id] = record
+            return dict(record)
+
+    def delete(self, founder_id: str) -> bool:
+        with self._lock:
+            return self._records.pop(founder_id, None) is not None
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._records)
+
+
+class SQLiteProfileBackend(ProfileBackend):
+    """
+    One row per founder. WAL mode lets workers read while another writes;
+    connections are per thread (sqlite3 objects are not shareable) and
+    tracked so close() can release the blocking pool's ones too.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str = PROFILE_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._conns = set()
+        self._conns_lock = threading.Lock()
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or conn not in self._conns:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Only this thread uses it; check_same_thread=False lets close() run elsewhere
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._conns_lock:
+                self._conns.add(conn)
+        if not self._schema_ready:
+            with self._schema_lock:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS founder_profiles ("
+                    " founder_id TEXT PRIMARY KEY,"
+                    " profile TEXT NOT NULL,"
+                    " version INTEGER NOT NULL,"
+                    " updated_at REAL NOT NULL)"
+                )
+                self._schema_ready = True
+        return conn
+
+    def get(self, founder_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute(
+            "SELECT profile, version, updated_at FROM founder_profiles WHERE founder_id = ?",
+            (founder_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return {"profile": json.loads(row[0]), "version": row[1], "updated_at": row[2]}
+
+    def put(self, founder_id: str, profile: Dict[str, Any]) -> Dict[str, Any]:
+        now = time.time()
+        # Upsert + version bump in one statement: concurrent writers from
+        # different workers can't hand out the same version
+        row = self._connect().execute(
+            "INSERT INTO founder_profiles (founder_id, profile, version, updated_at) VALUES (?, ?, 1, ?) "
+            "ON CONFLICT(founder_id) DO UPDATE SET "
+            " profile = excluded.profile,"
+            " version = founder_profiles.version + 1,"
+            " updated_at = excluded.updated_at "
+            "RETURNING version",
+            (founder_id, json.dumps(profile, default=str), now),
+        ).fetchone()
+        return {"profile": dict(profile), "version": row[0], "updated_at": now}
+
+    def delete(self, founder_id: str) -> bool:
+        cursor = self._connect().execute("DELETE FROM founder_profiles WHERE founder_id = ?", (founder_id,))
+        return cursor.rowcount > 0
+
+    def count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM founder_profiles").fetchone()[0]
+
+    def close(self):
+        # Every thread's connection, not just the caller's
+        with self._conns_lock:
+            conns, self._conns = self._conns, set()
+        for conn in conns:
+            conn.close()
+        self._local.conn = None
+
+
+BACKENDS = {
+    "sqlite": SQLiteProfileBackend,
+    "memory": InMemoryProfileBackend,
+}
+
+
+def create_backend(name: str = PROFILE_STORE) -> ProfileBackend:
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown PROFILE_STORE '{name}' (expected one of: {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
+
+
+# ----------------------------------------------------------------------
+# Cached store
+# ----------------------------------------------------------------------
+class ProfileStore:
+    """LRU + TTL cache in front of a ProfileBackend (thread-safe)"""
+
+    def __init__(
+        self,
+        backend: Optional[ProfileBackend] = None,
+        max_entries: int = PROFILE_CACHE_SIZE,
+        ttl_seconds: float = PROFILE_CACHE_TTL,
+    ):
+        self._backend = backend
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()  # founder_id -> (expires_at, record)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self) -> ProfileBackend:
+        # Created on first use so importing the routes doesn't touch disk
+        if self._backend is None:
+            self._backend = create_backend()
+            logger.info(f"🗂️ Founder profile store: {self._backend.name}")
+        return self._backend
+
+    def _remember(self, founder_id: str, record: Optional[Dict[str, Any]]):
+        with self._lock:
+            self._cache[founder_id] = (time.monotonic() + self.ttl_seconds, record)
+            self._cache.move_to_end(founder_id)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def _cached(self, founder_id: str):
+        """(hit, record) from the in-process cache"""
+        with self._lock:
+            entry = self._cache.get(founder_id)
+            if entry is not None and entry[0] > time.monotonic():
+                self._cache.move_to_end(founder_id)
+                self.hits += 1
+                return True, entry[1]
+            self.misses += 1
+            return False, None
+
+    def _load(self, founder_id: str) -> Optional[Dict[str, Any]]:
+        # Misses (and "no profile yet") are cached too, so a client polling
+        # before saving doesn't hit the backend on every request
+        record = self.backend.get(founder_id)
+        self._remember(founder_id, record)
+        return record
+
+    def get_record(self, founder_id: str) -> Optional[Dict[str, Any]]:
+        hit, record = self._cached(founder_id)
+        return record if hit else self._load(founder_id)
+
+    async def get_record_async(self, founder_id: str) -> Optional[Dict[str, Any]]:
+        """get_record for the event loop: backend reads go to the blocking pool"""
+        hit, record = self._cached(founder_id)
+        return record if hit else await run_blocking(self._load, founder_id)
+
+    def get(self, founder_id: str) -> Dict[str, Any]:
+        """Profile data, or {} if this founder hasn't saved one"""
+        record = self.get_record(founder_id)
+        return dict(record["profile"]) if record else {}
+
+    async def get_async(self, founder_id: str) -> Dict[str, Any]:
+        record = await self.get_record_async(founder_id)
+        return dict(record["profile"]) if record else {}
+
+    def save(self, founder_id: str, profile: Dict[str, Any]) -> Dict[str, Any]:
+        record = self.backend.put(founder_id, profile)
+        self._remember(founder_id, record)
+        return record
+
+    def delete(self, founder_id: str) -> bool:
+        deleted = self.backend.delete(founder_id)
+        self._remember(founder_id, None)
+        return deleted
+
+    def invalidate(self, founder_id: Optional[str] = None):
+        with self._lock:
+            if founder_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(founder_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": self.backend.name,
+                "cached": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def close(self):
+        if self._backend is not None:
+            self._backend.close()
+
+
+profile_store = ProfileStore()
+
+
+def get_founder_id(x_founder_id: Optional[str] = Header(None, alias="X-Founder-ID")) -> str:
+    """FastAPI dependency: the caller's founder key"""
+    if x_founder_id is None or not x_founder_id.strip():
+        return DEFAULT_FOUNDER_ID
+    founder_id = x_founder_id.strip()
+    if not FOUNDER_ID_RE.match(founder_id):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid X-Founder-ID header (1-64 characters: letters, digits, _ . : -)"
+        )
+    return founder_id
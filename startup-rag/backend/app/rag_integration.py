@@ -5,7 +5,10 @@ Connects the Data Ingestion RAG pipeline to the FastAPI backend
 
 import os
 import sys
+import time
+import asyncio
 import logging
+import threading
 from typing import List, Dict, Tuple, Optional
 
 logger = logging.getLogger(__name__)
@@ -23,47 +26,144 @@ if os.path.exists(data_ingestion_path):
 else:
     logger.warning(f"⚠️ Data Ingestion path not found: {data_ingestion_path}")
 
+# Lifecycle tuning
+RAG_WARMUP_QUERY = os.getenv("RAG_WARMUP_QUERY", "startup funding schemes in India")
+RAG_INIT_RETRY_BASE = float(os.getenv("RAG_INIT_RETRY_BASE", "5"))
+RAG_INIT_RETRY_MAX = float(os.getenv("RAG_INIT_RETRY_MAX", "300"))
+# Set to false where the RAG dependencies (chromadb, sentence-transformers)
+# aren't installed: RAG is then disabled instead of retried forever
+RAG_ENABLED = os.getenv("RAG_ENABLED", "true").lower() != "false"
+
+# Lifecycle states
+STATE_COLD = "cold"                  # nothing attempted yet
+STATE_INITIALIZING = "initializing"  # warm-up in progress
+STATE_READY = "ready"                # retriever built and first query served
+STATE_FAILED = "failed"              # last attempt failed, will retry after backoff
+STATE_DISABLED = "disabled"          # Data Ingestion not deployed (or RAG_ENABLED=false) - run without RAG
+
+
 class RAGRetriever:
     """
     RAG Retrieval System for Funding Advice
     Uses vector store from Data Ingestion folder
+
+    Lifecycle: warm_up() builds the Chroma-backed Retriever and runs one
+    query so the embedder and collection are hot before traffic arrives.
+    Failed attempts are retried with exponential backoff (background loop
+    and first-use path) instead of disabling RAG for the process lifetime.
     """
-    
+
     def __init__(self):
         self.retriever = None
         self.is_available = False
-        self._initialize_rag()
-    
-    def _initialize_rag(self):
-        """Initialize RAG retriever if available - deferred lazy initialization"""
-        # Don't initialize during module import - will be done on first use
-        pass
-    
-    def _lazy_init_retriever(self):
-        """Lazy initialization of RAG components on first use"""
-        if self.is_available or self.retriever is not None:
-            return  # Already initialized or failed
-        
-        try:
-            # Import and initialize RAG components
-            from vector_store.retriever import Retriever  # type: ignore
-            self.retriever = Retriever()
-            self.is_available = True
-            logger.info("✅ RAG Retriever initialized successfully")
-        except ImportError as e:
-            logger.warning(f"RAG not available - Data Ingestion modules not found: {e}")
-            logger.info("📋 System will run without RAG - answers will be based on Gemini's knowledge only")
-            self.is_available = False
-        except (ValueError, AttributeError) as e:
-            # Compatibility issues (NumPy version mismatch, Keras 3 incompatibility, etc.)
-            logger.warning(f"RAG initialization failed due to compatibility issue: {str(e)}")
-            logger.info("📋 System will run without RAG - answers will be based on Gemini's knowledge only")
+        self.state = STATE_COLD
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.init_attempts = 0
+        self.init_failures = 0
+        self.last_init_seconds: Optional[float] = None
+        self.warmup_query_seconds: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.ready_since: Optional[float] = None
+        self.next_retry_at = 0.0
+
+    def _backoff_seconds(self) -> float:
+        return min(RAG_INIT_RETRY_BASE * 2 ** max(self.init_failures - 1, 0), RAG_INIT_RETRY_MAX)
+
+    def warm_up(self, force: bool = False) -> str:
+        """
+        Build the retriever and run a warm-up query (blocking - call from a
+        worker thread). Respects the retry backoff unless force=True.
+        Returns the resulting lifecycle state.
+        """
+        with self._lock:
+            if self.state in (STATE_READY, STATE_DISABLED):
+                return self.state
+            if not force and self.state == STATE_FAILED and time.time() < self.next_retry_at:
+                return self.state
+
+            if not RAG_ENABLED or not os.path.exists(data_ingestion_path):
+                # RAG is not part of this deployment - not an error
+                self.state = STATE_DISABLED
+                self.last_error = (
+                    "RAG_ENABLED=false" if not RAG_ENABLED
+                    else f"Data Ingestion path not found: {data_ingestion_path}"
+                )
+                logger.info("📋 System will run without RAG - answers will be based on Gemini's knowledge only")
+                return self.state
+
+            self.state = STATE_INITIALIZING
+            self.init_attempts += 1
+            started = time.perf_counter()
+
+            try:
+                # Process-wide shared retriever (same Chroma client as any
+                # other Data Ingestion engine loaded in this process)
+                from rag.resources import get_retriever  # type: ignore
+                retriever = get_retriever()
+
+                query_started = time.perf_counter()
+                retriever.search(RAG_WARMUP_QUERY, top_k=1)
+                self.warmup_query_seconds = time.perf_counter() - query_started
+
+                self.retriever = retriever
+                self.is_available = True
+                self.state = STATE_READY
+                self.ready_since = time.time()
+                self.last_error = None
+                self.last_init_seconds = time.perf_counter() - started
+                logger.info(f"✅ RAG Retriever ready in {self.last_init_seconds:.2f}s "
+                            f"(warm-up query {self.warmup_query_seconds * 1000:.0f} ms)")
+                return self.state
+
+            except Exception as e:
+                # Includes missing dependencies (chromadb, sentence_transformers, ...) and
+                # compatibility issues (NumPy version mismatch, Keras 3 incompatibility, etc.)
+                self.init_failures += 1
+                self.last_error = f"{type(e).__name__}: {e}"
+                self.state = STATE_FAILED
+                self.next_retry_at = time.time() + self._backoff_seconds()
+                logger.error(f"RAG initialization failed ({self.last_error}) - "
+                             f"retrying in {self._backoff_seconds():.0f}s")
+
+            self.last_init_seconds = time.perf_counter() - started
+            self.retriever = None
             self.is_available = False
-        except Exception as e:
-            logger.error(f"Failed to initialize RAG: {type(e).__name__}: {str(e)}")
             logger.info("📋 System will run without RAG - answers will be based on Gemini's knowledge only")
-            self.is_available = False
-    
+            return self.state
+
+    async def run_warmup_loop(self):
+        """
+        Background task started with the app: warm up, then keep retrying
+        with backoff until ready (or disabled)
+        """
+        from app.concurrency import run_blocking
+
+        while True:
+            state = await run_blocking(self.warm_up)
+            if state in (STATE_READY, STATE_DISABLED):
+                return
+            await asyncio.sleep(max(self.next_retry_at - time.time(), 0.5))
+
+    def is_ready(self) -> bool:
+        """Ready for traffic: retrieval is hot, or RAG is not deployed at all"""
+        return self.state in (STATE_READY, STATE_DISABLED)
+
+    def status(self) -> Dict:
+        """Lifecycle state and init metrics (for /ready and /health)"""
+        return {
+            "state": self.state,
+            "ready": self.is_ready(),
+            "init_attempts": self.init_attempts,
+            "init_failures": self.init_failures,
+            "last_init_seconds": round(self.last_init_seconds, 3) if self.last_init_seconds is not None else None,
+            "warmup_query_ms": round(self.warmup_query_seconds * 1000, 1) if self.warmup_query_seconds is not None else None,
+            "ready_since": self.ready_since,
+            "next_retry_in": round(max(self.next_retry_at - time.time(), 0), 1) if self.state == STATE_FAILED else None,
+            "last_error": self.last_error,
+        }
+
     def retrieve_context(self, query: str, top_k: int = 3) -> Tuple[List[str], List[Dict]]:
         """
         Retrieve relevant context chunks for a query
@@ -75,9 +175,9 @@ class RAGRetriever:
         Returns:
             Tuple of (documents, metadata)
         """
-        # Lazy initialize on first use
-        if not self.is_available and self.retriever is None:
-            self._lazy_init_retriever()
+        # Not warmed up yet (or a retry is due): initialize on first use
+        if not self.is_available and self.state in (STATE_COLD, STATE_FAILED):
+            self.warm_up()
         
         if not self.is_available or not self.retriever:
             logger.warning("RAG retriever not available, returning empty context")
@@ -101,6 +201,15 @@ class RAGRetriever:
             logger.error(f"RAG retrieval error: {type(e).__name__}: {str(e)}")
             return [], []
     
+    def index_version(self) -> str:
+        """Version token of the underlying vector index ("none" when RAG is unavailable)"""
+        if not self.is_available or not self.retriever:
+            return "none"
+        try:
+            return self.retriever.store.index_version()
+        except Exception:
+            return "none"
+    
     def format_rag_context(self, docs: List[str], metas: List[Dict]) -> str:
         """
         Format retrieved documents into a context string for LLM
@@ -1,8 +1,38 @@
 """
 Funding Readiness Score Calculator
 Calculates precise readiness score based on founder profile
+
+The score depends only on (stage, sector, funding goal, city tier), so
+results are memoized per normalized profile. Cached results are shared:
+callers must not mutate them.
 """
 
+from functools import lru_cache
+
+from app.gazetteer import resolve_location
+
+STAGE_SCORES = {
+    'idea': 15,
+    'mvp': 25,
+    'revenue': 35,
+    'growth': 45
+}
+
+# High-growth sectors get higher scores
+HIGH_GROWTH_SECTORS = frozenset(['fintech', 'saas', 'deeptech', 'healthtech', 'edtech'])
+MEDIUM_GROWTH_SECTORS = frozenset(['agritech', 'd2c', 'consumer'])
+
+GOAL_SCORES = {
+    'grant': 15,
+    'angel': 18,
+    'vc': 20
+}
+
+# Gazetteer tier -> points (tier 1: metros, tier 2: Ahmedabad, Kolkata, ...)
+LOCATION_SCORES = {1: 15, 2: 12}
+DEFAULT_LOCATION_SCORE = 10
+
+
 def calculate_readiness_score(profile_data: dict) -> dict:
     """
     Calculate funding readiness score (0-100) based on multiple factors
@@ -20,28 +50,23 @@ def calculate_readiness_score(profile_data: dict) -> dict:
     funding_goal = profile_data.get('funding_goal', '').lower()
     location = profile_data.get('location', '').lower()
     
+    return _score(stage, sector, funding_goal, resolve_location(location).tier)
+
+
+@lru_cache(maxsize=1024)
+def _score(stage: str, sector: str, funding_goal: str, tier: int) -> dict:
     score = 0
     breakdown = {}
     
     # 1. Stage Score (0-30 points)
-    stage_scores = {
-        'idea': 15,
-        'mvp': 25,
-        'revenue': 35,
-        'growth': 45
-    }
-    stage_score = stage_scores.get(stage, 20)
+    stage_score = STAGE_SCORES.get(stage, 20)
     score += min(stage_score, 30)
     breakdown['stage'] = min(stage_score, 30)
     
     # 2. Sector Alignment (0-20 points)
-    # High-growth sectors get higher scores
-    high_growth_sectors = ['fintech', 'saas', 'deeptech', 'healthtech', 'edtech']
-    medium_growth_sectors = ['agritech', 'd2c', 'consumer']
-    
-    if sector in high_growth_sectors:
+    if sector in HIGH_GROWTH_SECTORS:
         sector_score = 18
-    elif sector in medium_growth_sectors:
+    elif sector in MEDIUM_GROWTH_SECTORS:
         sector_score = 15
     else:
         sector_score = 12
@@ -51,12 +76,7 @@ def calculate_readiness_score(profile_data: dict) -> dict:
     
     # 3. Funding Goal Match (0-20 points)
     # Check if goal aligns with stage
-    goal_scores = {
-        'grant': 15,
-        'angel': 18,
-        'vc': 20
-    }
-    goal_score = goal_scores.get(funding_goal, 15)
+    goal_score = GOAL_SCORES.get(funding_goal, 15)
     
     # Bonus if stage-goal alignment is good
     if stage == 'idea' and funding_goal == 'grant':
@@ -70,15 +90,7 @@ def calculate_readiness_score(profile_data: dict) -> dict:
     breakdown['funding_goal'] = min(goal_score, 20)
     
     # 4. Location Advantage (0-15 points)
-    tier1_cities = ['bangalore', 'mumbai', 'delhi', 'hyderabad', 'chennai', 'pune', 'gurgaon', 'noida']
-    tier2_cities = ['ahmedabad', 'kolkata', 'jaipur', 'chandigarh', 'indore', 'kochi']
-    
-    if any(city in location for city in tier1_cities):
-        location_score = 15
-    elif any(city in location for city in tier2_cities):
-        location_score = 12
-    else:
-        location_score = 10
+    location_score = LOCATION_SCORES.get(tier, DEFAULT_LOCATION_SCORE)
     
     score += location_score
     breakdown['location'] = location_score
@@ -0,0 +1,421 @@
+"""
+Response cache for the profile-driven dashboard endpoints
+/investors/match, /funding/timeline, /market/insights, /readiness/score and
+/action-plan/7day are pure functions of the saved founder profile. An ASGI
+middleware caches their 200 responses keyed on route + query + founder +
+profile version and serves repeats without running the handler.
+- Each response carries an ETag (hash of the body) and
+  "Cache-Control: private, no-cache", so dashboards revalidate with
+  If-None-Match and get a bodyless 304 while the profile is unchanged
+- In-process LRU with a TTL, plus an optional shared tier so all workers
+  reuse one render: RESPONSE_CACHE_SHARED=sqlite (workers on one host) or
+  redis (REDIS_URL, needs `pip install redis`)
+- Saving a profile bumps its version, which changes the key, so an old
+  render is never served; POST /founder/profile also drops the founder's
+  entries right away. Other workers see the new version once their profile
+  store cache entry expires (PROFILE_CACHE_TTL)
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from app.concurrency import run_blocking
+from app.profile_store import DEFAULT_FOUNDER_ID, FOUNDER_ID_RE, profile_store
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE", "true").lower() != "false"
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "2048"))
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "600"))
+RESPONSE_CACHE_SHARED = os.getenv("RESPONSE_CACHE_SHARED", "").lower()  # "" | sqlite | redis
+RESPONSE_CACHE_DB_PATH = os.getenv("RESPONSE_CACHE_DB_PATH", os.path.join("data", "response_cache.sqlite3"))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+CACHED_PATHS = frozenset({
+    "/investors/match",
+    "/funding/timeline",
+    "/market/insights",
+    "/readiness/score",
+    "/action-plan/7day",
+})
+CACHE_CONTROL = b"private, no-cache"
+
+# A cached response: (etag, content type, body)
+Entry = Tuple[str, str, bytes]
+
+
+def _pack(entry: Entry) -> bytes:
+    etag, content_type, body = entry
+    return f"{etag}\n{content_type}\n".encode("latin-1") + body
+
+
+def _unpack(value: bytes) -> Entry:
+    etag, content_type, body = value.split(b"\n", 2)
+    return etag.decode("latin-1"), content_type.decode("latin-1"), body
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 asks for GET)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+# ----------------------------------------------------------------------
+# Shared tier
+# Values are packed entries; every call runs in the blocking pool.
+# ----------------------------------------------------------------------
+class SharedBackend:
+    name = "base"
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def put(self, key: str, founder_id: str, value: bytes, ttl: float):
+        raise NotImplementedError
+
+    def invalidate(self, founder_id: str):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class SQLiteSharedBackend(SharedBackend):
+    """
+    Shared by the workers on one host. WAL mode; one connection per thread,
+    tracked so close() can release the blocking pool's ones too.
+    """
+
+    name = "sqlite"
+    PURGE_EVERY = 500  # puts between sweeps of expired rows
+
+    def __init__(self, path: str = RESPONSE_CACHE_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._conns = set()
+        self._conns_lock = threading.Lock()
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+        self._puts = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or conn not in self._conns:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Only this thread uses it; check_same_thread=False lets close() run elsewhere
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._conns_lock:
+                self._conns.add(conn)
+        if not self._schema_ready:
+            with self._schema_lock:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS response_cache ("
+                    " key TEXT PRIMARY KEY,"
+                    " founder_id TEXT NOT NULL,"
+                    " value BLOB NOT NULL,"
+                    " expires_at REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS response_cache_founder ON response_cache (founder_id)")
+                self._schema_ready = True
+        return conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self._connect().execute(
+            "SELECT value FROM response_cache WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, founder_id: str, value: bytes, ttl: float):
+        conn = self._connect()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO response_cache (key, founder_id, value, expires_at) VALUES (?, ?, ?, ?)",
+            (key, founder_id, value, now + ttl),
+        )
+        self._puts += 1
+        if self._puts % self.PURGE_EVERY == 0:
+            conn.execute("DELETE FROM response_cache WHERE expires_at <= ?", (now,))
+
+    def invalidate(self, founder_id: str):
+        self._connect().execute("DELETE FROM response_cache WHERE founder_id = ?", (founder_id,))
+
+    def close(self):
+        # Every thread's connection, not just the caller's
+        with self._conns_lock:
+            conns, self._conns = self._conns, set()
+        for conn in conns:
+            conn.close()
+        self._local.conn = None
+
+
+class RedisSharedBackend(SharedBackend):
+    """Shared across hosts; a per-founder set tracks keys for invalidation"""
+
+    name = "redis"
+    PREFIX = "response_cache:"
+
+    def __init__(self, url: str = REDIS_URL):
+        import redis  # optional dependency, only needed for this backend
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(self.PREFIX + key)
+
+    def put(self, key: str, founder_id: str, value: bytes, ttl: float):
+        founder_key = f"{self.PREFIX}founder:{founder_id}"
+        pipe = self._client.pipeline()
+        pipe.set(self.PREFIX + key, value, ex=int(ttl))
+        pipe.sadd(founder_key, key)
+        pipe.expire(founder_key, int(ttl))
+        pipe.execute()
+
+    def invalidate(self, founder_id: str):
+        founder_key = f"{self.PREFIX}founder:{founder_id}"
+        keys = [self.PREFIX + key.decode() for key in self._client.smembers(founder_key)]
+        self._client.delete(founder_key, *keys)
+
+    def close(self):
+        self._client.close()
+
+
+SHARED_BACKENDS = {
+    "sqlite": SQLiteSharedBackend,
+    "redis": RedisSharedBackend,
+}
+
+
+def create_shared_backend(name: str = RESPONSE_CACHE_SHARED) -> Optional[SharedBackend]:
+    if not name:
+        return None
+    if name not in SHARED_BACKENDS:
+        raise ValueError(f"Unknown RESPONSE_CACHE_SHARED '{name}' (expected one of: {', '.join(SHARED_BACKENDS)})")
+    try:
+        return SHARED_BACKENDS[name]()
+    except ImportError as e:
+        logger.warning(f"⚠️ Shared response cache '{name}' unavailable ({e}) - using in-process cache only")
+        return None
+
+
+# ----------------------------------------------------------------------
+# Two-tier cache
+# ----------------------------------------------------------------------
+class ResponseCache:
+    """In-process LRU + TTL in front of an optional shared tier"""
+
+    def __init__(
+        self,
+        max_entries: int = RESPONSE_CACHE_SIZE,
+        ttl_seconds: float = RESPONSE_CACHE_TTL,
+        shared: Optional[SharedBackend] = None,
+        shared_name: str = RESPONSE_CACHE_SHARED,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._shared = shared
+        self._shared_name = shared_name if shared is None else shared.name
+        self._shared_ready = shared is not None
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, founder_id, entry)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    @property
+    def shared(self) -> Optional[SharedBackend]:
+        # Created on first use so importing the app doesn't touch disk / network
+        if not self._shared_ready:
+            self._shared = create_shared_backend(self._shared_name)
+            self._shared_ready = True
+            if self._shared is not None:
+                logger.info(f"🗄️ Shared response cache: {self._shared.name}")
+        return self._shared
+
+    @staticmethod
+    def key(founder_id: str, record: Dict, path: str, query: str) -> str:
+        # updated_at guards against version numbers restarting (memory backend)
+        return f"{founder_id}|{record['version']}|{record.get('updated_at', 0)}|{path}?{query}"
+
+    def _remember(self, key: str, founder_id: str, entry: Entry):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, founder_id, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[2]
+
+        shared = self.shared
+        if shared is not None:
+            try:
+                value = await run_blocking(shared.get, key)
+            except Exception as e:
+                logger.warning(f"⚠️ Shared response cache read failed: {type(e).__name__}: {e}")
+                value = None
+            if value is not None:
+                entry = _unpack(value)
+                self._remember(key, key.split("|", 1)[0], entry)
+                with self._lock:
+                    self.shared_hits += 1
+                return entry
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    async def put(self, key: str, founder_id: str, entry: Entry):
+        self._remember(key, founder_id, entry)
+        shared = self.shared
+        if shared is not None:
+            try:
+                await run_blocking(shared.put, key, founder_id, _pack(entry), self.ttl_seconds)
+            except Exception as e:
+                logger.warning(f"⚠️ Shared response cache write failed: {type(e).__name__}: {e}")
+
+    async def invalidate(self, founder_id: str):
+        """Drop every cached response for this founder (profile changed)"""
+        with self._lock:
+            stale = [key for key, (_, owner, _) in self._entries.items() if owner == founder_id]
+            for key in stale:
+                del self._entries[key]
+        shared = self.shared
+        if shared is not None:
+            try:
+                await run_blocking(shared.invalidate, founder_id)
+            except Exception as e:
+                logger.warning(f"⚠️ Shared response cache invalidation failed: {type(e).__name__}: {e}")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def record_not_modified(self):
+        with self._lock:
+            self.not_modified += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.shared_hits + self.misses
+            return {
+                "enabled": RESPONSE_CACHE_ENABLED,
+                "shared": self._shared.name if self._shared is not None else None,
+                "cached": len(self._entries),
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "not_modified": self.not_modified,
+                "hit_rate": round((self.hits + self.shared_hits) / lookups, 3) if lookups else 0.0,
+            }
+
+    def close(self):
+        if self._shared is not None:
+            self._shared.close()
+
+
+# ----------------------------------------------------------------------
+# Middleware
+# ----------------------------------------------------------------------
+def _header(scope, name: bytes) -> str:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
+
+class ResponseCacheMiddleware:
+    """
+    Serves CACHED_PATHS from the response cache. Requests without a saved
+    profile, bad founder ids and non-200 responses pass straight through.
+    Must sit inside CORSMiddleware so cached responses still get CORS headers.
+    """
+
+    def __init__(self, app, cache: Optional[ResponseCache] = None):
+        self.app = app
+        self.cache = cache or response_cache
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET" or scope["path"] not in CACHED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        founder_id = _header(scope, b"x-founder-id").strip() or DEFAULT_FOUNDER_ID
+        if not FOUNDER_ID_RE.match(founder_id):
+            await self.app(scope, receive, send)
+            return
+
+        # Profile cache misses read the backend on the blocking pool
+        record = await profile_store.get_record_async(founder_id)
+        if record is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = ResponseCache.key(founder_id, record, scope["path"], scope["query_string"].decode("latin-1"))
+        entry = await self.cache.get(key)
+        outcome = b"HIT"
+        if entry is None:
+            outcome = b"MISS"
+            messages: List[dict] = []
+
+            async def capture(message):
+                messages.append(message)
+
+            await self.app(scope, receive, capture)
+            start = messages[0] if messages else {}
+            if start.get("status") != 200:
+                for message in messages:
+                    await send(message)
+                return
+
+            body = b"".join(m.get("body", b"") for m in messages[1:])
+            content_type = dict(start.get("headers", [])).get(b"content-type", b"application/json").decode("latin-1")
+            entry = (make_etag(body), content_type, body)
+            await self.cache.put(key, founder_id, entry)
+
+        etag, content_type, body = entry
+        headers = [
+            (b"etag", etag.encode("latin-1")),
+            (b"cache-control", CACHE_CONTROL),
+            (b"vary", b"X-Founder-ID"),
+            (b"x-cache", outcome),
+        ]
+        if etag_matches(_header(scope, b"if-none-match"), etag):
+            self.cache.record_not_modified()
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        headers += [
+            (b"content-type", content_type.encode("latin-1")),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+response_cache = ResponseCache()
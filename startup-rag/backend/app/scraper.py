@@ -0,0 +1,246 @@
+"""
+Concurrent website scraper for /rag/scrape-websites
+Fetches over the shared async HTTP pool with a global concurrency cap,
+per-host politeness (max parallel requests + minimum spacing per host) and
+an overall deadline. HTML parsing and keyword scoring run in the blocking
+thread pool so the event loop keeps serving other requests.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import time
+from typing import AsyncIterator, Dict, List, Optional
+from urllib.parse import urlparse
+
+from app.concurrency import get_http_client, run_blocking
+
+logger = logging.getLogger(__name__)
+
+SCRAPE_CONCURRENCY = int(os.getenv("SCRAPE_CONCURRENCY", "8"))
+SCRAPE_PER_HOST = int(os.getenv("SCRAPE_PER_HOST", "2"))
+SCRAPE_HOST_INTERVAL = float(os.getenv("SCRAPE_HOST_INTERVAL", "1.0"))  # seconds between request starts per host
+SCRAPE_TIMEOUT = float(os.getenv("SCRAPE_TIMEOUT", "10"))
+SCRAPE_DEADLINE = float(os.getenv("SCRAPE_DEADLINE", "30"))
+SCRAPE_MAX_BYTES = int(os.getenv("SCRAPE_MAX_BYTES", str(3 * 1024 * 1024)))
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+FUNDING_KEYWORDS = ['funding', 'investment', 'startup', 'venture', 'capital', 'investor', 'business', 'entrepreneur', 'finance', 'money']
+TOPIC_KEYWORDS = {
+    'Funding': ['funding', 'investment', 'capital', 'finance'],
+    'Startup': ['startup', 'entrepreneur', 'business'],
+    'Technology': ['technology', 'tech', 'software', 'digital'],
+    'Market': ['market', 'industry', 'sector', 'competition'],
+    'Strategy': ['strategy', 'plan', 'growth', 'scale']
+}
+
+# One alternation over every keyword (longest first so 'technology' wins over
+# 'tech'): a single scan of the lowercased text finds all of them
+_ALL_KEYWORDS = sorted(
+    set(FUNDING_KEYWORDS) | {k for words in TOPIC_KEYWORDS.values() for k in words},
+    key=len, reverse=True,
+)
+_KEYWORD_RE = re.compile("|".join(re.escape(k) for k in _ALL_KEYWORDS))
+# Shorter keywords contained in a longer one ('technology' -> ['tech'])
+_CONTAINED = {k: [o for o in _ALL_KEYWORDS if o != k and o in k] for k in _ALL_KEYWORDS}
+
+
+def find_keywords(lowered: str) -> set:
+    """Every keyword occurring (as a substring) in already-lowercased text"""
+    found = set(_KEYWORD_RE.findall(lowered))
+    # A longer match hides the shorter keywords inside it
+    for keyword in list(found):
+        found.update(_CONTAINED[keyword])
+    return found
+
+
+def parse_and_score(url: str, index: int, content: bytes) -> Dict:
+    """HTML -> text, title, relevance and topics (CPU-bound; run in the pool)"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, 'html.parser')
+
+    # Remove script and style elements
+    for script in soup(["script", "style"]):
+        script.decompose()
+
+    # Extract text
+    text = soup.get_text()
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    text = ' '.join(chunk for chunk in chunks if chunk)
+
+    # Generate URL hash for unique identification
+    url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+
+    # Extract title
+    title_tag = soup.find('title')
+    title = title_tag.string if title_tag and title_tag.string else f"Website {index + 1}"
+
+    word_count = len(text.split())
+
+    # Single pass: lowercase once, scan once
+    found = find_keywords(text.lower())
+
+    relevance_score = sum(1 for keyword in FUNDING_KEYWORDS if keyword in found) / len(FUNDING_KEYWORDS)
+    relevance_score = min(1.0, relevance_score * 2)  # Scale to 0-1
+
+    key_topics = [topic for topic, keywords in TOPIC_KEYWORDS.items() if found.intersection(keywords)]
+    if not key_topics:
+        key_topics = ['General Business']
+
+    # Create summary
+    summary = f"This website contains information about {', '.join(key_topics[:3]).lower()}. "
+    if 'funding' in found or 'investment' in found:
+        summary += "Key focus areas include funding strategies, investment opportunities, and business development."
+    else:
+        summary += "Contains business-related content that may be relevant for startup and funding insights."
+
+    return {
+        'id': f"{url_hash}_{int(time.time())}",
+        'url': url,
+        'url_hash': url_hash,
+        'title': title.strip()[:100],
+        'summary': summary,
+        'content': text[:5000],  # Limit content for response
+        'full_content': text,  # Store full content
+        'word_count': word_count,
+        'key_topics': key_topics[:4],
+        'relevance_score': round(relevance_score, 2),
+        'processed': True,
+        'scraped_at': time.time()
+    }
+
+
+def error_result(url: str, title: str, summary: str, error: str) -> Dict:
+    return {
+        'id': f"error_{int(time.time())}",
+        'url': url,
+        'title': title,
+        'summary': summary,
+        'error': error,
+        'processed': False
+    }
+
+
+class HostGate:
+    """Per-host politeness: at most N in flight, request starts spaced apart"""
+
+    def __init__(self, max_parallel: int, interval: float):
+        self.semaphore = asyncio.Semaphore(max_parallel)
+        self.interval = interval
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.semaphore.release()
+
+
+async def _fetch(url: str) -> bytes:
+    client = get_http_client()
+    async with client.stream(
+        "GET", url,
+        headers={'User-Agent': USER_AGENT},
+        timeout=SCRAPE_TIMEOUT,
+        follow_redirects=True,
+    ) as response:
+        response.raise_for_status()
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body.extend(chunk)
+            if len(body) > SCRAPE_MAX_BYTES:
+                break  # enough text for scoring; don't buffer huge pages
+        return bytes(body)
+
+
+async def scrape_one(url: str, index: int, limiter: asyncio.Semaphore, gates: Dict[str, HostGate]) -> Dict:
+    import httpx
+
+    host = urlparse(url).netloc.lower()
+    gate = gates.setdefault(host, HostGate(SCRAPE_PER_HOST, SCRAPE_HOST_INTERVAL))
+
+    try:
+        # Host gate first: waiting out politeness must not hold a global slot
+        async with gate, limiter:
+            logger.info(f"Scraping {index + 1}: {url}")
+            content = await _fetch(url)
+
+        result = await run_blocking(parse_and_score, url, index, content)
+        logger.info(f"✅ Successfully scraped {url} - {result['word_count']} words, relevance: {result['relevance_score']:.2f}")
+        return result
+
+    except httpx.HTTPError as e:
+        logger.error(f"❌ Failed to scrape {url}: {str(e)}")
+        return error_result(url, f"Error scraping {url}", f"Failed to scrape website: {str(e)}", str(e))
+    except Exception as e:
+        logger.error(f"❌ Unexpected error scraping {url}: {str(e)}")
+        return error_result(url, f"Error processing {url}", f"Unexpected error: {str(e)}", str(e))
+
+
+def valid_urls(urls: List[str]) -> List[str]:
+    valid = []
+    for url in urls:
+        if not url.strip() or not url.startswith('http'):
+            logger.warning(f"Skipping invalid URL: {url}")
+            continue
+        valid.append(url.strip())
+    return valid
+
+
+async def iter_scrape(urls: List[str], deadline: Optional[float] = None) -> AsyncIterator[Dict]:
+    """
+    Yield one result per URL as soon as it finishes. URLs still running
+    when the overall deadline passes are cancelled and yielded as errors.
+    Each result carries its input position as 'index'.
+    """
+    deadline = SCRAPE_DEADLINE if deadline is None else deadline
+    limiter = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+    gates: Dict[str, HostGate] = {}
+
+    tasks = {
+        asyncio.ensure_future(scrape_one(url, i, limiter, gates)): (i, url)
+        for i, url in enumerate(urls)
+    }
+    pending = set(tasks)
+    end = time.monotonic() + deadline
+
+    try:
+        while pending:
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield {**task.result(), 'index': tasks[task][0]}
+
+        for task in pending:
+            task.cancel()
+            i, url = tasks[task]
+            logger.warning(f"⏱️ Scrape deadline ({deadline:.0f}s) hit before {url} finished")
+            yield {
+                **error_result(url, f"Error scraping {url}", f"Timed out after {deadline:.0f}s", "deadline exceeded"),
+                'index': i,
+            }
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def scrape_all(urls: List[str], deadline: Optional[float] = None) -> List[Dict]:
+    """All results, in input order"""
+    results = [r async for r in iter_scrape(urls, deadline)]
+    results.sort(key=lambda r: r.pop('index'))
+    return results
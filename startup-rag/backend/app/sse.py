@@ -0,0 +1,25 @@
+"""
+Server-Sent Events helpers
+Used by the streaming chat and advice endpoints
+"""
+
+import json
+from fastapi.responses import StreamingResponse
+
+
+def sse_event(event: str, data) -> str:
+    """Format a single SSE frame. Data is always JSON so it stays on one line."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def sse_response(events) -> StreamingResponse:
+    """Wrap an iterator of pre-formatted SSE frames in a streaming response"""
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Stop reverse proxies (nginx/Render) from buffering the stream
+            "X-Accel-Buffering": "no",
+        },
+    )
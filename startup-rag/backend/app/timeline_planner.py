@@ -0,0 +1,189 @@
+"""
+Funding Timeline Planner
+Estimates months to the next stage with milestones, risks and
+recommendations adjusted for sector, funding goal and location.
+
+Everything except the echoed location label depends only on (stage,
+sector, funding goal, cities mentioned), so the plan is memoized per
+normalized profile.
+"""
+
+from functools import lru_cache
+from typing import FrozenSet
+
+from app.gazetteer import resolve_location
+
+# Location-based timeline adjustments
+HUB_CITIES = frozenset(['bangalore', 'mumbai', 'delhi', 'hyderabad', 'chennai', 'pune'])
+TIER2_CITIES = frozenset(['ahmedabad', 'kolkata', 'jaipur', 'chandigarh'])
+GRANT_EVENT_CITIES = frozenset(['delhi', 'mumbai', 'bangalore'])
+VC_EVENT_CITIES = frozenset(['bangalore', 'mumbai', 'delhi'])
+
+# Stage progression map
+STAGE_PROGRESSION = {
+    'idea': {
+        'target_stage': 'mvp',
+        'months': 6,
+        'milestones': [
+            "Build working MVP with core features",
+            "Validate product-market fit with 50+ beta users",
+            "Form core team (2-3 members)",
+            "Register company and get basic compliance",
+            "Create initial pitch deck"
+        ],
+        'risks': [
+            "Technical feasibility challenges",
+            "Market validation taking longer than expected",
+            "Team formation delays"
+        ],
+        'recommendations': [
+            "Focus on rapid prototyping and user feedback",
+            "Start networking with angel investors early",
+            "Document all learnings for investor pitch",
+            "Consider bootstrap funding to extend runway"
+        ]
+    },
+    'mvp': {
+        'target_stage': 'revenue',
+        'months': 8,
+        'milestones': [
+            "Achieve ₹5L - ₹10L monthly recurring revenue",
+            "Get 100+ paying customers",
+            "Establish product-market fit metrics",
+            "Build scalable operations and processes",
+            "Complete regulatory compliance (GST, etc.)"
+        ],
+        'risks': [
+            "Customer acquisition cost exceeding LTV",
+            "Churn rate higher than industry average",
+            "Cash flow management during growth phase"
+        ],
+        'recommendations': [
+            "Focus on unit economics and profitability",
+            "Build strong customer retention strategies",
+            "Prepare detailed financial projections",
+            "Start investor conversations 3-4 months before funding need"
+        ]
+    },
+    'revenue': {
+        'target_stage': 'growth',
+        'months': 12,
+        'milestones': [
+            "Achieve ₹50L+ annual recurring revenue (ARR)",
+            "Demonstrate 30%+ month-over-month growth",
+            "Build strong unit economics (CAC < LTV/3)",
+            "Establish market leadership in niche",
+            "Prepare for Series A with detailed metrics"
+        ],
+        'risks': [
+            "Growth plateau or slowdown",
+            "Competition from well-funded players",
+            "Scaling operations while maintaining quality"
+        ],
+        'recommendations': [
+            "Focus on sustainable growth metrics",
+            "Build strategic partnerships",
+            "Strengthen management team",
+            "Engage with Tier-1 VCs early"
+        ]
+    },
+    'growth': {
+        'target_stage': 'scale',
+        'months': 18,
+        'milestones': [
+            "Achieve ₹5Cr+ ARR",
+            "Expand to new markets/verticals",
+            "Build strong competitive moat",
+            "Establish market leadership position",
+            "Prepare for Series B or exit"
+        ],
+        'risks': [
+            "Market saturation",
+            "Regulatory changes",
+            "Key team member departures"
+        ],
+        'recommendations': [
+            "Focus on market expansion",
+            "Build strategic alliances",
+            "Consider international expansion",
+            "Prepare for next funding round or exit"
+        ]
+    }
+}
+
+# Adjust months based on sector (some sectors move faster)
+FAST_SECTORS = frozenset(['fintech', 'saas', 'deeptech'])
+SLOW_SECTORS = frozenset(['agritech', 'healthtech'])
+
+
+def get_precise_timeline(profile_data: dict) -> dict:
+    """Calculate precise funding timeline based on stage, sector, and location"""
+    stage = profile_data.get('startup_stage', '').lower()
+    sector = profile_data.get('sector', '').lower()
+    funding_goal = profile_data.get('funding_goal', '').lower()
+    location = profile_data.get('location', '').lower()
+
+    timeline = _timeline(stage, sector, funding_goal, resolve_location(location).cities)
+    return {
+        **timeline,
+        "location": location.title() if location else "Not specified"
+    }
+
+
+@lru_cache(maxsize=1024)
+def _timeline(stage: str, sector: str, funding_goal: str, cities: FrozenSet[str]) -> dict:
+    # Location-based timeline adjustments
+    location_multiplier = 1.0
+    location_notes = []
+    
+    if cities & HUB_CITIES:
+        location_multiplier = 0.85  # Faster in major hubs
+        location_notes.append("Major startup hub - faster investor access")
+        location_notes.append("More networking events and pitch opportunities")
+    elif cities & TIER2_CITIES:
+        location_multiplier = 1.0  # Standard
+        location_notes.append("Tier-2 city - good startup ecosystem")
+    else:
+        location_multiplier = 1.15  # Slightly slower in smaller cities
+        location_notes.append("Consider virtual investor meetings")
+        location_notes.append("Leverage remote work advantages")
+    
+    # Get timeline for current stage
+    timeline_data = STAGE_PROGRESSION.get(stage, STAGE_PROGRESSION['mvp'])
+    
+    months = timeline_data['months']
+    if sector in FAST_SECTORS:
+        months = max(4, months - 2)
+    elif sector in SLOW_SECTORS:
+        months = months + 2
+    
+    # Apply location multiplier
+    months = int(months * location_multiplier)
+    months = max(3, months)  # Minimum 3 months
+    
+    # Adjust milestones based on funding goal and location
+    milestones = timeline_data['milestones'].copy()
+    if funding_goal == 'grant':
+        milestones.insert(0, "Research and apply for relevant government grants")
+        if cities & GRANT_EVENT_CITIES:
+            milestones.insert(1, "Attend government startup events in your city")
+        months = max(3, months - 1)
+    elif funding_goal == 'vc':
+        milestones.append("Prepare detailed investor pitch with financial models")
+        if cities & VC_EVENT_CITIES:
+            milestones.append("Attend VC networking events in your city")
+        months = months + 2
+    
+    # Add location-specific recommendations
+    recommendations = timeline_data['recommendations'].copy()
+    if location_notes:
+        recommendations.extend(location_notes[:2])
+    
+    return {
+        "current_stage": stage,
+        "target_stage": timeline_data['target_stage'],
+        "estimated_months": months,
+        "milestones": milestones[:5],
+        "risks": timeline_data['risks'],
+        "recommendations": recommendations[:5]
+    }
@@ -0,0 +1,117 @@
+"""
+Benchmark for the profile-driven rule endpoints
+
+Times readiness score, funding timeline, market insights and the 7-day
+action plan over a mix of founder profiles, twice:
+- cold: every memo cache (gazetteer + rule results) cleared before each call
+- warm: steady state, what a repeat visitor / other founders with the same
+  normalized profile get
+
+Reports mean microseconds and bytes allocated (tracemalloc) per call.
+
+Usage (from startup-rag/backend):
+    python benchmarks/bench_rules.py
+    python benchmarks/bench_rules.py --calls 20000 --json bench_rules.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import action_planner, gazetteer, market_insights, readiness_calculator, timeline_planner  # noqa: E402
+
+STAGES = ["idea", "mvp", "revenue", "growth"]
+SECTORS = ["fintech", "saas", "healthtech", "edtech", "agritech", "d2c", "climate"]
+GOALS = ["grant", "angel", "vc"]
+LOCATIONS = ["Bangalore", "Koramangala, Bengaluru", "Mumbai", "Pune", "Delhi NCR", "Indore", "Nagpur", ""]
+
+PROFILES = [
+    {"startup_stage": stage, "sector": sector, "funding_goal": goal, "location": location}
+    for stage, sector, goal, location in itertools.product(STAGES, SECTORS, GOALS, LOCATIONS)
+]
+
+CASES = {
+    "readiness_score": readiness_calculator.calculate_readiness_score,
+    "funding_timeline": timeline_planner.get_precise_timeline,
+    "market_insights": lambda p: market_insights.get_precise_market_insights(p["sector"], p["location"]),
+    "action_plan_7day": action_planner.generate_7day_action_plan,
+}
+
+CACHES = [
+    gazetteer.resolve_location,
+    readiness_calculator._score,
+    timeline_planner._timeline,
+    market_insights._insights,
+    action_planner._plan,
+]
+
+
+def clear_caches():
+    for cached in CACHES:
+        cached.cache_clear()
+
+
+def measure(func, calls: int, cold: bool):
+    profiles = [PROFILES[i % len(PROFILES)] for i in range(calls)]
+
+    # Timing pass (no tracemalloc overhead)
+    elapsed = 0.0
+    for profile in profiles:
+        if cold:
+            clear_caches()
+        start = time.perf_counter()
+        func(profile)
+        elapsed += time.perf_counter() - start
+
+    # Allocation pass
+    allocated = 0
+    tracemalloc.start()
+    for profile in profiles[: min(calls, 2000)]:
+        if cold:
+            clear_caches()
+        before = tracemalloc.get_traced_memory()[0]
+        result = func(profile)
+        allocated += max(0, tracemalloc.get_traced_memory()[0] - before)
+        del result
+    tracemalloc.stop()
+
+    return {
+        "us_per_call": round(elapsed / calls * 1e6, 2),
+        "bytes_per_call": round(allocated / min(calls, 2000)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the rule-based profile endpoints")
+    parser.add_argument("--calls", type=int, default=5000, help="calls per case (default 5000)")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{len(PROFILES)} distinct profiles, {args.calls} calls per case\n")
+    print(f"{'case':<20}{'cold us':>10}{'warm us':>10}{'speedup':>10}{'cold B':>10}{'warm B':>10}")
+    for name, func in CASES.items():
+        cold = measure(func, args.calls, cold=True)
+        clear_caches()
+        warm = measure(func, args.calls, cold=False)
+        speedup = cold["us_per_call"] / warm["us_per_call"] if warm["us_per_call"] else 0.0
+        results[name] = {"cold": cold, "warm": warm, "speedup": round(speedup, 1)}
+        print(
+            f"{name:<20}{cold['us_per_call']:>10}{warm['us_per_call']:>10}{speedup:>9.1f}x"
+            f"{cold['bytes_per_call']:>10}{warm['bytes_per_call']:>10}"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"calls": args.calls, "profiles": len(PROFILES), "results": results}, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Fake Groq + Gemini endpoints for offline load tests
+
+- POST /openai/v1/chat/completions        (Groq, OpenAI-compatible; JSON or SSE)
+- POST /v1beta/models/<model>:generateContent  (Gemini REST)
+
+Answers are canned but shaped like the real thing: the Groq message is a
+JSON object carrying both the /funding/advice and /financial/narrative
+fields, the Gemini text has the TAM/SAM/SOM lines MarketAnalyzer parses.
+Every call sleeps latency +/- jitter seconds and fails with a 429/500 at
+--error-rate, so the error paths get exercised too.
+
+Point the backend at it with:
+    GROQ_API_BASE=http://127.0.0.1:8090/openai/v1
+    GEMINI_API_BASE=http://127.0.0.1:8090/v1beta
+
+Usage (from startup-rag/backend):
+    python benchmarks/fake_llm.py --port 8090 --latency 0.4 --jitter 0.2 --error-rate 0.02
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+GROQ_PATH = "/openai/v1/chat/completions"
+GEMINI_PREFIX = "/v1beta/models/"
+
+GROQ_ANSWER = json.dumps({
+    # /funding/advice (FundingAdvice)
+    "readiness_score": 62,
+    "recommended_path": "Apply to Startup India Seed Fund, then approach angel networks",
+    "explanation": "Your MVP and early pilots fit seed grants; angels expect 3-6 months of revenue.",
+    "checklist": ["Get DPIIT recognition", "Prepare a 12-slide pitch deck", "Track monthly revenue"],
+    "language": "english",
+    # /financial/narrative
+    "burn_rate_explanation": "You spend about the same each month as a typical seed-stage team.",
+    "runway_interpretation": "At the current burn you have enough runway to reach the next milestone.",
+    "unit_economics_insight": "Each customer returns more than it costs to acquire.",
+    "summary": "Finances are healthy for a seed-stage startup; keep burn flat while revenue grows.",
+    "disclaimer": "This is not financial advice.",
+})
+
+GEMINI_ANSWER = (
+    "TAM: ₹40,000 crore (India digital lending)\n"
+    "SAM: ₹6,000 crore (MSME working capital)\n"
+    "SOM: ₹120 crore in 3 years\n"
+    "GROWTH: 22% CAGR\n"
+    "INDIA_VS_GLOBAL: India is ~4% of the global market and growing faster\n"
+    "ASSUMPTIONS: 2% share of SAM, average ticket ₹5 lakh\n"
+    "NARRATION: A large, fast-growing market with room for a focused entrant."
+)
+
+
+class FakeLLMServer:
+    """ThreadingHTTPServer in a daemon thread (or the foreground via serve_forever)"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 jitter: float = 0.0, error_rate: float = 0.0, seed: int = 42):
+        handler = type("FakeLLMHandler", (_FakeLLMHandler,), {"server_config": self})
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.calls = {"groq": 0, "gemini": 0, "errors": 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def groq_base(self) -> str:
+        return self.url + "/openai/v1"
+
+    @property
+    def gemini_base(self) -> str:
+        return self.url + "/v1beta"
+
+    def draw(self, provider: str):
+        """(delay seconds, error status or None) for one call"""
+        with self._lock:
+            self.calls[provider] += 1
+            delay = max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+            status = None
+            if self._rng.random() < self.error_rate:
+                self.calls["errors"] += 1
+                status = self._rng.choice([429, 500])
+        return delay, status
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+class _FakeLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; avoid the 40ms delayed-ACK stall
+    disable_nagle_algorithm = True
+    server_config: FakeLLMServer = None
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send(self, status: int, body: str, content_type: str = "application/json"):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+
+        if self.path == GROQ_PATH:
+            provider = "groq"
+        elif self.path.startswith(GEMINI_PREFIX) and self.path.endswith(":generateContent"):
+            provider = "gemini"
+        else:
+            self._send(404, '{"error": "not found"}')
+            return
+
+        delay, status = self.server_config.draw(provider)
+        time.sleep(delay)
+        if status:
+            self._send(status, json.dumps({"error": {"message": f"fake {status}", "code": status}}))
+            return
+
+        if provider == "gemini":
+            self._send(200, json.dumps({"candidates": [{"content": {"parts": [{"text": GEMINI_ANSWER}]}}]}))
+        elif payload.get("stream"):
+            events = "".join(
+                f"data: {json.dumps({'choices': [{'index': 0, 'delta': {'content': piece}}]})}\n\n"
+                for piece in GROQ_ANSWER.split(" ")
+            )
+            self._send(200, events + "data: [DONE]\n\n", "text/event-stream")
+        else:
+            self._send(200, json.dumps({
+                "id": "fake", "object": "chat.completion", "model": payload.get("model", "fake"),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": GROQ_ANSWER}, "finish_reason": "stop"}],
+            }))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake Groq + Gemini server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", type=float, default=0.3, help="seconds per LLM call (default 0.3)")
+    parser.add_argument("--jitter", type=float, default=0.1, help="+/- seconds around --latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of calls failing with 429/500")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    server = FakeLLMServer(args.host, args.port, args.latency, args.jitter, args.error_rate, args.seed)
+    print(f"Fake LLM listening on {server.url} (Ctrl+C to stop)")
+    print(f"  GROQ_API_BASE={server.groq_base}")
+    print(f"  GEMINI_API_BASE={server.gemini_base}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
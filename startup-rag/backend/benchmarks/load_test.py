@@ -0,0 +1,508 @@
+"""
+Offline load test for the FastAPI backend
+
+Starts benchmarks/fake_llm.py (fake Groq + Gemini with configurable latency
+and error rate) and `app.main:app` under uvicorn in subprocesses, registers
+a profile for each synthetic founder, then drives a weighted mix of
+- POST /founder/profile
+- POST /funding/advice
+- GET  /investors/match
+- POST /api/market-size      (market analysis, Gemini)
+- POST /financial/narrative  (Groq)
+- POST /chat-multilingual
+at each --concurrency level for --duration seconds. The load is closed
+loop: each virtual user sends its next request when the last one returns.
+
+Per level it reports throughput, error rate and p50/p95/p99/max latency,
+overall and per endpoint, plus two event-loop blocking signals:
+- health probe: GET /health every 50ms on its own connection. The handler
+  does no work, so its latency is mostly time queued behind a busy loop
+- loop lag: every worker runs a task that sleeps 10ms and records how late
+  it wakes up (blocked ms, p99 / max lag), read back from /__loadtest/loop
+A blocking `requests` call in an async route shows up in both as the
+concurrency goes up.
+
+Client, server and fake LLM share the machine, so compare runs made on the
+same host only.
+
+Usage (from startup-rag/backend):
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --concurrency 1,8,32,128 --duration 20 --workers 2
+    python benchmarks/load_test.py --llm-latency 0.8 --error-rate 0.05 --json load.json
+    python benchmarks/load_test.py --mix advice=3,chat=1
+    python benchmarks/load_test.py --url http://127.0.0.1:8000   # server already running
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOOP_PROBE_PATH = "/__loadtest/loop"
+LOOP_PROBE_INTERVAL = 0.01  # seconds between loop-lag samples
+LOOP_BLOCK_THRESHOLD = 0.002  # lag below this is scheduler noise, not blocking
+HEALTH_PROBE_INTERVAL = 0.05
+
+DEFAULT_MIX = {"profile": 10, "advice": 25, "investors": 20, "market": 15, "narrative": 15, "chat": 15}
+
+STAGES = ["idea", "mvp", "early_traction", "growth"]
+SECTORS = ["fintech", "saas", "healthtech", "edtech", "agritech", "d2c", "climate"]
+GOALS = ["grant", "angel", "vc"]
+LOCATIONS = ["Bangalore", "Mumbai", "Pune", "Delhi NCR", "Hyderabad", "Indore", "Kochi"]
+LANGUAGES = ["english", "english", "english", "hindi", "tamil"]
+
+ADVICE_QUESTIONS = [
+    "What funding should I raise next?",
+    "Am I ready for angel investment?",
+    "Which government grants can I apply for?",
+    "How much equity should I give up in a seed round?",
+    "What do VCs look for at my stage?",
+    "How do I get DPIIT recognition?",
+    "Should I apply to an accelerator first?",
+    "How long will it take to close a seed round?",
+]
+
+CHAT_MESSAGES = [
+    "How do I register my startup with Startup India?",
+    "What is the Startup India Seed Fund Scheme?",
+    "मेरे स्टार्टअप के लिए सरकारी अनुदान कैसे मिलेगा?",
+    "ஸ்டார்ட்அப் நிதி பெறுவது எப்படி?",
+    "Which angel networks invest in fintech in Bangalore?",
+    "আমার স্টার্টআপের জন্য কোন সরকারি প্রকল্প আছে?",
+]
+
+
+# -----------------------------------------
+# Server side: loop-lag probe (runs inside each uvicorn worker)
+# -----------------------------------------
+class _LoopLagProbe:
+    def __init__(self):
+        self.lags = []
+        self.started = time.perf_counter()
+        self._task = None
+
+    async def _run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(LOOP_PROBE_INTERVAL)
+            self.lags.append(time.perf_counter() - start - LOOP_PROBE_INTERVAL)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+
+    def read(self, reset: bool = False) -> dict:
+        lags, window = self.lags, time.perf_counter() - self.started
+        blocked = sum(lag for lag in lags if lag >= LOOP_BLOCK_THRESHOLD)
+        result = {
+            "pid": os.getpid(),
+            "window_s": round(window, 3),
+            "samples": len(lags),
+            "blocked_ms": round(blocked * 1000, 1),
+            "p99_lag_ms": round(percentile(lags, 0.99) * 1000, 2),
+            "max_lag_ms": round(max(lags, default=0.0) * 1000, 2),
+        }
+        if reset:
+            self.lags, self.started = [], time.perf_counter()
+        return result
+
+
+def instrumented_app():
+    """uvicorn --factory target: app.main:app plus the loop-lag probe route"""
+    from contextlib import asynccontextmanager
+    from app.main import app
+
+    probe = _LoopLagProbe()
+    inner_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(application):
+        probe.start()
+        async with inner_lifespan(application) as state:
+            yield state
+        probe.stop()
+
+    app.router.lifespan_context = lifespan
+
+    @app.get(LOOP_PROBE_PATH, include_in_schema=False)
+    async def loop_probe(reset: bool = False):
+        return probe.read(reset)
+
+    return app
+
+
+# -----------------------------------------
+# Helpers
+# -----------------------------------------
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def latency_summary(latencies) -> dict:
+    return {
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+        "max_ms": round(max(latencies, default=0.0) * 1000, 1),
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR,
+            capture_output=True, text=True, timeout=10,
+        ).stdout.strip() or "unknown"
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+
+def parse_mix(text: str) -> dict:
+    if not text:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise SystemExit(f"Unknown endpoint {name!r} in --mix (use {', '.join(DEFAULT_MIX)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+# -----------------------------------------
+# Requests
+# -----------------------------------------
+def founder_id(index: int) -> str:
+    return f"loadtest-{index:05d}"
+
+
+def make_profile(rng: random.Random) -> dict:
+    return {
+        "startup_stage": rng.choice(STAGES),
+        "sector": rng.choice(SECTORS),
+        "location": rng.choice(LOCATIONS),
+        "funding_goal": rng.choice(GOALS),
+        "preferred_language": rng.choice(LANGUAGES),
+    }
+
+
+def make_request(name: str, rng: random.Random):
+    """(method, path, json body or None) for one call to endpoint name"""
+    if name == "profile":
+        return "POST", "/founder/profile", make_profile(rng)
+    if name == "advice":
+        return "POST", "/funding/advice", {"question": rng.choice(ADVICE_QUESTIONS)}
+    if name == "investors":
+        return "GET", "/investors/match", None
+    if name == "market":
+        return "POST", "/api/market-size", {
+            "query": f"Market size for {rng.choice(SECTORS)} startups in {rng.choice(LOCATIONS)}",
+            "language": "en",
+        }
+    if name == "narrative":
+        burn = rng.randint(2, 40) * 50_000
+        return "POST", "/financial/narrative", {
+            "monthly_burn_rate": burn,
+            "runway_months": rng.randint(3, 24),
+            "monthly_revenue": burn * rng.random(),
+            "customer_acquisition_cost": rng.randint(500, 5000),
+            "lifetime_value": rng.randint(2000, 40000),
+        }
+    return "POST", "/chat-multilingual", {"message": rng.choice(CHAT_MESSAGES)}
+
+
+# -----------------------------------------
+# Processes under test
+# -----------------------------------------
+class Servers:
+    """Fake LLM + uvicorn subprocesses; logs go to a temp dir"""
+
+    def __init__(self, args):
+        self.args = args
+        self.workdir = tempfile.mkdtemp(prefix="load_test_")
+        self.processes = []
+
+    def _spawn(self, name: str, command: list, env: dict):
+        log = open(os.path.join(self.workdir, f"{name}.log"), "w", encoding="utf-8")
+        process = subprocess.Popen(command, cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+        self.processes.append((name, process, log))
+        return process
+
+    def start(self) -> str:
+        args = self.args
+        llm_port, app_port = free_port(), free_port()
+        env = dict(os.environ, PYTHONUNBUFFERED="1")
+
+        self._spawn("fake_llm", [
+            sys.executable, os.path.join("benchmarks", "fake_llm.py"), "--port", str(llm_port),
+            "--latency", str(args.llm_latency), "--jitter", str(args.llm_jitter),
+            "--error-rate", str(args.error_rate), "--seed", str(args.seed),
+        ], env)
+
+        env.update({
+            "GROQ_API_KEY": "loadtest", "GEMINI_API_KEY": "loadtest",
+            "GROQ_API_BASE": f"http://127.0.0.1:{llm_port}/openai/v1",
+            "GEMINI_API_BASE": f"http://127.0.0.1:{llm_port}/v1beta",
+            "PROFILE_STORE": args.profile_store,
+            "PROFILE_DB_PATH": os.path.join(self.workdir, "profiles.sqlite3"),
+            "RAG_WARMUP": env.get("RAG_WARMUP", "false"),
+        })
+        self._spawn("uvicorn", [
+            sys.executable, "-m", "uvicorn", "benchmarks.load_test:instrumented_app", "--factory",
+            "--host", "127.0.0.1", "--port", str(app_port), "--workers", str(args.workers),
+            "--log-level", "warning", "--no-access-log",
+        ], env)
+        return f"http://127.0.0.1:{app_port}"
+
+    def check(self):
+        for name, process, _ in self.processes:
+            if process.poll() is not None:
+                raise SystemExit(f"❌ {name} exited with code {process.returncode} (log: {self.workdir}/{name}.log)")
+
+    def stop(self):
+        for _, process, log in reversed(self.processes):
+            process.terminate()
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+            log.close()
+
+
+async def wait_ready(client, servers, timeout: float = 90.0):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if servers is not None:
+            servers.check()
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except Exception:
+            pass
+        await asyncio.sleep(0.25)
+    raise SystemExit("❌ Backend did not become healthy in time")
+
+
+async def read_loop_probes(client, workers: int, reset: bool):
+    """One loop-probe reading per worker (requests land on random workers)"""
+    readings = {}
+    for _ in range(workers * 10):
+        try:
+            response = await client.get(LOOP_PROBE_PATH, params={"reset": reset})
+        except Exception:
+            break
+        if response.status_code != 200:
+            return None  # external server without the probe
+        reading = response.json()
+        readings.setdefault(reading["pid"], reading)
+        if len(readings) >= workers:
+            break
+    return list(readings.values())
+
+
+# -----------------------------------------
+# Load generation
+# -----------------------------------------
+async def setup_founders(client, founders: int, seed: int):
+    rng = random.Random(seed)
+    semaphore = asyncio.Semaphore(16)
+
+    async def register(i):
+        async with semaphore:
+            response = await client.post("/founder/profile", json=make_profile(rng), headers={"X-Founder-ID": founder_id(i)})
+            response.raise_for_status()
+
+    await asyncio.gather(*(register(i) for i in range(founders)))
+
+
+async def warm_up(client, seed: int):
+    """Hit every endpoint once so lazy imports / RAG init stay out of level 1"""
+    rng = random.Random(seed)
+    for name in DEFAULT_MIX:
+        method, path, body = make_request(name, rng)
+        await client.request(method, path, json=body, headers={"X-Founder-ID": founder_id(0)})
+
+
+async def virtual_user(client, mix: dict, founders: int, deadline: float, rng: random.Random, samples: list):
+    names, weights = list(mix), list(mix.values())
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        method, path, body = make_request(name, rng)
+        headers = {"X-Founder-ID": founder_id(rng.randrange(founders))}
+        start = time.perf_counter()
+        try:
+            status = (await client.request(method, path, json=body, headers=headers)).status_code
+        except Exception:
+            status = 0  # timeout / connection error
+        samples.append((name, time.perf_counter() - start, status))
+
+
+async def health_probe(client, deadline: float, latencies: list):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            await client.get("/health")
+            latencies.append(time.perf_counter() - start)
+        except Exception:
+            pass
+        await asyncio.sleep(HEALTH_PROBE_INTERVAL)
+
+
+async def run_level(client, probe_client, args, mix: dict, concurrency: int) -> dict:
+    await read_loop_probes(probe_client, args.workers, reset=True)
+    samples, health = [], []
+    started = time.perf_counter()
+    deadline = started + args.duration
+    await asyncio.gather(
+        health_probe(probe_client, deadline, health),
+        *(virtual_user(client, mix, args.founders, deadline, random.Random(args.seed * 1000 + i), samples)
+          for i in range(concurrency)),
+    )
+    elapsed = time.perf_counter() - started
+    loop = await read_loop_probes(probe_client, args.workers, reset=False)
+
+    ok = [latency for _, latency, status in samples if 200 <= status < 400]
+    level = {
+        "concurrency": concurrency,
+        "requests": len(samples),
+        "requests_per_s": round(len(samples) / elapsed, 1),
+        "error_rate": round(1 - len(ok) / len(samples), 4) if samples else 0.0,
+        **latency_summary([latency for _, latency, _ in samples]),
+        "health": latency_summary(health),
+        "endpoints": {},
+    }
+    for name in mix:
+        rows = [(latency, status) for n, latency, status in samples if n == name]
+        errors = sum(1 for _, status in rows if not 200 <= status < 400)
+        level["endpoints"][name] = {
+            "requests": len(rows),
+            "errors": errors,
+            **latency_summary([latency for latency, _ in rows]),
+        }
+    if loop:
+        window = sum(r["window_s"] for r in loop)
+        blocked = sum(r["blocked_ms"] for r in loop)
+        level["loop"] = {
+            "workers_seen": len(loop),
+            "blocked_ms": round(blocked, 1),
+            "blocked_share": round(blocked / 1000 / window, 4) if window else 0.0,
+            "p99_lag_ms": max(r["p99_lag_ms"] for r in loop),
+            "max_lag_ms": max(r["max_lag_ms"] for r in loop),
+        }
+    return level
+
+
+def print_level(level: dict):
+    loop = level.get("loop")
+    loop_text = f"{loop['blocked_ms']:>10.0f}{loop['blocked_share']:>9.1%}{loop['max_lag_ms']:>9.1f}" if loop else f"{'-':>10}{'-':>9}{'-':>9}"
+    print(
+        f"{level['concurrency']:>5}{level['requests_per_s']:>9.1f}{level['error_rate']:>7.1%}"
+        f"{level['p50_ms']:>8.0f}{level['p95_ms']:>8.0f}{level['p99_ms']:>8.0f}{level['max_ms']:>8.0f}"
+        f"{level['health']['p99_ms']:>10.1f}{loop_text}"
+    )
+    for name, e in level["endpoints"].items():
+        print(f"{'':>5}  {name:<10}{e['requests']:>6} req {e['errors']:>4} err  "
+              f"p50 {e['p50_ms']:>6.0f}  p95 {e['p95_ms']:>6.0f}  p99 {e['p99_ms']:>6.0f} ms")
+
+
+async def run(args, base_url: str, servers) -> list:
+    import httpx
+
+    mix = parse_mix(args.mix)
+    levels = [int(c) for c in args.concurrency.split(",")]
+    limits = httpx.Limits(max_connections=max(levels) + 8, max_keepalive_connections=max(levels) + 8)
+    timeout = httpx.Timeout(args.timeout)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client, \
+            httpx.AsyncClient(base_url=base_url, timeout=timeout) as probe_client:
+        await wait_ready(probe_client, servers)
+        await setup_founders(client, args.founders, args.seed)
+        await warm_up(client, args.seed)
+
+        results = []
+        print(f"\n{'conc':>5}{'req/s':>9}{'err':>7}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}"
+              f"{'health99':>10}{'blocked':>10}{'share':>9}{'maxlag':>9}   (ms)")
+        for concurrency in levels:
+            if servers is not None:
+                servers.check()
+            level = await run_level(client, probe_client, args, mix, concurrency)
+            print_level(level)
+            results.append(level)
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the backend against fake Groq/Gemini")
+    parser.add_argument("--concurrency", default="1,4,16,64", help="comma-separated virtual user counts (default 1,4,16,64)")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per concurrency level (default 10)")
+    parser.add_argument("--mix", help=f"endpoint weights, e.g. advice=3,chat=1 (default {','.join(f'{k}={v}' for k, v in DEFAULT_MIX.items())})")
+    parser.add_argument("--founders", type=int, default=200, help="synthetic founders with a saved profile (default 200)")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes (default 1)")
+    parser.add_argument("--profile-store", default="sqlite", choices=["sqlite", "memory"],
+                        help="PROFILE_STORE for the server (memory only works with --workers 1)")
+    parser.add_argument("--llm-latency", type=float, default=0.3, help="fake LLM seconds per call (default 0.3)")
+    parser.add_argument("--llm-jitter", type=float, default=0.1, help="+/- seconds around --llm-latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of LLM calls failing with 429/500")
+    parser.add_argument("--timeout", type=float, default=60.0, help="client timeout per request (default 60)")
+    parser.add_argument("--url", help="load test an already running server instead (no fake LLM started)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    servers = None
+    if args.url:
+        base_url = args.url.rstrip("/")
+    else:
+        servers = Servers(args)
+        base_url = servers.start()
+
+    print(f"Load test {base_url}: {args.workers} worker(s), {args.founders} founders, "
+          f"{args.duration:g}s per level, fake LLM {args.llm_latency:g}s ±{args.llm_jitter:g}s, "
+          f"{args.error_rate:.0%} LLM errors")
+    try:
+        results = asyncio.run(run(args, base_url, servers))
+    finally:
+        if servers is not None:
+            servers.stop()
+            print(f"\nServer logs: {servers.workdir}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "suite": "load_test",
+                "commit": git_commit(),
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "config": {k: v for k, v in vars(args).items() if k != "json"},
+                "levels": results,
+            }, f, indent=2)
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Startup profile for the FastAPI backend
+
+Runs `python -X importtime -c "import app.main"` in a fresh interpreter and
+summarises where cold-start time goes:
+- total wall time to import the app
+- slowest top-level packages (cumulative, self time of their submodules)
+- slowest individual modules
+
+Usage (from startup-rag/backend):
+    python profile_startup.py
+    python profile_startup.py --top 30 --module app.main --json report.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+
+def run_importtime(module: str):
+    """Import `module` in a fresh interpreter; return (wall_seconds, rows)"""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr[-2000:]}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        # "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            rows.append({
+                "module": name.strip(),
+                "depth": (len(name) - len(name.lstrip())) // 2,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+            })
+        except ValueError:
+            continue
+    return wall, rows
+
+
+def summarise(wall: float, rows, top: int):
+    by_package = defaultdict(float)
+    for row in rows:
+        by_package[row["module"].split(".")[0]] += row["self_ms"]
+
+    return {
+        "wall_ms": round(wall * 1000, 1),
+        "import_ms": round(sum(r["self_ms"] for r in rows), 1),
+        "modules_imported": len(rows),
+        "packages": [
+            {"package": name, "self_ms": round(ms, 1)}
+            for name, ms in sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)[:top]
+        ],
+        "modules": sorted(rows, key=lambda r: r["self_ms"], reverse=True)[:top],
+    }
+
+
+def print_report(module: str, report):
+    print("\n" + "=" * 60)
+    print(f"STARTUP PROFILE: import {module}")
+    print("=" * 60)
+    print(f"Wall time (incl. interpreter): {report['wall_ms']:.0f} ms")
+    print(f"Import time:                   {report['import_ms']:.0f} ms")
+    print(f"Modules imported:              {report['modules_imported']}")
+
+    print("\nSlowest packages (sum of module self time):")
+    for row in report["packages"]:
+        print(f"  {row['self_ms']:8.1f} ms  {row['package']}")
+
+    print("\nSlowest modules (self time):")
+    for row in report["modules"]:
+        print(f"  {row['self_ms']:8.1f} ms  {row['module']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile backend import/startup time")
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", dest="json_path", help="also write the report to this file")
+    args = parser.parse_args()
+
+    wall, rows = run_importtime(args.module)
+    report = summarise(wall, rows, args.top)
+    print_report(args.module, report)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📄 Report written to {args.json_path}")
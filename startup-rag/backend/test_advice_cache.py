@@ -0,0 +1,79 @@
+"""
+Paraphrase matching test for the advice answer cache
+
+Near-miss questions (different question word, negation, a short query
+with one extra word) must not be served an answer cached for another
+question over the same context; genuine rewordings still hit.
+
+Needs Data Ingestion next to startup-rag (rag/answer_cache.py).
+
+Run from startup-rag/backend:
+    python test_advice_cache.py
+    python -m pytest test_advice_cache.py
+"""
+
+import sys
+
+import pytest
+
+from app.answer_cache import AnswerCache, context_fingerprint
+
+if AnswerCache is None:
+    pytest.skip("Data Ingestion (rag.answer_cache) not deployed", allow_module_level=True)
+
+FP = context_fingerprint(["Startup India Seed Fund Scheme ...", "{}"])
+
+CACHED = "How do I apply for the Startup India Seed Fund?"
+
+HITS = [
+    "how do i apply for the startup india seed fund",
+    "How can I apply for the Startup India Seed Fund scheme?",
+]
+
+NEAR_MISSES = [
+    "Who can apply for the Startup India Seed Fund?",
+    "When can I apply for the Startup India Seed Fund?",
+    "Why apply for the Startup India Seed Fund?",
+    "How do I not apply for the Startup India Seed Fund?",
+]
+
+
+def _cache(question=CACHED):
+    cache = AnswerCache()
+    cache.put(question, "english", FP, {"answer": question})
+    return cache
+
+
+def test_rewordings_hit():
+    cache = _cache()
+    for question in HITS:
+        assert cache.get(question, "english", FP) == {"answer": CACHED}, question
+
+
+def test_question_word_and_negation_must_match():
+    cache = _cache()
+    for question in NEAR_MISSES:
+        assert cache.get(question, "english", FP) is None, question
+
+
+def test_negated_eligibility_misses():
+    cache = _cache("Is my startup eligible for the Seed Fund?")
+    assert cache.get("Is my startup not eligible for the Seed Fund?", "english", FP) is None
+    assert cache.get("Isn't my startup eligible for the Seed Fund?", "english", FP) is None
+
+
+def test_short_query_needs_near_exact_match():
+    # 3 of 4 content words shared is 0.87 - above the default threshold
+    cache = _cache("seed fund grant amount")
+    assert cache.get("seed fund grant", "english", FP) is None
+    assert cache.get("Seed fund: grant amount?", "english", FP) == {"answer": "seed fund grant amount"}
+
+
+def test_context_and_language_are_separate():
+    cache = _cache()
+    assert cache.get(CACHED, "hindi", FP) is None
+    assert cache.get(CACHED, "english", context_fingerprint(["other context"])) is None
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))